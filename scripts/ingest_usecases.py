@@ -567,7 +567,7 @@ def ingest(
     if not dry_run:
         print("Testing Ollama connection...")
         try:
-            test_emb = get_embeddings_batch(["test"], strict=True)
+            test_emb = get_embeddings_batch(["test"], strict=True, use_cache=False)
             emb_dim = len(test_emb[0]) if test_emb[0] is not None else 0
             print(f"  ✓ Ollama ready (embedding dim: {emb_dim})")
         except Exception as e:
@@ -361,6 +361,17 @@ def get_audit_logger() -> AuditLogger | None:
         return _audit_logger
 
 
+def is_audit_enabled() -> bool:
+    """Check whether tool invocations are being written to an audit log.
+
+    Lets callers skip building audit payloads when nothing would be logged.
+
+    Returns:
+        True if the global audit logger is configured
+    """
+    return get_audit_logger() is not None
+
+
 def reset_audit_logger() -> None:
     """Reset the audit logger singleton.
 
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING
 from strands import Agent
 from strands.agent.conversation_manager import SlidingWindowConversationManager
 
+from agentic_cba_indicators import tools as cba_tools
 from agentic_cba_indicators.config import (
     AgentConfig,
     ProviderConfig,
@@ -40,7 +41,6 @@ from agentic_cba_indicators.security import (
     detect_injection_patterns,
     sanitize_user_input,
 )
-from agentic_cba_indicators.tools import FULL_TOOLS, REDUCED_TOOLS
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
@@ -92,7 +92,11 @@ def create_agent_from_config(
     model = create_model(provider_config)
 
     # Select tool set (includes internal help tools)
-    tools = FULL_TOOLS if agent_config.tool_set == "full" else REDUCED_TOOLS
+    tools = (
+        cba_tools.FULL_TOOLS
+        if agent_config.tool_set == "full"
+        else cba_tools.REDUCED_TOOLS
+    )
     if not agent_config.parallel_tool_calls:
         tools = tuple(
             t for t in tools if getattr(t, "__name__", "") != "run_tools_parallel"
@@ -154,7 +158,9 @@ def create_agent(
 
     # Default token budget for legacy interface (conservative)
     system_prompt = get_system_prompt()
-    system_prompt_budget = _estimate_system_prompt_budget(system_prompt, REDUCED_TOOLS)
+    system_prompt_budget = _estimate_system_prompt_budget(
+        system_prompt, cba_tools.REDUCED_TOOLS
+    )
     conversation_manager = TokenBudgetConversationManager(
         max_tokens=8000,
         system_prompt_budget=system_prompt_budget,
@@ -164,7 +170,7 @@ def create_agent(
         model=ollama_model,
         system_prompt=system_prompt,
         conversation_manager=conversation_manager,
-        tools=list(REDUCED_TOOLS),
+        tools=list(cba_tools.REDUCED_TOOLS),
     )
 
     return agent
@@ -292,7 +298,9 @@ def main() -> None:
             provider_override=provider_override,
         )
         tool_count = (
-            len(FULL_TOOLS) if agent_config.tool_set == "full" else len(REDUCED_TOOLS)
+            len(cba_tools.FULL_TOOL_NAMES)
+            if agent_config.tool_set == "full"
+            else len(cba_tools.REDUCED_TOOL_NAMES)
         )
 
         print_banner(tool_count=tool_count, provider_config=provider_config)
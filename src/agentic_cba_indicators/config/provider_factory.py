@@ -7,18 +7,32 @@ provider (Ollama, Anthropic, OpenAI, Bedrock, or Gemini).
 
 from __future__ import annotations
 
+import contextlib
+import copy
 import importlib.resources
+import json
 import logging
 import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
 
 import yaml
 
 from agentic_cba_indicators.paths import get_user_config_path
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml;
+# the pure-Python SafeLoader is considerably slower on the same input.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +68,16 @@ ALLOWED_ENV_VARS = frozenset(
     }
 )
 
+# Pre-rendered whitelist for the non-whitelisted variable warning
+_ALLOWED_ENV_VARS_STR: Final[str] = ", ".join(sorted(ALLOWED_ENV_VARS))
+
+# Config keys whose subtrees are passed through to provider SDKs verbatim
+# (numeric model options such as num_ctx) and are never env-expanded
+_NO_EXPAND_KEYS: Final[frozenset[str]] = frozenset({"options"})
+
+# Matches ${VAR_NAME} references in config string values
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
 
 @dataclass
 class ProviderConfig:
@@ -84,37 +108,84 @@ class AgentConfig:
     parallel_tool_calls: bool = False  # Enable parallel tool execution helper
 
 
+def _expand_env_string(value: str) -> str:
+    """Expand ${VAR_NAME} references in a single string in one re.sub pass.
+
+    Whitelisted names resolve from the environment; anything else expands to
+    an empty string and is reported in a single warning after substitution.
+    """
+    blocked: list[str] = []
+
+    def _replace(
+        match: re.Match[str],
+        _allowed: frozenset[str] = ALLOWED_ENV_VARS,
+        _environ: Mapping[str, str] = os.environ,
+    ) -> str:
+        var_name = match.group(1)
+        if var_name in _allowed:
+            return _environ.get(var_name, "")
+        # Replace with empty string for security
+        blocked.append(var_name)
+        return ""
+
+    expanded = _ENV_VAR_PATTERN.sub(_replace, value)
+    if blocked:
+        logger.warning(
+            "Attempted to expand non-whitelisted environment variable(s) %s. "
+            "Only these variables are allowed: %s",
+            ", ".join(f"'{name}'" for name in blocked),
+            _ALLOWED_ENV_VARS_STR,
+        )
+    return expanded
+
+
 def _expand_env_vars(value: Any) -> Any:
     """Recursively expand ${ENV_VAR} patterns in config values.
 
     Only variables in ALLOWED_ENV_VARS whitelist will be expanded.
     Attempts to expand non-whitelisted variables log a warning and expand to empty string.
+
+    Subtrees under keys in _NO_EXPAND_KEYS (provider ``options``) are returned
+    unchanged without being walked.
+
+    Uses exact type checks: parsed YAML/JSON only produces plain str, dict and
+    list containers, so subclass-aware isinstance() checks are unnecessary.
     """
-    if isinstance(value, str):
-        # Match ${VAR_NAME} pattern
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, value)
-        for var_name in matches:
-            if var_name not in ALLOWED_ENV_VARS:
-                logger.warning(
-                    "Attempted to expand non-whitelisted environment variable '%s'. "
-                    "Only these variables are allowed: %s",
-                    var_name,
-                    ", ".join(sorted(ALLOWED_ENV_VARS)),
-                )
-                # Replace with empty string for security
-                value = value.replace(f"${{{var_name}}}", "")
-            else:
-                env_value = os.environ.get(var_name, "")
-                value = value.replace(f"${{{var_name}}}", env_value)
-        return value
-    elif isinstance(value, dict):
-        return {k: _expand_env_vars(v) for k, v in value.items()}
-    elif isinstance(value, list):
+    value_type = type(value)
+    if value_type is str:
+        # Most config strings contain no ${...} references at all
+        if "$" not in value:
+            return value
+        return _expand_env_string(value)
+    if value_type is dict:
+        return {
+            k: v if k in _NO_EXPAND_KEYS else _expand_env_vars(v)
+            for k, v in value.items()
+        }
+    if value_type is list:
         return [_expand_env_vars(item) for item in value]
     return value
 
 
+@lru_cache(maxsize=1)
+def _load_bundled_config() -> tuple[dict[str, Any], bool]:
+    """Read and parse the bundled providers.yaml once per process.
+
+    The packaged file cannot change while the process runs, so the parsed
+    result is cached. Environment variable expansion is left to the caller.
+
+    Returns:
+        Tuple of (parsed config mapping, whether the source contains '$')
+    """
+    files = importlib.resources.files("agentic_cba_indicators.config")
+    # Read directly from package resources
+    content = (files / "providers.yaml").read_text(encoding="utf-8")
+    config = yaml.load(content, Loader=_SafeLoader)
+    if not isinstance(config, dict):
+        raise ValueError("Bundled config is empty or invalid")
+    return config, "$" in content
+
+
 def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
     """
     Load provider configuration from YAML file.
@@ -142,14 +213,13 @@ def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
         else:
             # Fall back to bundled config
             try:
-                files = importlib.resources.files("agentic_cba_indicators.config")
-                bundled = files / "providers.yaml"
-                # Read directly from package resources
-                content = bundled.read_text(encoding="utf-8")
-                config = yaml.safe_load(content)
-                if not isinstance(config, dict):
-                    raise ValueError("Bundled config is empty or invalid")
-                config = _expand_env_vars(config)
+                raw_config, has_env_refs = _load_bundled_config()
+                # Only walk the tree when the source has ${...} references;
+                # otherwise copy so callers cannot mutate the cached parse
+                if has_env_refs:
+                    config = _expand_env_vars(raw_config)
+                else:
+                    config = copy.deepcopy(raw_config)
                 _validate_config(config)
                 return config
             except Exception as e:
@@ -157,18 +227,93 @@ def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
                     f"No config file found. Create one at: {user_config}"
                 ) from e
 
-    with Path(config_path).open(encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config_path = Path(config_path)
+    cached = _read_config_cache(config_path)
 
-    if not isinstance(config, dict):
-        raise ValueError("Config file is empty or invalid YAML")
+    if cached is not None:
+        raw_config, has_env_refs = cached
+    else:
+        content = config_path.read_text(encoding="utf-8")
+        raw_config = yaml.load(content, Loader=_SafeLoader)
+
+        if not isinstance(raw_config, dict):
+            raise ValueError("Config file is empty or invalid YAML")
+        has_env_refs = "$" in content
 
-    # Expand environment variables
-    config = _expand_env_vars(config)
+    # Expand environment variables (skipped when the source has no ${...})
+    config = _expand_env_vars(raw_config) if has_env_refs else raw_config
     _validate_config(config)
+
+    if cached is None:
+        _write_config_cache(config_path, raw_config, has_env_refs)
     return config
 
 
+def _config_cache_path(config_path: Path) -> Path:
+    """Return the JSON sidecar cache path for a YAML config file."""
+    return config_path.with_suffix(config_path.suffix + ".cache.json")
+
+
+def _read_config_cache(config_path: Path) -> tuple[dict[str, Any], bool] | None:
+    """Load the parsed (pre-expansion) config from its JSON sidecar cache.
+
+    The cache is only used when it was written for the current version of the
+    YAML file (matching mtime and size). Any problem reading it results in a
+    cache miss rather than an error.
+
+    Returns:
+        Tuple of (parsed config mapping, whether the source contains '$'),
+        or None on cache miss
+    """
+    cache_path = _config_cache_path(config_path)
+    try:
+        stat = config_path.stat()
+        with cache_path.open(encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("source_mtime_ns") != stat.st_mtime_ns
+        or payload.get("source_size") != stat.st_size
+        or not isinstance(payload.get("config"), dict)
+    ):
+        return None
+    return payload["config"], bool(payload.get("has_env_refs", True))
+
+
+def _write_config_cache(
+    config_path: Path, raw_config: dict[str, Any], has_env_refs: bool
+) -> None:
+    """Write the parsed config to a JSON sidecar cache next to the YAML file.
+
+    Stores the config *before* environment variable expansion so that secrets
+    resolved from the environment are never persisted to disk. Configs that do
+    not survive a JSON round-trip unchanged (e.g. YAML dates or non-string
+    keys) are not cached. Failures are logged at debug level and ignored.
+    """
+    cache_path = _config_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        serialized = json.dumps(raw_config, ensure_ascii=False)
+        if json.loads(serialized) != raw_config:
+            return
+        stat = config_path.stat()
+        payload = {
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "has_env_refs": has_env_refs,
+            "config": raw_config,
+        }
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
 def _validate_config(config: dict[str, Any]) -> None:
     """Validate configuration schema for required fields and types."""
     if not isinstance(config, dict):
@@ -297,6 +442,144 @@ def _sanitize_model_error(error: Exception, provider_name: str) -> str:
     return f"{provider_name} model creation failed: {msg}"
 
 
+def _build_ollama(provider_config: ProviderConfig) -> Any:
+    """Create an Ollama (local) model."""
+    from strands.models.ollama import OllamaModel
+
+    return OllamaModel(
+        host=provider_config.host or "http://localhost:11434",
+        model_id=provider_config.model_id,
+        temperature=provider_config.temperature,
+        options=provider_config.options,
+    )
+
+
+def _build_anthropic(provider_config: ProviderConfig) -> Any:
+    """Create an Anthropic (Claude) model."""
+    try:
+        from strands.models.anthropic import AnthropicModel
+    except ImportError:
+        raise ImportError(
+            "Anthropic provider not installed. Run: uv add 'strands-agents[anthropic]'"
+        ) from None
+
+    if not provider_config.api_key:
+        raise ValueError(
+            "Anthropic API key required. Set ANTHROPIC_API_KEY environment variable "
+            "or configure api_key in providers.yaml"
+        )
+
+    try:
+        return AnthropicModel(
+            client_args={"api_key": provider_config.api_key},
+            model_id=provider_config.model_id,
+            max_tokens=provider_config.max_tokens or 4096,
+            params={"temperature": provider_config.temperature},
+        )
+    except Exception as e:
+        raise ProviderCreationError(_sanitize_model_error(e, "anthropic")) from None
+
+
+def _build_openai(provider_config: ProviderConfig) -> Any:
+    """Create an OpenAI (GPT) model."""
+    try:
+        from strands.models.openai import OpenAIModel
+    except ImportError:
+        raise ImportError(
+            "OpenAI provider not installed. Run: uv add 'strands-agents[openai]'"
+        ) from None
+
+    if not provider_config.api_key:
+        raise ValueError(
+            "OpenAI API key required. Set OPENAI_API_KEY environment variable "
+            "or configure api_key in providers.yaml"
+        )
+
+    client_args: dict[str, Any] = {"api_key": provider_config.api_key}
+    if provider_config.base_url:
+        client_args["base_url"] = provider_config.base_url
+
+    try:
+        return OpenAIModel(
+            client_args=client_args,
+            model_id=provider_config.model_id,
+            params={
+                "max_tokens": provider_config.max_tokens or 4096,
+                "temperature": provider_config.temperature,
+            },
+        )
+    except Exception as e:
+        raise ProviderCreationError(_sanitize_model_error(e, "openai")) from None
+
+
+def _build_bedrock(provider_config: ProviderConfig) -> Any:
+    """Create an AWS Bedrock model."""
+    try:
+        from strands.models import BedrockModel
+    except ImportError:
+        raise ImportError(
+            "Bedrock provider not installed. Run: uv add 'strands-agents[bedrock]'"
+        ) from None
+
+    kwargs: dict[str, Any] = {
+        "model_id": provider_config.model_id,
+        "temperature": provider_config.temperature,
+    }
+
+    if provider_config.region_name:
+        kwargs["region_name"] = provider_config.region_name
+
+    if provider_config.max_tokens:
+        kwargs["max_tokens"] = provider_config.max_tokens
+
+    try:
+        return BedrockModel(**kwargs)
+    except Exception as e:
+        raise ProviderCreationError(_sanitize_model_error(e, "bedrock")) from None
+
+
+def _build_gemini(provider_config: ProviderConfig) -> Any:
+    """Create a Google Gemini model."""
+    try:
+        from strands.models.gemini import GeminiModel
+    except ImportError:
+        raise ImportError(
+            "Gemini provider not installed. Run: uv add 'strands-agents[gemini]'"
+        ) from None
+
+    if not provider_config.api_key:
+        raise ValueError(
+            "Google API key required. Set GOOGLE_API_KEY environment variable "
+            "or configure api_key in providers.yaml"
+        )
+
+    params: dict[str, Any] = {"temperature": provider_config.temperature}
+    if provider_config.max_tokens:
+        params["max_output_tokens"] = provider_config.max_tokens
+    if provider_config.top_p is not None:
+        params["top_p"] = provider_config.top_p
+
+    try:
+        return GeminiModel(
+            client_args={"api_key": provider_config.api_key},
+            model_id=provider_config.model_id,
+            params=params,
+        )
+    except Exception as e:
+        raise ProviderCreationError(_sanitize_model_error(e, "gemini")) from None
+
+
+# Provider name -> model builder. Each builder imports its SDK lazily so only
+# the active provider's dependencies are loaded.
+_MODEL_BUILDERS: Final[dict[str, Callable[[ProviderConfig], Any]]] = {
+    "ollama": _build_ollama,
+    "anthropic": _build_anthropic,
+    "openai": _build_openai,
+    "bedrock": _build_bedrock,
+    "gemini": _build_gemini,
+}
+
+
 def create_model(provider_config: ProviderConfig):
     """
     Create a Strands model instance based on provider configuration.
@@ -312,147 +595,26 @@ def create_model(provider_config: ProviderConfig):
         ValueError: If provider is not supported
     """
     name = provider_config.name
+    builder = _MODEL_BUILDERS.get(name)
+    if builder is None:
+        supported = list(_MODEL_BUILDERS)
+        raise ValueError(f"Unknown provider: {name}. Supported: {supported}")
+    return builder(provider_config)
 
-    # --- Ollama (Local) ---
-    if name == "ollama":
-        from strands.models.ollama import OllamaModel
 
-        return OllamaModel(
-            host=provider_config.host or "http://localhost:11434",
-            model_id=provider_config.model_id,
-            temperature=provider_config.temperature,
-            options=provider_config.options,
-        )
-
-    # --- Anthropic (Claude) ---
-    elif name == "anthropic":
-        try:
-            from strands.models.anthropic import AnthropicModel
-        except ImportError:
-            raise ImportError(
-                "Anthropic provider not installed. Run: uv add 'strands-agents[anthropic]'"
-            ) from None
-
-        if not provider_config.api_key:
-            raise ValueError(
-                "Anthropic API key required. Set ANTHROPIC_API_KEY environment variable "
-                "or configure api_key in providers.yaml"
-            )
-
-        try:
-            return AnthropicModel(
-                client_args={"api_key": provider_config.api_key},
-                model_id=provider_config.model_id,
-                max_tokens=provider_config.max_tokens or 4096,
-                params={"temperature": provider_config.temperature},
-            )
-        except Exception as e:
-            raise ProviderCreationError(_sanitize_model_error(e, "anthropic")) from None
-
-    # --- OpenAI (GPT) ---
-    elif name == "openai":
-        try:
-            from strands.models.openai import OpenAIModel
-        except ImportError:
-            raise ImportError(
-                "OpenAI provider not installed. Run: uv add 'strands-agents[openai]'"
-            ) from None
-
-        if not provider_config.api_key:
-            raise ValueError(
-                "OpenAI API key required. Set OPENAI_API_KEY environment variable "
-                "or configure api_key in providers.yaml"
-            )
-
-        client_args: dict[str, Any] = {"api_key": provider_config.api_key}
-        if provider_config.base_url:
-            client_args["base_url"] = provider_config.base_url
-
-        try:
-            return OpenAIModel(
-                client_args=client_args,
-                model_id=provider_config.model_id,
-                params={
-                    "max_tokens": provider_config.max_tokens or 4096,
-                    "temperature": provider_config.temperature,
-                },
-            )
-        except Exception as e:
-            raise ProviderCreationError(_sanitize_model_error(e, "openai")) from None
-
-    # --- AWS Bedrock ---
-    elif name == "bedrock":
-        try:
-            from strands.models import BedrockModel
-        except ImportError:
-            raise ImportError(
-                "Bedrock provider not installed. Run: uv add 'strands-agents[bedrock]'"
-            ) from None
-
-        kwargs: dict[str, Any] = {
-            "model_id": provider_config.model_id,
-            "temperature": provider_config.temperature,
-        }
-
-        if provider_config.region_name:
-            kwargs["region_name"] = provider_config.region_name
-
-        if provider_config.max_tokens:
-            kwargs["max_tokens"] = provider_config.max_tokens
-
-        try:
-            return BedrockModel(**kwargs)
-        except Exception as e:
-            raise ProviderCreationError(_sanitize_model_error(e, "bedrock")) from None
-
-    # --- Google Gemini ---
-    elif name == "gemini":
-        try:
-            from strands.models.gemini import GeminiModel
-        except ImportError:
-            raise ImportError(
-                "Gemini provider not installed. Run: uv add 'strands-agents[gemini]'"
-            ) from None
-
-        if not provider_config.api_key:
-            raise ValueError(
-                "Google API key required. Set GOOGLE_API_KEY environment variable "
-                "or configure api_key in providers.yaml"
-            )
-
-        params: dict[str, Any] = {"temperature": provider_config.temperature}
-        if provider_config.max_tokens:
-            params["max_output_tokens"] = provider_config.max_tokens
-        if provider_config.top_p is not None:
-            params["top_p"] = provider_config.top_p
-
-        try:
-            return GeminiModel(
-                client_args={"api_key": provider_config.api_key},
-                model_id=provider_config.model_id,
-                params=params,
-            )
-        except Exception as e:
-            raise ProviderCreationError(_sanitize_model_error(e, "gemini")) from None
-
-    # -------------------------------------------------------------------------
-    # Unknown Provider
-    # -------------------------------------------------------------------------
-    else:
-        supported = ["ollama", "anthropic", "openai", "bedrock", "gemini"]
-        raise ValueError(f"Unknown provider: {name}. Supported: {supported}")
+# Display icons for print_provider_info
+_PROVIDER_ICONS: Final[dict[str, str]] = {
+    "ollama": "🦙",
+    "anthropic": "🤖",
+    "openai": "💚",
+    "bedrock": "☁️",
+    "gemini": "💎",
+}
 
 
 def print_provider_info(provider_config: ProviderConfig) -> None:
     """Print information about the active provider."""
-    icons = {
-        "ollama": "🦙",
-        "anthropic": "🤖",
-        "openai": "💚",
-        "bedrock": "☁️",
-        "gemini": "💎",
-    }
-    icon = icons.get(provider_config.name, "🔌")
+    icon = _PROVIDER_ICONS.get(provider_config.name, "🔌")
     print(f"{icon} Provider: {provider_config.name}")
     print(f"   Model: {provider_config.model_id}")
     print(f"   Temperature: {provider_config.temperature}")
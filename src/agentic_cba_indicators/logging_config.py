@@ -41,6 +41,13 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from typing import TextIO
 
+# orjson is considerably faster than the stdlib encoder for log lines; it is
+# optional and the stdlib json module is used when it is not installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None  # type: ignore[assignment]
+
 # Default log level (can be overridden via environment variable)
 DEFAULT_LOG_LEVEL = os.environ.get("AGENTIC_CBA_LOG_LEVEL", "WARNING")
 
@@ -74,8 +81,12 @@ def get_correlation_id() -> str | None:
 class CorrelationIdFilter(logging.Filter):
     """Inject correlation_id into log records when present."""
 
+    # Bound ContextVar.get, avoiding the get_correlation_id() wrapper call on
+    # every record
+    _get_correlation_id = _correlation_id.get
+
     def filter(self, record: logging.LogRecord) -> bool:
-        correlation_id = get_correlation_id()
+        correlation_id = self._get_correlation_id()
         if correlation_id:
             record.correlation_id = correlation_id
         return True
@@ -89,17 +100,18 @@ class JSONFormatter(logging.Formatter):
     log aggregation systems like ELK, Splunk, CloudWatch Logs, etc.
 
     Standard fields:
-    - timestamp: ISO 8601 UTC timestamp
+    - timestamp: ISO 8601 UTC timestamp (millisecond precision)
     - level: Log level name (DEBUG, INFO, etc.)
     - logger: Logger name
     - message: Formatted log message
 
     Optional fields (when present):
+    - source: File, line and function (only when include_source is True)
     - exc_info: Exception traceback if an exception was logged
     - extra: Any additional context passed via logger.info(..., extra={...})
 
     Example output:
-        {"timestamp": "2026-01-18T12:34:56.789Z", "level": "INFO", "logger": "module", "message": "Hello"}
+        {"timestamp": "2026-01-18T12:34:56.789+00:00", "level": "INFO", "logger": "module", "message": "Hello"}
     """
 
     # Fields that are part of standard LogRecord (not user-provided extra)
@@ -130,57 +142,115 @@ class JSONFormatter(logging.Formatter):
         }
     )
 
+    # Attributes never reported under "extra": the reserved names above, any
+    # attribute a plain LogRecord carries on this Python version, attributes
+    # set by other formatters/filters, and fields emitted at the top level.
+    _EXCLUDED_ATTRS = (
+        RESERVED_ATTRS
+        | frozenset(logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__)
+        | frozenset({"asctime", "correlation_id"})
+    )
+
+    def __init__(self, *args: Any, include_source: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.include_source = include_source
+        # (whole second, ISO prefix) of the most recent record. Stored as one
+        # tuple so concurrent handlers never observe a mismatched pair.
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Return an ISO 8601 UTC timestamp with millisecond precision.
+
+        Records logged within the same second reuse the formatted date/time
+        prefix, so datetime construction only happens once per second.
+        """
+        second = int(record.created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, tz=UTC).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as a JSON string."""
         # Build base record
         log_dict: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # Add source location for debugging
-        if record.levelno >= logging.DEBUG:
+        if self.include_source:
             log_dict["source"] = {
                 "file": record.filename,
                 "line": record.lineno,
                 "function": record.funcName,
             }
 
-        # Add exception info if present
+        # Add exception info if present. Like logging.Formatter, cache the
+        # formatted traceback on the record so it is only rendered once even
+        # when several handlers format the same record.
         if record.exc_info:
-            log_dict["exc_info"] = "".join(
-                traceback.format_exception(*record.exc_info)
-            ).strip()
+            if not record.exc_text:
+                record.exc_text = "".join(
+                    traceback.format_exception(*record.exc_info)
+                ).strip()
+            log_dict["exc_info"] = record.exc_text
 
         # Add correlation ID if present
         correlation_id = getattr(record, "correlation_id", None)
         if correlation_id:
             log_dict["correlation_id"] = correlation_id
 
-        # Add any extra fields (user-provided context)
-        extra = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in self.RESERVED_ATTRS and not key.startswith("_")
-        }
-
-        if extra:
-            log_dict["extra"] = extra
+        # Add any extra fields (user-provided context). The set difference is
+        # empty for the common no-extras case, which skips the per-key scan.
+        record_attrs = record.__dict__
+        extra_keys = record_attrs.keys() - self._EXCLUDED_ATTRS
+        if extra_keys:
+            extra = {
+                key: value
+                for key, value in record_attrs.items()
+                if key in extra_keys and not key.startswith("_")
+            }
+            if extra:
+                log_dict["extra"] = extra
 
         # Serialize to JSON (single line, no pretty-print)
-        return json.dumps(log_dict, default=str, ensure_ascii=False)
+        return _dumps_log_line(log_dict)
 
 
-def get_json_formatter() -> JSONFormatter:
+def _dumps_log_line(log_dict: dict[str, Any]) -> str:
+    """Serialize a log dict to a single JSON line.
+
+    Uses orjson when available. Values orjson cannot encode natively are
+    stringified like the stdlib path; anything it rejects outright (e.g.
+    integers beyond 64 bits) falls back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                log_dict, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(log_dict, default=str, ensure_ascii=False)
+
+
+def get_json_formatter(include_source: bool = False) -> JSONFormatter:
     """
     Get a JSON formatter instance for structured logging.
 
+    Args:
+        include_source: If True, add file/line/function to each record
+
     Returns:
         JSONFormatter instance
     """
-    return JSONFormatter()
+    return JSONFormatter(include_source=include_source)
 
 
 def get_text_formatter(verbose: bool = False) -> logging.Formatter:
@@ -274,7 +344,9 @@ def setup_logging(
 
         # Select formatter based on format type
         if log_format == "json":
-            handler.setFormatter(get_json_formatter())
+            handler.setFormatter(
+                get_json_formatter(include_source=numeric_level <= logging.DEBUG)
+            )
         else:
             # Text format (default)
             if format_string is not None:
@@ -289,11 +361,6 @@ def setup_logging(
 
     _logging_configured = True
 
-    # Prevent propagation to root logger (avoids duplicate messages)
-    package_logger.propagate = False
-
-    _logging_configured = True
-
 
 def reset_logging() -> None:
     """
@@ -334,10 +401,11 @@ def set_log_format(log_format: str) -> None:
         log_format: Format type - "text" or "json"
     """
     package_logger = logging.getLogger(LOGGER_NAME)
+    include_source = package_logger.getEffectiveLevel() <= logging.DEBUG
 
     # Update formatter on all handlers
     for handler in package_logger.handlers:
         if log_format.lower() == "json":
-            handler.setFormatter(get_json_formatter())
+            handler.setFormatter(get_json_formatter(include_source=include_source))
         else:
             handler.setFormatter(get_text_formatter(verbose=True))
@@ -13,71 +13,18 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import importlib
+import inspect
+from typing import TYPE_CHECKING, Any
+
+from anyio import to_thread
 from mcp.server.fastmcp import FastMCP
 
 from agentic_cba_indicators.logging_config import setup_logging
 
-# Import raw tools (before wrapping) and wrapping function
-from agentic_cba_indicators.tools import (
-    compare_commodity_producers,
-    compare_gender_gaps,
-    compare_indicators,
-    export_indicator_selection,
-    find_feasible_methods,
-    find_indicators_by_class,
-    find_indicators_by_measurement_approach,
-    find_indicators_by_principle,
-    get_agricultural_climate,
-    get_biodiversity_summary,
-    get_climate_data,
-    get_commodity_production,
-    get_commodity_trade,
-    get_country_indicators,
-    get_crop_production,
-    get_current_weather,
-    get_employment_by_gender,
-    get_evapotranspiration,
-    get_forest_carbon_stock,
-    get_forest_extent,
-    get_forest_statistics,
-    get_gender_indicators,
-    get_gender_time_series,
-    get_historical_climate,
-    get_indicator_details,
-    get_knowledge_version,
-    get_labor_indicators,
-    get_labor_time_series,
-    get_land_use,
-    get_sdg_for_cba_principle,
-    get_sdg_progress,
-    get_sdg_series_data,
-    get_soil_carbon,
-    get_soil_properties,
-    get_soil_texture,
-    get_solar_radiation,
-    get_species_occurrences,
-    get_species_taxonomy,
-    get_tree_cover_loss_by_driver,
-    get_tree_cover_loss_trends,
-    get_usecase_details,
-    get_usecases_by_indicator,
-    get_weather_forecast,
-    get_world_bank_data,
-    list_available_classes,
-    list_fas_commodities,
-    list_indicators_by_component,
-    list_knowledge_base_stats,
-    run_tools_parallel,
-    search_commodity_data,
-    search_fao_indicators,
-    search_gender_indicators,
-    search_indicators,
-    search_labor_indicators,
-    search_methods,
-    search_sdg_indicators,
-    search_species,
-    search_usecases,
-)
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # Server instructions for MCP clients
 _SERVER_INSTRUCTIONS = """
@@ -112,81 +59,82 @@ Indicator Selection Workflow:
 6. Generate report with export_indicator_selection()
 """
 
-# All tools to register (excluding help tools - MCP provides native discovery)
-_ALL_TOOLS = [
+# All tools to register (excluding help tools - MCP provides native discovery),
+# as "module:attribute" specs resolved by _load_tools() at registration time
+_TOOL_SPECS: tuple[str, ...] = (
     # --- Weather & Climate ---
-    get_current_weather,
-    get_weather_forecast,
-    get_climate_data,
-    get_historical_climate,
+    "agentic_cba_indicators.tools.weather:get_current_weather",
+    "agentic_cba_indicators.tools.weather:get_weather_forecast",
+    "agentic_cba_indicators.tools.climate:get_climate_data",
+    "agentic_cba_indicators.tools.climate:get_historical_climate",
     # --- Agricultural Climate (NASA POWER) ---
-    get_agricultural_climate,
-    get_solar_radiation,
-    get_evapotranspiration,
+    "agentic_cba_indicators.tools.nasa_power:get_agricultural_climate",
+    "agentic_cba_indicators.tools.nasa_power:get_solar_radiation",
+    "agentic_cba_indicators.tools.nasa_power:get_evapotranspiration",
     # --- Soil Properties (ISRIC SoilGrids) ---
-    get_soil_properties,
-    get_soil_carbon,
-    get_soil_texture,
+    "agentic_cba_indicators.tools.soilgrids:get_soil_properties",
+    "agentic_cba_indicators.tools.soilgrids:get_soil_carbon",
+    "agentic_cba_indicators.tools.soilgrids:get_soil_texture",
     # --- Biodiversity (GBIF) ---
-    search_species,
-    get_species_occurrences,
-    get_biodiversity_summary,
-    get_species_taxonomy,
+    "agentic_cba_indicators.tools.biodiversity:search_species",
+    "agentic_cba_indicators.tools.biodiversity:get_species_occurrences",
+    "agentic_cba_indicators.tools.biodiversity:get_biodiversity_summary",
+    "agentic_cba_indicators.tools.biodiversity:get_species_taxonomy",
     # --- Forestry (Global Forest Watch) ---
-    get_tree_cover_loss_trends,
-    get_tree_cover_loss_by_driver,
-    get_forest_carbon_stock,
-    get_forest_extent,
+    "agentic_cba_indicators.tools.forestry:get_tree_cover_loss_trends",
+    "agentic_cba_indicators.tools.forestry:get_tree_cover_loss_by_driver",
+    "agentic_cba_indicators.tools.forestry:get_forest_carbon_stock",
+    "agentic_cba_indicators.tools.forestry:get_forest_extent",
     # --- Agriculture (FAO) ---
-    get_forest_statistics,
-    get_crop_production,
-    get_land_use,
-    search_fao_indicators,
+    "agentic_cba_indicators.tools.agriculture:get_forest_statistics",
+    "agentic_cba_indicators.tools.agriculture:get_crop_production",
+    "agentic_cba_indicators.tools.agriculture:get_land_use",
+    "agentic_cba_indicators.tools.agriculture:search_fao_indicators",
     # --- Commodity Markets (USDA FAS) ---
-    get_commodity_production,
-    get_commodity_trade,
-    compare_commodity_producers,
-    list_fas_commodities,
-    search_commodity_data,
+    "agentic_cba_indicators.tools.commodities:get_commodity_production",
+    "agentic_cba_indicators.tools.commodities:get_commodity_trade",
+    "agentic_cba_indicators.tools.commodities:compare_commodity_producers",
+    "agentic_cba_indicators.tools.commodities:list_fas_commodities",
+    "agentic_cba_indicators.tools.commodities:search_commodity_data",
     # --- Labor Statistics (ILO) ---
-    get_labor_indicators,
-    get_employment_by_gender,
-    get_labor_time_series,
-    search_labor_indicators,
+    "agentic_cba_indicators.tools.labor:get_labor_indicators",
+    "agentic_cba_indicators.tools.labor:get_employment_by_gender",
+    "agentic_cba_indicators.tools.labor:get_labor_time_series",
+    "agentic_cba_indicators.tools.labor:search_labor_indicators",
     # --- Gender Statistics (World Bank) ---
-    get_gender_indicators,
-    compare_gender_gaps,
-    get_gender_time_series,
-    search_gender_indicators,
+    "agentic_cba_indicators.tools.gender:get_gender_indicators",
+    "agentic_cba_indicators.tools.gender:compare_gender_gaps",
+    "agentic_cba_indicators.tools.gender:get_gender_time_series",
+    "agentic_cba_indicators.tools.gender:search_gender_indicators",
     # --- SDG Indicators (UN) ---
-    get_sdg_progress,
-    search_sdg_indicators,
-    get_sdg_series_data,
-    get_sdg_for_cba_principle,
+    "agentic_cba_indicators.tools.sdg:get_sdg_progress",
+    "agentic_cba_indicators.tools.sdg:search_sdg_indicators",
+    "agentic_cba_indicators.tools.sdg:get_sdg_series_data",
+    "agentic_cba_indicators.tools.sdg:get_sdg_for_cba_principle",
     # --- Socio-Economic ---
-    get_country_indicators,
-    get_world_bank_data,
+    "agentic_cba_indicators.tools.socioeconomic:get_country_indicators",
+    "agentic_cba_indicators.tools.socioeconomic:get_world_bank_data",
     # --- CBA Knowledge Base ---
-    search_indicators,
-    search_methods,
-    get_indicator_details,
-    list_knowledge_base_stats,
-    get_knowledge_version,
-    find_indicators_by_principle,
-    find_indicators_by_class,
-    find_indicators_by_measurement_approach,
-    find_feasible_methods,
-    list_indicators_by_component,
-    list_available_classes,
-    compare_indicators,
-    export_indicator_selection,
+    "agentic_cba_indicators.tools.knowledge_base:search_indicators",
+    "agentic_cba_indicators.tools.knowledge_base:search_methods",
+    "agentic_cba_indicators.tools.knowledge_base:get_indicator_details",
+    "agentic_cba_indicators.tools.knowledge_base:list_knowledge_base_stats",
+    "agentic_cba_indicators.tools.knowledge_base:get_knowledge_version",
+    "agentic_cba_indicators.tools.knowledge_base:find_indicators_by_principle",
+    "agentic_cba_indicators.tools.knowledge_base:find_indicators_by_class",
+    "agentic_cba_indicators.tools.knowledge_base:find_indicators_by_measurement_approach",
+    "agentic_cba_indicators.tools.knowledge_base:find_feasible_methods",
+    "agentic_cba_indicators.tools.knowledge_base:list_indicators_by_component",
+    "agentic_cba_indicators.tools.knowledge_base:list_available_classes",
+    "agentic_cba_indicators.tools.knowledge_base:compare_indicators",
+    "agentic_cba_indicators.tools.knowledge_base:export_indicator_selection",
     # --- Use Cases ---
-    search_usecases,
-    get_usecase_details,
-    get_usecases_by_indicator,
+    "agentic_cba_indicators.tools.knowledge_base:search_usecases",
+    "agentic_cba_indicators.tools.knowledge_base:get_usecase_details",
+    "agentic_cba_indicators.tools.knowledge_base:get_usecases_by_indicator",
     # --- Utility ---
-    run_tools_parallel,
-]
+    "agentic_cba_indicators.tools._parallel:run_tools_parallel",
+)
 
 # Create MCP server instance
 mcp = FastMCP(
@@ -195,16 +143,63 @@ mcp = FastMCP(
 )
 
 
+def _load_tools() -> list[Callable[..., Any]]:
+    """Import and return the tool functions named in _TOOL_SPECS.
+
+    Tool modules (and their pandas/httpx/chromadb dependencies) are only
+    imported here, so importing this module stays cheap until the server
+    actually starts.
+
+    Returns:
+        Tool callables in _TOOL_SPECS order
+    """
+    # Tool sets are wrapped lazily; requesting the full set applies timeout,
+    # audit and metrics wrapping to the Strands tools looked up below
+    importlib.import_module("agentic_cba_indicators.tools").FULL_TOOLS  # noqa: B018
+
+    tools: list[Callable[..., Any]] = []
+    for spec in _TOOL_SPECS:
+        module_name, attr = spec.split(":")
+        tools.append(getattr(importlib.import_module(module_name), attr))
+    return tools
+
+
+def _wrap_sync(tool_func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a synchronous tool so FastMCP runs it in a worker thread.
+
+    FastMCP calls sync tools directly on the event loop, so one blocking
+    HTTP request would stall every other in-flight tool call. functools.wraps
+    keeps the name, docstring and signature FastMCP builds the schema from.
+
+    Args:
+        tool_func: Synchronous tool callable
+
+    Returns:
+        Async callable with the same signature
+    """
+
+    @functools.wraps(tool_func)
+    async def _run_in_thread(*args: Any, **kwargs: Any) -> Any:
+        return await to_thread.run_sync(functools.partial(tool_func, *args, **kwargs))
+
+    return _run_in_thread
+
+
 def _register_tools() -> None:
     """Register all tools with the MCP server.
 
     Tools are already wrapped with timeout/audit/metrics from the tools module.
-    This function converts them to MCP tool format.
+    This function converts them to MCP tool format, offloading synchronous
+    tools to worker threads.
     """
-    for tool_func in _ALL_TOOLS:
-        # FastMCP's @mcp.tool() decorator extracts function signature and docstring
-        # We use the function directly since tools are already @tool decorated
-        mcp.tool()(tool_func)
+    # add_tool() is what the @mcp.tool() decorator delegates to; calling it
+    # directly skips building a throwaway decorator closure per tool. FastMCP
+    # still extracts each function's signature and docstring for its schema.
+    add_tool = mcp.add_tool
+    for tool_func in _load_tools():
+        if not inspect.iscoroutinefunction(tool_func):
+            tool_func = _wrap_sync(tool_func)
+        add_tool(tool_func)
 
 
 def run_server() -> None:
@@ -7,7 +7,9 @@ and trims oldest messages to stay within budget while preserving most recent con
 
 Thread Safety:
     This module is thread-safe for single-agent use. Token estimation and message
-    trimming operations are deterministic and do not maintain shared state.
+    trimming operations are deterministic. Each manager keeps a private cache of
+    per-message token estimates, so a manager instance should not be shared
+    between agents.
 
 Example:
     >>> from agentic_cba_indicators.memory import TokenBudgetConversationManager
@@ -19,14 +21,24 @@ from __future__ import annotations
 
 import json
 import logging
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import TYPE_CHECKING, Any, cast
 
 from strands.agent.conversation_manager import ConversationManager
 from strands.hooks import BeforeModelCallEvent, HookRegistry
 from strands.types.exceptions import ContextWindowOverflowException
 
+# orjson serializes tool inputs several times faster than the stdlib encoder;
+# it is optional and the stdlib json module is used when it is not installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from strands.agent.agent import Agent
 
@@ -38,6 +50,14 @@ DEFAULT_MAX_TOKENS = 8000
 # Minimum messages to preserve (avoids empty context)
 MIN_MESSAGES_TO_PRESERVE = 2
 
+# Strings shorter than this (roles, tool names) go through the LRU cache;
+# longer ones (tool payloads) are estimated directly to keep the cache small
+_HEURISTIC_CACHE_MAX_LEN = 64
+
+# Structural flags for tool use/result boundaries (bit field)
+_HAS_TOOL_USE = 1
+_HAS_TOOL_RESULT = 2
+
 
 def estimate_tokens_heuristic(text: str) -> int:
     """Estimate token count using chars/4 heuristic.
@@ -52,63 +72,130 @@ def estimate_tokens_heuristic(text: str) -> int:
     Returns:
         Estimated token count (always >= 1 for non-empty strings).
     """
-    if not text:
+    if len(text) < _HEURISTIC_CACHE_MAX_LEN:
+        return _cached_heuristic(text)
+    return _chars_to_tokens(len(text))
+
+
+def _chars_to_tokens(char_count: int) -> int:
+    """Apply the chars/4 heuristic to a character count."""
+    if not char_count:
         return 0
     # Average English word is ~5 chars, average token is ~4 chars
-    return max(1, len(text) // 4)
+    return max(1, char_count // 4)
 
 
-def _message_to_text(message: dict[str, Any]) -> str:
-    """Convert a message dict to plain text for token estimation.
+@lru_cache(maxsize=2048)
+def _cached_heuristic(text: str) -> int:
+    """Memoized heuristic for short, frequently repeated strings."""
+    return _chars_to_tokens(len(text))
+
+
+def _dumps_tool_input(tool_input: Any) -> str:
+    """Serialize a tool input for token estimation.
+
+    Uses orjson when available; inputs it rejects (e.g. integers beyond
+    64 bits or non-string keys) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(tool_input, default=str).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(tool_input, default=str)
+
+
+def _iter_message_parts(message: dict[str, Any]) -> Iterator[str]:
+    """Yield the text fragments of a message that count towards its tokens.
 
     Handles various content types including text, tool use, and tool results.
 
     Args:
         message: A message dictionary with 'role' and 'content' keys.
 
-    Returns:
-        Plain text representation of the message content.
+    Yields:
+        Text fragments in message order.
     """
-    parts: list[str] = []
-
     # Include role in estimation (it's part of the prompt)
     role = message.get("role", "")
     if role:
-        parts.append(role)
+        yield role
 
     content = message.get("content", [])
     if isinstance(content, str):
-        parts.append(content)
+        yield content
     elif isinstance(content, list):
         for item in content:
             if isinstance(item, str):
-                parts.append(item)
+                yield item
             elif isinstance(item, dict):
                 # Handle text content
                 if "text" in item:
-                    parts.append(str(item["text"]))
+                    yield str(item["text"])
                 # Handle tool use
                 elif "toolUse" in item:
                     tool_use = item["toolUse"]
-                    parts.append(f"toolUse:{tool_use.get('name', '')}")
+                    yield f"toolUse:{tool_use.get('name', '')}"
                     # Tool input can be large - estimate it
                     tool_input = tool_use.get("input", {})
                     if tool_input:
-                        parts.append(json.dumps(tool_input, default=str))
+                        yield _dumps_tool_input(tool_input)
                 # Handle tool result
                 elif "toolResult" in item:
                     tool_result = item["toolResult"]
                     result_content = tool_result.get("content", [])
                     if isinstance(result_content, str):
-                        parts.append(result_content)
+                        yield result_content
                     elif isinstance(result_content, list):
                         for rc in result_content:
                             if isinstance(rc, dict) and "text" in rc:
-                                parts.append(str(rc["text"]))
+                                yield str(rc["text"])
                             elif isinstance(rc, str):
-                                parts.append(rc)
+                                yield rc
 
-    return " ".join(parts)
+
+def _message_to_text(message: dict[str, Any]) -> str:
+    """Convert a message dict to plain text for token estimation.
+
+    Handles various content types including text, tool use, and tool results.
+
+    Args:
+        message: A message dictionary with 'role' and 'content' keys.
+
+    Returns:
+        Plain text representation of the message content.
+    """
+    return " ".join(_iter_message_parts(message))
+
+
+def _message_char_count(message: dict[str, Any]) -> int:
+    """Return len(_message_to_text(message)) without building the joined text.
+
+    Args:
+        message: A message dictionary with 'role' and 'content' keys.
+
+    Returns:
+        Character count of the message's plain text representation.
+    """
+    total = 0
+    count = 0
+    for part in _iter_message_parts(message):
+        total += len(part)
+        count += 1
+    # Account for the single-space separators added by the join
+    return total + count - 1 if count else 0
+
+
+def _classify_message(message: dict[str, Any]) -> int:
+    """Return the tool flags (_HAS_TOOL_USE | _HAS_TOOL_RESULT) for a message."""
+    flags = 0
+    for item in message.get("content", []):
+        if isinstance(item, dict):
+            if "toolUse" in item:
+                flags |= _HAS_TOOL_USE
+            if "toolResult" in item:
+                flags |= _HAS_TOOL_RESULT
+    return flags
 
 
 def estimate_message_tokens(
@@ -126,6 +213,9 @@ def estimate_message_tokens(
         Estimated token count for the message.
     """
     estimator = token_estimator or estimate_tokens_heuristic
+    if estimator is estimate_tokens_heuristic:
+        # The default heuristic only needs the length, so skip the join
+        return _chars_to_tokens(_message_char_count(message))
     text = _message_to_text(message)
     return estimator(text)
 
@@ -174,6 +264,20 @@ class TokenBudgetConversationManager(ConversationManager):
         >>> agent = Agent(conversation_manager=manager)
     """
 
+    # ConversationManager does not define __slots__, so instances keep a
+    # __dict__ (for removed_message_count); the slots cover this class's state.
+    __slots__ = (
+        "_last_seen_last_id",
+        "_last_seen_len",
+        "_model_call_count",
+        "_token_cache",
+        "max_tokens",
+        "per_turn",
+        "should_truncate_results",
+        "system_prompt_budget",
+        "token_estimator",
+    )
+
     def __init__(
         self,
         max_tokens: int = DEFAULT_MAX_TOKENS,
@@ -232,6 +336,14 @@ class TokenBudgetConversationManager(ConversationManager):
         self.per_turn = per_turn
         self.should_truncate_results = should_truncate_results
         self._model_call_count = 0
+        # id(message) -> (message, estimated tokens, tool flags). Holding the
+        # message keeps its id from being reused while the entry exists; the
+        # identity check in _cache_entry guards against stale entries regardless.
+        self._token_cache: dict[int, tuple[dict[str, Any], int, int]] = {}
+        # History shape (length, id of last message) at the end of the last
+        # apply_management call; an unchanged history needs no re-check
+        self._last_seen_len = -1
+        self._last_seen_last_id: int | None = None
 
     @property
     def effective_budget(self) -> int:
@@ -318,6 +430,13 @@ class TokenBudgetConversationManager(ConversationManager):
         if not messages:
             return
 
+        # Nothing was added since the last check, so the answer is unchanged
+        if (
+            len(messages) == self._last_seen_len
+            and id(messages[-1]) == self._last_seen_last_id
+        ):
+            return
+
         current_tokens = self._estimate_total_tokens(messages)
         budget = self.effective_budget
 
@@ -329,15 +448,16 @@ class TokenBudgetConversationManager(ConversationManager):
                 self.max_tokens,
                 self.system_prompt_budget,
             )
-            return
-
-        logger.debug(
-            "current_tokens=<%d>, effective_budget=<%d> | over budget, trimming messages",
-            current_tokens,
-            budget,
-        )
+        else:
+            logger.debug(
+                "current_tokens=<%d>, effective_budget=<%d> | over budget, trimming messages",
+                current_tokens,
+                budget,
+            )
+            self._trim_to_budget(messages)
 
-        self._trim_to_budget(messages)
+        self._last_seen_len = len(messages)
+        self._last_seen_last_id = id(messages[-1])
 
     def reduce_context(
         self, agent: Agent, e: Exception | None = None, **kwargs: Any
@@ -384,6 +504,42 @@ class TokenBudgetConversationManager(ConversationManager):
             reduced_budget,
         )
 
+    def _cache_entry(self, message: dict[str, Any]) -> tuple[dict[str, Any], int, int]:
+        """Return the cached (message, tokens, tool flags) entry for a message.
+
+        Messages are not modified once appended to the history (except by
+        _try_truncate_tool_results, which invalidates its entries), so each
+        message only needs to be serialized, estimated and classified once.
+
+        Args:
+            message: Message to look up.
+
+        Returns:
+            Tuple of (message, estimated tokens, tool flags).
+        """
+        entry = self._token_cache.get(id(message))
+        if entry is None or entry[0] is not message:
+            entry = (
+                message,
+                estimate_message_tokens(message, self.token_estimator),
+                _classify_message(message),
+            )
+            self._token_cache[id(message)] = entry
+        return entry
+
+    def _cached_estimate(self, message: dict[str, Any]) -> int:
+        """Estimate tokens for a message, reusing a previous estimate if cached."""
+        return self._cache_entry(message)[1]
+
+    def _cached_flags(self, message: dict[str, Any]) -> int:
+        """Return tool flags for a message, reusing a previous result if cached."""
+        return self._cache_entry(message)[2]
+
+    def _prune_token_cache(self, messages: list[dict[str, Any]]) -> None:
+        """Drop cached estimates for messages no longer in the history."""
+        cache = self._token_cache
+        self._token_cache = {id(m): cache[id(m)] for m in messages if id(m) in cache}
+
     def _estimate_total_tokens(self, messages: list[dict[str, Any]]) -> int:
         """Estimate total tokens for messages using configured estimator.
 
@@ -393,7 +549,11 @@ class TokenBudgetConversationManager(ConversationManager):
         Returns:
             Estimated total token count.
         """
-        return estimate_messages_tokens(messages, self.token_estimator)
+        total = sum(self._cached_estimate(m) for m in messages)
+        # Messages removed outside this manager leave entries behind
+        if len(self._token_cache) > 2 * len(messages):
+            self._prune_token_cache(messages)
+        return total
 
     def _trim_to_budget(
         self,
@@ -414,20 +574,12 @@ class TokenBudgetConversationManager(ConversationManager):
         if len(messages) <= MIN_MESSAGES_TO_PRESERVE:
             return
 
-        # Calculate tokens from the end (newest) to find how many we can keep
-        kept_tokens = 0
-        keep_from_index = len(messages)
-
-        for i in range(len(messages) - 1, -1, -1):
-            msg_tokens = estimate_message_tokens(messages[i], self.token_estimator)
-
-            if kept_tokens + msg_tokens > target:
-                # This message would exceed budget
-                keep_from_index = i + 1
-                break
-
-            kept_tokens += msg_tokens
-            keep_from_index = i
+        # Cumulative tokens from the end (newest); estimates are non-negative,
+        # so the sums are sorted and bisect finds how many messages fit
+        suffix_tokens = list(
+            accumulate(self._cached_estimate(msg) for msg in reversed(messages))
+        )
+        keep_from_index = len(messages) - bisect_right(suffix_tokens, target)
 
         # Ensure we keep at least MIN_MESSAGES_TO_PRESERVE
         max_trim_index = len(messages) - MIN_MESSAGES_TO_PRESERVE
@@ -447,13 +599,18 @@ class TokenBudgetConversationManager(ConversationManager):
 
         # Remove oldest messages
         del messages[:trim_index]
+        self._prune_token_cache(messages)
+        self._last_seen_len = -1
 
-        logger.debug(
-            "trimmed=<%d>, remaining=<%d>, tokens=<%d>",
-            trim_index,
-            len(messages),
-            self._estimate_total_tokens(messages),
-        )
+        # The token total is only needed for this log line; skip the extra
+        # history pass unless debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "trimmed=<%d>, remaining=<%d>, tokens=<%d>",
+                trim_index,
+                len(messages),
+                self._estimate_total_tokens(messages),
+            )
 
     def _adjust_for_tool_pairs(
         self,
@@ -477,30 +634,17 @@ class TokenBudgetConversationManager(ConversationManager):
 
         # Check messages starting from trim_index
         while trim_index < len(messages) - MIN_MESSAGES_TO_PRESERVE:
-            msg = messages[trim_index]
-            content = msg.get("content", [])
-
-            # Check if this message has a toolResult
-            has_tool_result = any(
-                isinstance(c, dict) and "toolResult" in c for c in content
-            )
+            flags = self._cached_flags(messages[trim_index])
 
-            # Check if this message has a toolUse
-            has_tool_use = any(isinstance(c, dict) and "toolUse" in c for c in content)
-
-            if has_tool_result:
+            if flags & _HAS_TOOL_RESULT:
                 # Can't start with a toolResult - need the preceding toolUse
                 trim_index += 1
                 continue
 
-            if has_tool_use and trim_index + 1 < len(messages):
+            if flags & _HAS_TOOL_USE and trim_index + 1 < len(messages):
                 # Check if next message has corresponding toolResult
-                next_msg = messages[trim_index + 1]
-                next_content = next_msg.get("content", [])
-                next_has_result = any(
-                    isinstance(c, dict) and "toolResult" in c for c in next_content
-                )
-                if not next_has_result:
+                next_flags = self._cached_flags(messages[trim_index + 1])
+                if not next_flags & _HAS_TOOL_RESULT:
                     # toolUse without result - can start here
                     break
                 # Has result - need to keep both, move past
@@ -515,35 +659,62 @@ class TokenBudgetConversationManager(ConversationManager):
     def _try_truncate_tool_results(self, messages: list[dict[str, Any]]) -> bool:
         """Try to truncate large tool results to reduce context.
 
+        Only runs after a real overflow, so at least one oversized result is
+        always truncated, even when the heuristic estimate is under budget.
+        Walks messages oldest-first, skipping the newest
+        MIN_MESSAGES_TO_PRESERVE, and stops once a truncation has brought the
+        history within the effective budget. The newest messages are only
+        truncated when no older result could be.
+
         Args:
             messages: Messages to process.
 
         Returns:
             True if any truncation was performed.
         """
+        split = max(0, len(messages) - MIN_MESSAGES_TO_PRESERVE)
+        budget = self.effective_budget
+        current_tokens = self._estimate_total_tokens(messages)
         truncated = False
+
+        for candidates in (messages[:split], messages[split:]):
+            for msg in candidates:
+                if truncated and current_tokens <= budget:
+                    return True
+                if self._truncate_message_results(msg):
+                    truncated = True
+                    current_tokens -= self._cached_estimate(msg)
+                    self._token_cache.pop(id(msg), None)
+                    current_tokens += self._cached_estimate(msg)
+            if truncated:
+                break
+
+        return truncated
+
+    @staticmethod
+    def _truncate_message_results(msg: dict[str, Any]) -> bool:
+        """Truncate the large tool result texts in one message.
+
+        Returns:
+            True if any text was truncated.
+        """
         # Preserve 800 chars of content + truncation notice (CR-0004 fix)
         max_content_length = 1000
         preserved_length = 800
         truncation_suffix = "\n\n... [truncated to reduce context size]"
 
-        for msg in messages:
-            content = msg.get("content", [])
-            for item in content:
-                if isinstance(item, dict) and "toolResult" in item:
-                    tool_result = item["toolResult"]
-                    result_content = tool_result.get("content", [])
-
-                    # Check if content is large
-                    if isinstance(result_content, list):
-                        for rc in result_content:
-                            if isinstance(rc, dict) and "text" in rc:
-                                text = str(rc["text"])
-                                if len(text) > max_content_length:
-                                    # Preserve meaningful prefix instead of destroying content
-                                    rc["text"] = (
-                                        text[:preserved_length] + truncation_suffix
-                                    )
-                                    truncated = True
-
+        truncated = False
+        for item in msg.get("content", []):
+            if isinstance(item, dict) and "toolResult" in item:
+                result_content = item["toolResult"].get("content", [])
+
+                # Check if content is large
+                if isinstance(result_content, list):
+                    for rc in result_content:
+                        if isinstance(rc, dict) and "text" in rc:
+                            text = str(rc["text"])
+                            if len(text) > max_content_length:
+                                # Preserve meaningful prefix instead of destroying content
+                                rc["text"] = text[:preserved_length] + truncation_suffix
+                                truncated = True
         return truncated
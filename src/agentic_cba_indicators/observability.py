@@ -4,8 +4,9 @@ Observability module for the Agentic CBA Indicators chatbot.
 Provides metrics collection, instrumentation, and optional export capabilities.
 
 Thread Safety:
-    The MetricsCollector uses threading.Lock for thread-safe updates to counters
-    and histograms. Safe for use in multi-threaded environments.
+    The MetricsCollector keeps a threading.Lock per tool for counter and
+    latency updates, so calls to different tools never contend. Safe for use
+    in multi-threaded environments.
 
 Usage:
     from agentic_cba_indicators.observability import get_metrics, instrument_tool
@@ -22,9 +23,13 @@ Usage:
 from __future__ import annotations
 
 import functools
+import itertools
+import os
 import threading
 import time
+from array import array
 from collections.abc import Callable
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
@@ -82,17 +87,99 @@ class ToolMetrics:
             return 0.0
         return self.success_count / self.call_count
 
+    def compute_percentiles(
+        self, ps: tuple[int, ...] = (50, 95, 99)
+    ) -> dict[int, float]:
+        """Calculate several latency percentiles in one pass.
+
+        Uses linear interpolation between closest ranks (numpy's default).
+
+        Args:
+            ps: Percentiles to compute (0-100)
+
+        Returns:
+            Mapping of each requested percentile to its latency in seconds
+        """
+        if not self.latencies:
+            return dict.fromkeys(ps, 0.0)
+        # numpy is imported lazily so importing this module stays cheap
+        import numpy as np
+
+        values = np.percentile(np.asarray(self.latencies, dtype=np.float64), ps)
+        return dict(zip(ps, values.tolist(), strict=True))
+
     def _percentile(self, p: int) -> float:
         """Calculate percentile from latencies."""
-        if not self.latencies:
-            return 0.0
-        sorted_latencies = sorted(self.latencies)
-        k = (len(sorted_latencies) - 1) * (p / 100)
-        f = int(k)
-        c = min(f + 1, len(sorted_latencies) - 1)
-        if f == c:
-            return sorted_latencies[f]
-        return sorted_latencies[f] * (c - k) + sorted_latencies[c] * (k - f)
+        return self.compute_percentiles((p,))[p]
+
+
+class _LatencyRing:
+    """Latency samples of one tool, shared by all of its shard recorders.
+
+    Samples are integer nanoseconds in a ring of at most ``max_samples``
+    entries, so a tool never keeps more than that however many shards (or
+    threads) record it. Each call reserves the next slot from an atomic
+    counter while holding its shard's lock; once full, the oldest sample is
+    overwritten in place. The array grows on demand, so rarely used tools
+    stay small.
+    """
+
+    __slots__ = ("_grow_lock", "_max_samples", "_next_slot", "_samples")
+
+    def __init__(self, max_samples: int) -> None:
+        self._grow_lock = threading.Lock()
+        self._max_samples = max_samples
+        self._next_slot = itertools.count()  # next() is atomic under the GIL
+        self._samples = array("q")
+
+    def store(self, latency_ns: int) -> None:
+        """Store one sample (call with the caller's shard lock held)."""
+        slot = next(self._next_slot) % self._max_samples
+        samples = self._samples
+        if slot >= len(samples):
+            with self._grow_lock:
+                if slot >= len(samples):
+                    size = min(self._max_samples, max(64, 2 * len(samples), slot + 1))
+                    samples.frombytes(bytes(samples.itemsize * (size - len(samples))))
+        samples[slot] = latency_ns
+
+    def read(self, count: int) -> array[int]:
+        """Return the newest samples oldest-first, given the total calls.
+
+        Must be called with every shard lock of the tool held, so that all
+        ``count`` reserved slots have been written.
+        """
+        samples = self._samples
+        if count <= self._max_samples:
+            return samples[:count]
+        cursor = count % self._max_samples
+        return samples[cursor:] + samples[:cursor]
+
+
+class _ToolRecorder:
+    """Mutable counters for one shard of a tool.
+
+    Each recorder has its own lock, so concurrent calls never contend unless
+    they hit the same tool from threads mapped to the same shard. Latencies
+    go to the tool's shared _LatencyRing while the lock is held.
+    Only calls and failures are counted; successes are derived on snapshot.
+    """
+
+    __slots__ = ("_lock", "_ring", "call_count", "failure_count")
+
+    def __init__(self, ring: _LatencyRing) -> None:
+        self._lock = threading.Lock()
+        self._ring = ring
+        self.call_count = 0
+        self.failure_count = 0
+
+    def record(self, latency_ns: int, success: bool) -> None:
+        """Record one call outcome and its latency in nanoseconds."""
+        with self._lock:
+            self.call_count += 1
+            if not success:
+                self.failure_count += 1
+            self._ring.store(latency_ns)
 
 
 class MetricsCollector:
@@ -103,8 +190,13 @@ class MetricsCollector:
     - Latency measurements per tool
 
     Thread Safety:
-        All public methods are protected by a threading.Lock to ensure
-        safe concurrent access from multiple threads.
+        Each tool is split into ``num_shards`` recorders (one per CPU by
+        default) and a thread only updates the shard picked by its native
+        thread id, taking just that shard's lock. The shards of a tool
+        share one latency ring, so samples stay bounded per tool; reads
+        briefly hold all of the tool's shard locks.
+        The collector lock is taken when a tool is seen for the first time
+        (or on reset), so the steady-state recording path rarely contends.
 
     Example:
         collector = MetricsCollector()
@@ -116,9 +208,14 @@ class MetricsCollector:
     # Maximum number of latency samples to keep per tool (prevents unbounded growth)
     MAX_LATENCY_SAMPLES = 10000
 
-    def __init__(self) -> None:
-        """Initialize the metrics collector."""
-        self._metrics: dict[str, ToolMetrics] = {}
+    def __init__(self, num_shards: int | None = None) -> None:
+        """Initialize the metrics collector.
+
+        Args:
+            num_shards: Recorders per tool (defaults to the CPU count)
+        """
+        self._num_shards = num_shards or os.cpu_count() or 1
+        self._metrics: dict[str, tuple[_ToolRecorder, ...]] = {}
         self._lock = threading.Lock()
         self._start_time = time.time()
 
@@ -130,23 +227,71 @@ class MetricsCollector:
             latency: Call latency in seconds
             success: Whether the call succeeded (True) or failed (False)
         """
-        with self._lock:
-            if tool_name not in self._metrics:
-                self._metrics[tool_name] = ToolMetrics()
+        self.record_call_ns(tool_name, round(latency * 1e9), success)
 
-            metrics = self._metrics[tool_name]
-            metrics.call_count += 1
+    def record_call_ns(
+        self, tool_name: str, latency_ns: int, success: bool = True
+    ) -> None:
+        """Record a tool call with an integer latency from perf_counter_ns().
 
-            if success:
-                metrics.success_count += 1
-            else:
-                metrics.failure_count += 1
+        Args:
+            tool_name: Name of the tool that was called
+            latency_ns: Call latency in nanoseconds
+            success: Whether the call succeeded (True) or failed (False)
+        """
+        shards = self._metrics.get(tool_name)
+        if shards is None:
+            # Double-checked insert: only the first call per tool takes the
+            # collector lock
+            with self._lock:
+                shards = self._metrics.get(tool_name)
+                if shards is None:
+                    ring = _LatencyRing(self.MAX_LATENCY_SAMPLES)
+                    shards = tuple(_ToolRecorder(ring) for _ in range(self._num_shards))
+                    self._metrics[tool_name] = shards
+
+        # Native thread ids are small sequential integers (unlike get_ident(),
+        # which is an aligned address), so they spread evenly over the shards
+        shards[threading.get_native_id() % self._num_shards].record(latency_ns, success)
+
+    @staticmethod
+    def _read_tool(shards: tuple[_ToolRecorder, ...]) -> tuple[int, int, array[int]]:
+        """Combine the shards of one tool into (calls, failures, ns samples).
+
+        Holds every shard lock while reading, so the counters and the shared
+        ring are consistent; only array copies (memcpy) happen under them.
+        """
+        with ExitStack() as stack:
+            for shard in shards:
+                stack.enter_context(shard._lock)
+            calls = sum(shard.call_count for shard in shards)
+            failures = sum(shard.failure_count for shard in shards)
+            samples = shards[0]._ring.read(calls)
+        return calls, failures, samples
+
+    @classmethod
+    def _merge(cls, shards: tuple[_ToolRecorder, ...]) -> ToolMetrics:
+        """Build a ToolMetrics copy from the shards of one tool."""
+        calls, failures, samples = cls._read_tool(shards)
+        return ToolMetrics(
+            call_count=calls,
+            success_count=calls - failures,
+            failure_count=failures,
+            latencies=[ns / 1e9 for ns in samples],
+        )
+
+    def _items(self) -> list[tuple[str, tuple[_ToolRecorder, ...]]]:
+        """Return (tool name, shards) pairs for every recorded tool."""
+        with self._lock:
+            return list(self._metrics.items())
 
-            # Add latency with bounded size
-            metrics.latencies.append(latency)
-            if len(metrics.latencies) > self.MAX_LATENCY_SAMPLES:
-                # Remove oldest samples when limit exceeded
-                metrics.latencies = metrics.latencies[-self.MAX_LATENCY_SAMPLES :]
+    def _snapshot(self) -> dict[str, ToolMetrics]:
+        """Return ToolMetrics copies for every recorded tool."""
+        return {name: self._merge(shards) for name, shards in self._items()}
+
+    def _all_recorders(self) -> list[_ToolRecorder]:
+        """Return every shard recorder across all tools."""
+        return [r for _, shards in self._items() for r in shards]
 
     def get_tool_metrics(self, tool_name: str) -> ToolMetrics:
         """Get metrics for a specific tool.
@@ -157,18 +302,12 @@ class MetricsCollector:
         Returns:
             ToolMetrics object with current metrics (or empty metrics if tool not found)
         """
-        with self._lock:
-            if tool_name not in self._metrics:
-                return ToolMetrics()
-
-            # Return a copy to avoid external mutation
-            m = self._metrics[tool_name]
-            return ToolMetrics(
-                call_count=m.call_count,
-                success_count=m.success_count,
-                failure_count=m.failure_count,
-                latencies=m.latencies.copy(),
-            )
+        shards = self._metrics.get(tool_name)
+        if shards is None:
+            return ToolMetrics()
+
+        # Return a copy to avoid external mutation
+        return self._merge(shards)
 
     def get_all_metrics(self) -> dict[str, ToolMetrics]:
         """Get metrics for all tools.
@@ -176,16 +315,7 @@ class MetricsCollector:
         Returns:
             Dictionary mapping tool names to their metrics (copies)
         """
-        with self._lock:
-            return {
-                name: ToolMetrics(
-                    call_count=m.call_count,
-                    success_count=m.success_count,
-                    failure_count=m.failure_count,
-                    latencies=m.latencies.copy(),
-                )
-                for name, m in self._metrics.items()
-            }
+        return self._snapshot()
 
     def reset(self) -> None:
         """Reset all metrics.
@@ -202,53 +332,54 @@ class MetricsCollector:
         Returns:
             Formatted string with metrics summary
         """
-        with self._lock:
-            if not self._metrics:
-                return "No metrics collected yet."
-
-            uptime = time.time() - self._start_time
-            lines = [
-                f"=== Metrics Summary (uptime: {uptime:.1f}s) ===",
-                "",
-            ]
-
-            # Sort by call count descending
-            sorted_tools = sorted(
-                self._metrics.items(),
-                key=lambda x: x[1].call_count,
-                reverse=True,
-            )
-
-            for tool_name, metrics in sorted_tools:
-                lines.append(f"📊 {tool_name}")
+        raw = [(name, *self._read_tool(shards)) for name, shards in self._items()]
+        if not raw:
+            return "No metrics collected yet."
+
+        # numpy is imported lazily so importing this module stays cheap
+        import numpy as np
+
+        uptime = time.time() - self._start_time
+        lines = [
+            f"=== Metrics Summary (uptime: {uptime:.1f}s) ===",
+            "",
+        ]
+
+        # Sort by call count descending
+        raw.sort(key=lambda x: x[1], reverse=True)
+
+        for tool_name, calls, failures, samples in raw:
+            successes = calls - failures
+            success_rate = successes / calls if calls else 0.0
+            lines.append(f"📊 {tool_name}")
+            lines.append(f"   Calls: {calls} (✓{successes} ✗{failures})")
+            lines.append(f"   Success rate: {success_rate:.1%}")
+            if samples:
+                # Stats straight from the int64 buffer, without boxing floats
+                ns = np.frombuffer(samples, dtype=np.int64)
+                p50, p95 = np.percentile(ns, (50, 95)) / 1e6
+                avg = ns.mean() / 1e6
                 lines.append(
-                    f"   Calls: {metrics.call_count} (✓{metrics.success_count} ✗{metrics.failure_count})"
+                    f"   Latency: avg={avg:.1f}ms, p50={p50:.1f}ms, p95={p95:.1f}ms"
                 )
-                lines.append(f"   Success rate: {metrics.success_rate:.1%}")
-                if metrics.latencies:
-                    lines.append(
-                        f"   Latency: avg={metrics.avg_latency_ms:.1f}ms, p50={metrics.p50_latency_ms:.1f}ms, p95={metrics.p95_latency_ms:.1f}ms"
-                    )
-                lines.append("")
+            lines.append("")
 
-            return "\n".join(lines)
+        return "\n".join(lines)
 
     @property
     def total_calls(self) -> int:
         """Total number of calls across all tools."""
-        with self._lock:
-            return sum(m.call_count for m in self._metrics.values())
+        return sum(r.call_count for r in self._all_recorders())
 
     @property
     def total_errors(self) -> int:
         """Total number of failed calls across all tools."""
-        with self._lock:
-            return sum(m.failure_count for m in self._metrics.values())
+        return sum(r.failure_count for r in self._all_recorders())
 
 
-# Global singleton metrics collector
-_metrics_collector: MetricsCollector | None = None
-_metrics_collector_lock = threading.Lock()
+# Global singleton metrics collector, created at import so get_metrics() needs
+# no lazy-init locking. It is never rebound; reset_metrics() clears it in place.
+_metrics_collector = MetricsCollector()
 
 
 def get_metrics() -> MetricsCollector:
@@ -257,15 +388,7 @@ def get_metrics() -> MetricsCollector:
     Returns:
         The global MetricsCollector instance
     """
-    global _metrics_collector
-
-    if _metrics_collector is not None:
-        return _metrics_collector
-
-    with _metrics_collector_lock:
-        if _metrics_collector is None:
-            _metrics_collector = MetricsCollector()
-        return _metrics_collector
+    return _metrics_collector
 
 
 def reset_metrics() -> None:
@@ -273,10 +396,7 @@ def reset_metrics() -> None:
 
     Primarily for testing purposes.
     """
-    global _metrics_collector
-    with _metrics_collector_lock:
-        if _metrics_collector is not None:
-            _metrics_collector.reset()
+    _metrics_collector.reset()
 
 
 def instrument_tool(func: F) -> F:
@@ -302,10 +422,15 @@ def instrument_tool(func: F) -> F:
             return results
     """
 
+    # Resolve everything the wrapper needs once, at decoration time. The
+    # collector singleton is never replaced, so binding its method is safe.
+    tool_name = func.__name__
+    record_call_ns = get_metrics().record_call_ns
+    perf_counter_ns = time.perf_counter_ns
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        tool_name = func.__name__
-        start_time = time.perf_counter()
+        start_ns = perf_counter_ns()
         success = True
 
         try:
@@ -315,16 +440,15 @@ def instrument_tool(func: F) -> F:
             success = False
             raise
         finally:
-            latency = time.perf_counter() - start_time
-            collector = get_metrics()
-            collector.record_call(tool_name, latency=latency, success=success)
+            latency_ns = perf_counter_ns() - start_ns
+            record_call_ns(tool_name, latency_ns, success)
 
             # Debug logging for slow calls
-            if latency > 5.0:  # Log calls taking more than 5 seconds
+            if latency_ns > 5_000_000_000:  # Log calls taking more than 5 seconds
                 logger.debug(
                     "Slow tool call: %s took %.2fs (success=%s)",
                     tool_name,
-                    latency,
+                    latency_ns / 1e9,
                     success,
                 )
 
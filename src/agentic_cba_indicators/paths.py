@@ -10,16 +10,24 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import platformdirs
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 APP_NAME = "agentic-cba-indicators"
 APP_AUTHOR = "agentic-cba"
 
 logger = logging.getLogger(__name__)
 
+# Suspicious fragments in env-var paths: traversal, home and variable expansion
+_SUSPICIOUS_PATH_PATTERN = re.compile(r"\.\.|[~$]")
+
 
 class PathSecurityError(ValueError):
     """Raised when a path fails security validation."""
@@ -45,16 +53,15 @@ def _validate_path(path_str: str, env_var_name: str) -> Path:
         PathSecurityError: If path fails validation
     """
     # Check for suspicious patterns in original input (before resolve)
-    suspicious_patterns = ["..", "~", "$"]
-    for pattern in suspicious_patterns:
-        if pattern in path_str:
-            logger.warning(
-                "Path from %s contains '%s' pattern: %s. "
-                "Path will be normalized for security.",
-                env_var_name,
-                pattern,
-                path_str,
-            )
+    # One regex scan; each distinct pattern found is reported once
+    for pattern in dict.fromkeys(_SUSPICIOUS_PATH_PATTERN.findall(path_str)):
+        logger.warning(
+            "Path from %s contains '%s' pattern: %s. "
+            "Path will be normalized for security.",
+            env_var_name,
+            pattern,
+            path_str,
+        )
 
     # Expand user (~) and resolve to absolute path (removes .., resolves symlinks)
     resolved = Path(path_str).expanduser().resolve()
@@ -68,6 +75,30 @@ def _validate_path(path_str: str, env_var_name: str) -> Path:
     return resolved
 
 
+def _resolve_dir(env_var_name: str, default: Callable[[str, str], str]) -> Path:
+    """
+    Resolve a directory from an env var override or a platformdirs default.
+
+    Args:
+        env_var_name: Environment variable that may override the location
+        default: platformdirs function giving the per-user default
+
+    Returns:
+        Path to the directory (created if it doesn't exist)
+
+    Raises:
+        PathSecurityError: If the env var value fails security validation
+    """
+    env_dir = os.environ.get(env_var_name)
+    if env_dir:
+        path = _validate_path(env_dir, env_var_name)
+    else:
+        path = Path(default(APP_NAME, APP_AUTHOR))
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 @lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """
@@ -83,14 +114,7 @@ def get_data_dir() -> Path:
     Raises:
         PathSecurityError: If AGENTIC_CBA_DATA_DIR fails security validation
     """
-    env_dir = os.environ.get("AGENTIC_CBA_DATA_DIR")
-    if env_dir:
-        data_dir = _validate_path(env_dir, "AGENTIC_CBA_DATA_DIR")
-    else:
-        data_dir = Path(platformdirs.user_data_dir(APP_NAME, APP_AUTHOR))
-
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    return _resolve_dir("AGENTIC_CBA_DATA_DIR", platformdirs.user_data_dir)
 
 
 @lru_cache(maxsize=1)
@@ -108,14 +132,7 @@ def get_config_dir() -> Path:
     Raises:
         PathSecurityError: If AGENTIC_CBA_CONFIG_DIR fails security validation
     """
-    env_dir = os.environ.get("AGENTIC_CBA_CONFIG_DIR")
-    if env_dir:
-        config_dir = _validate_path(env_dir, "AGENTIC_CBA_CONFIG_DIR")
-    else:
-        config_dir = Path(platformdirs.user_config_dir(APP_NAME, APP_AUTHOR))
-
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return _resolve_dir("AGENTIC_CBA_CONFIG_DIR", platformdirs.user_config_dir)
 
 
 @lru_cache(maxsize=1)
@@ -133,14 +150,7 @@ def get_cache_dir() -> Path:
     Raises:
         PathSecurityError: If AGENTIC_CBA_CACHE_DIR fails security validation
     """
-    env_dir = os.environ.get("AGENTIC_CBA_CACHE_DIR")
-    if env_dir:
-        cache_dir = _validate_path(env_dir, "AGENTIC_CBA_CACHE_DIR")
-    else:
-        cache_dir = Path(platformdirs.user_cache_dir(APP_NAME, APP_AUTHOR))
-
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
+    return _resolve_dir("AGENTIC_CBA_CACHE_DIR", platformdirs.user_cache_dir)
 
 
 def get_kb_path() -> Path:
@@ -8,10 +8,22 @@ from __future__ import annotations
 
 import importlib.resources
 import os
-from functools import lru_cache
 
 
-@lru_cache(maxsize=4)
+def _read_prompts() -> dict[str, str]:
+    """Read every bundled prompt file, keyed by name without the .md extension."""
+    files = importlib.resources.files("agentic_cba_indicators.prompts")
+    return {
+        entry.name.removesuffix(".md"): entry.read_text(encoding="utf-8")
+        for entry in files.iterdir()
+        if entry.name.endswith(".md") and entry.is_file()
+    }
+
+
+# The prompt set is small and fixed, so it is read once at import
+_PROMPTS: dict[str, str] = _read_prompts()
+
+
 def load_prompt(name: str) -> str:
     """
     Load a prompt file from the bundled prompts directory.
@@ -25,12 +37,10 @@ def load_prompt(name: str) -> str:
     Raises:
         FileNotFoundError: If the prompt file doesn't exist
     """
-    resource_name = f"{name}.md"
     try:
-        files = importlib.resources.files("agentic_cba_indicators.prompts")
-        return (files / resource_name).read_text(encoding="utf-8")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Prompt file not found: {resource_name}") from None
+        return _PROMPTS[name]
+    except KeyError:
+        raise FileNotFoundError(f"Prompt file not found: {name}.md") from None
 
 
 def get_system_prompt(prompt_name: str | None = None) -> str:
@@ -52,5 +62,6 @@ def get_system_prompt(prompt_name: str | None = None) -> str:
 
 
 def clear_prompt_cache() -> None:
-    """Clear cached prompts. Useful for development/testing."""
-    load_prompt.cache_clear()
+    """Re-read prompts from disk. Useful for development/testing."""
+    global _PROMPTS
+    _PROMPTS = _read_prompts()
@@ -23,7 +23,9 @@ Thread Safety:
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
+from functools import lru_cache
 from typing import Final
 
 from agentic_cba_indicators.logging_config import get_logger
@@ -58,6 +60,9 @@ _DANGEROUS_CATEGORIES: Final[frozenset[str]] = frozenset(
     }
 )
 
+# Categories that continue a grapheme cluster (marks, ZWJ and other format chars)
+_COMBINING_CATEGORIES: Final[frozenset[str]] = frozenset({"Mn", "Mc", "Me", "Cf"})
+
 # Allowed control characters (common whitespace)
 _ALLOWED_CONTROLS: Final[frozenset[str]] = frozenset(
     {
@@ -67,6 +72,11 @@ _ALLOWED_CONTROLS: Final[frozenset[str]] = frozenset(
     }
 )
 
+# Deletion table for ASCII input, where only C0 controls and DEL are dangerous
+_ASCII_CONTROL_TABLE: Final[dict[int, None]] = dict.fromkeys(
+    cp for cp in (*range(0x20), 0x7F) if chr(cp) not in _ALLOWED_CONTROLS
+)
+
 # Pattern to normalize multiple newlines to max 2
 _MULTIPLE_NEWLINES_PATTERN: Final[re.Pattern[str]] = re.compile(r"\n{3,}")
 
@@ -82,6 +92,20 @@ _INJECTION_PATTERNS: Final[tuple[re.Pattern[str], ...]] = (
     re.compile(r"Human:|Assistant:", re.IGNORECASE),  # Claude format
 )
 
+# Literal substrings (casefolded) that must appear in text for the pattern at
+# the same index to match; checking them first skips most regex searches.
+# Letters that IGNORECASE also matches outside ASCII ('i', 'k') are avoided so
+# the prefilter never rejects text the pattern would match.
+_INJECTION_PREFILTERS: Final[tuple[tuple[str, ...], ...]] = (
+    ("struct",),
+    ("struct",),
+    ("struct",),
+    ("system",),
+    ("<",),
+    ("nst]",),
+    ("human:", "stant:"),
+)
+
 
 # =============================================================================
 # Core Functions
@@ -137,6 +161,11 @@ def sanitize_user_input(
     # Strip leading/trailing whitespace
     result = text.strip()
 
+    # Clean single-line ASCII that fits needs no further work; both
+    # predicates run in C and stop at the first offending character
+    if len(result) <= max_length and result.isascii() and result.isprintable():
+        return result
+
     original_length = len(result)
 
     # Remove dangerous control characters
@@ -149,9 +178,12 @@ def sanitize_user_input(
     # Normalize whitespace (multiple newlines → double newline)
     if normalize_whitespace:
         # Normalize line endings to Unix style
-        result = result.replace("\r\n", "\n").replace("\r", "\n")
-        # Collapse multiple blank lines
-        result = _MULTIPLE_NEWLINES_PATTERN.sub("\n\n", result)
+        if "\r" in result:
+            result = result.replace("\r\n", "\n").replace("\r", "\n")
+        # Collapse multiple blank lines (substring check skips the regex in
+        # the common case where there are none)
+        if "\n\n\n" in result:
+            result = _MULTIPLE_NEWLINES_PATTERN.sub("\n\n", result)
 
     # Truncate to max length
     if len(result) > max_length:
@@ -165,8 +197,11 @@ def sanitize_user_input(
 
         # CR-0020: Avoid cutting in middle of grapheme clusters
         # Back off from combining characters (diacritics, emoji modifiers, ZWJ sequences)
-        while result and unicodedata.category(result[-1]) in ("Mn", "Mc", "Me", "Cf"):
-            result = result[:-1]
+        # Find the cut point first so the string is sliced once, not per character
+        cut = len(result)
+        while cut and unicodedata.category(result[cut - 1]) in _COMBINING_CATEGORIES:
+            cut -= 1
+        result = result[:cut]
 
         # Avoid cutting mid-word if possible
         if " " in result[-50:]:
@@ -178,6 +213,37 @@ def sanitize_user_input(
     return result
 
 
+@lru_cache(maxsize=1)
+def _control_character_pattern() -> re.Pattern[str]:
+    """Compile a character class matching every dangerous code point.
+
+    Built on first use from the running interpreter's Unicode database;
+    scanning all code points takes a few hundred milliseconds, so it is
+    deferred until non-ASCII input actually needs it.
+    """
+    ranges: list[tuple[int, int]] = []
+    start: int | None = None
+    for cp in range(sys.maxunicode + 1):
+        char = chr(cp)
+        if (
+            char not in _ALLOWED_CONTROLS
+            and unicodedata.category(char) in _DANGEROUS_CATEGORIES
+        ):
+            if start is None:
+                start = cp
+        elif start is not None:
+            ranges.append((start, cp - 1))
+            start = None
+    if start is not None:
+        ranges.append((start, sys.maxunicode))
+
+    char_class = "".join(
+        re.escape(chr(first)) + ("" if first == last else "-" + re.escape(chr(last)))
+        for first, last in ranges
+    )
+    return re.compile(f"[{char_class}]")
+
+
 def _remove_control_characters(text: str) -> str:
     """Remove dangerous Unicode control characters from text.
 
@@ -189,19 +255,9 @@ def _remove_control_characters(text: str) -> str:
     Returns:
         String with control characters removed
     """
-    result = []
-    for char in text:
-        # Keep allowed control characters
-        if char in _ALLOWED_CONTROLS:
-            result.append(char)
-            continue
-
-        # Check Unicode category
-        category = unicodedata.category(char)
-        if category not in _DANGEROUS_CATEGORIES:
-            result.append(char)
-
-    return "".join(result)
+    if text.isascii():
+        return text.translate(_ASCII_CONTROL_TABLE)
+    return _control_character_pattern().sub("", text)
 
 
 def wrap_with_delimiters(
@@ -257,10 +313,14 @@ def detect_injection_patterns(text: str) -> list[str]:
         This function is for logging/monitoring, not blocking. Many legitimate
         queries may trigger detection. Use for awareness, not enforcement.
     """
+    folded = text.casefold()
     return [
         match.group(0).lower().strip()
-        for pattern in _INJECTION_PATTERNS
-        if (match := pattern.search(text))
+        for literals, pattern in zip(
+            _INJECTION_PREFILTERS, _INJECTION_PATTERNS, strict=True
+        )
+        if any(literal in folded for literal in literals)
+        and (match := pattern.search(text))
     ]
 
 
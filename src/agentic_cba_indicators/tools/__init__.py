@@ -3,115 +3,204 @@
 from __future__ import annotations
 
 import functools
+import importlib
 import inspect
 import os
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
-from agentic_cba_indicators.audit import log_tool_invocation
+from agentic_cba_indicators.audit import is_audit_enabled, log_tool_invocation
 from agentic_cba_indicators.observability import instrument_tool
 
 from ._http import classify_error
-from ._parallel import run_tools_parallel as run_tools_parallel
 from ._timeout import timeout
-from .agriculture import (
-    get_crop_production,
-    get_forest_statistics,
-    get_land_use,
-    search_fao_indicators,
-)
-from .biodiversity import (
-    get_biodiversity_summary,
-    get_species_occurrences,
-    get_species_taxonomy,
-    search_species,
-)
-from .climate import get_climate_data, get_historical_climate
-from .commodities import (
-    compare_commodity_producers,
-    get_commodity_production,
-    get_commodity_trade,
-    list_fas_commodities,
-    search_commodity_data,
-)
-from .forestry import (
-    get_forest_carbon_stock,
-    get_forest_extent,
-    get_tree_cover_loss_by_driver,
-    get_tree_cover_loss_trends,
-)
-from .gender import (
-    compare_gender_gaps,
-    get_gender_indicators,
-    get_gender_time_series,
-    search_gender_indicators,
-)
-from .knowledge_base import (
-    compare_indicators,
-    export_indicator_selection,
-    find_feasible_methods,
-    find_indicators_by_class,
-    find_indicators_by_measurement_approach,
-    find_indicators_by_principle,
-    get_indicator_details,
-    get_knowledge_version,
-    get_usecase_details,
-    get_usecases_by_indicator,
-    list_available_classes,
-    list_indicators_by_component,
-    list_knowledge_base_stats,
-    search_indicators,
-    search_methods,
-    search_usecases,
-)
-from .labor import (
-    get_employment_by_gender,
-    get_labor_indicators,
-    get_labor_time_series,
-    search_labor_indicators,
-)
-from .nasa_power import (
-    get_agricultural_climate,
-    get_evapotranspiration,
-    get_solar_radiation,
-)
-from .sdg import (
-    get_sdg_for_cba_principle,
-    get_sdg_progress,
-    get_sdg_series_data,
-    search_sdg_indicators,
-)
-from .socioeconomic import get_country_indicators, get_world_bank_data
-from .soilgrids import get_soil_carbon, get_soil_properties, get_soil_texture
-from .weather import get_current_weather, get_weather_forecast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ._parallel import run_tools_parallel as run_tools_parallel
+    from .agriculture import (
+        get_crop_production,
+        get_forest_statistics,
+        get_land_use,
+        search_fao_indicators,
+    )
+    from .biodiversity import (
+        get_biodiversity_summary,
+        get_species_occurrences,
+        get_species_taxonomy,
+        search_species,
+    )
+    from .climate import get_climate_data, get_historical_climate
+    from .commodities import (
+        compare_commodity_producers,
+        get_commodity_production,
+        get_commodity_trade,
+        list_fas_commodities,
+        search_commodity_data,
+    )
+    from .forestry import (
+        get_forest_carbon_stock,
+        get_forest_extent,
+        get_tree_cover_loss_by_driver,
+        get_tree_cover_loss_trends,
+    )
+    from .gender import (
+        compare_gender_gaps,
+        get_gender_indicators,
+        get_gender_time_series,
+        search_gender_indicators,
+    )
+    from .knowledge_base import (
+        compare_indicators,
+        export_indicator_selection,
+        find_feasible_methods,
+        find_indicators_by_class,
+        find_indicators_by_measurement_approach,
+        find_indicators_by_principle,
+        get_indicator_details,
+        get_knowledge_version,
+        get_usecase_details,
+        get_usecases_by_indicator,
+        list_available_classes,
+        list_indicators_by_component,
+        list_knowledge_base_stats,
+        search_indicators,
+        search_methods,
+        search_usecases,
+    )
+    from .labor import (
+        get_employment_by_gender,
+        get_labor_indicators,
+        get_labor_time_series,
+        search_labor_indicators,
+    )
+    from .nasa_power import (
+        get_agricultural_climate,
+        get_evapotranspiration,
+        get_solar_radiation,
+    )
+    from .sdg import (
+        get_sdg_for_cba_principle,
+        get_sdg_progress,
+        get_sdg_series_data,
+        search_sdg_indicators,
+    )
+    from .socioeconomic import get_country_indicators, get_world_bank_data
+    from .soilgrids import get_soil_carbon, get_soil_properties, get_soil_texture
+    from .weather import get_current_weather, get_weather_forecast
+
+# Tool name -> defining submodule. Submodules (and their httpx/pandas/chromadb
+# dependencies) are imported on first access via __getattr__ below
+_TOOL_MODULES: Final[dict[str, str]] = {
+    "run_tools_parallel": "._parallel",
+    "get_crop_production": ".agriculture",
+    "get_forest_statistics": ".agriculture",
+    "get_land_use": ".agriculture",
+    "search_fao_indicators": ".agriculture",
+    "get_biodiversity_summary": ".biodiversity",
+    "get_species_occurrences": ".biodiversity",
+    "get_species_taxonomy": ".biodiversity",
+    "search_species": ".biodiversity",
+    "get_climate_data": ".climate",
+    "get_historical_climate": ".climate",
+    "compare_commodity_producers": ".commodities",
+    "get_commodity_production": ".commodities",
+    "get_commodity_trade": ".commodities",
+    "list_fas_commodities": ".commodities",
+    "search_commodity_data": ".commodities",
+    "get_forest_carbon_stock": ".forestry",
+    "get_forest_extent": ".forestry",
+    "get_tree_cover_loss_by_driver": ".forestry",
+    "get_tree_cover_loss_trends": ".forestry",
+    "compare_gender_gaps": ".gender",
+    "get_gender_indicators": ".gender",
+    "get_gender_time_series": ".gender",
+    "search_gender_indicators": ".gender",
+    "compare_indicators": ".knowledge_base",
+    "export_indicator_selection": ".knowledge_base",
+    "find_feasible_methods": ".knowledge_base",
+    "find_indicators_by_class": ".knowledge_base",
+    "find_indicators_by_measurement_approach": ".knowledge_base",
+    "find_indicators_by_principle": ".knowledge_base",
+    "get_indicator_details": ".knowledge_base",
+    "get_knowledge_version": ".knowledge_base",
+    "get_usecase_details": ".knowledge_base",
+    "get_usecases_by_indicator": ".knowledge_base",
+    "list_available_classes": ".knowledge_base",
+    "list_indicators_by_component": ".knowledge_base",
+    "list_knowledge_base_stats": ".knowledge_base",
+    "search_indicators": ".knowledge_base",
+    "search_methods": ".knowledge_base",
+    "search_usecases": ".knowledge_base",
+    "get_employment_by_gender": ".labor",
+    "get_labor_indicators": ".labor",
+    "get_labor_time_series": ".labor",
+    "search_labor_indicators": ".labor",
+    "get_agricultural_climate": ".nasa_power",
+    "get_evapotranspiration": ".nasa_power",
+    "get_solar_radiation": ".nasa_power",
+    "get_sdg_for_cba_principle": ".sdg",
+    "get_sdg_progress": ".sdg",
+    "get_sdg_series_data": ".sdg",
+    "search_sdg_indicators": ".sdg",
+    "get_country_indicators": ".socioeconomic",
+    "get_world_bank_data": ".socioeconomic",
+    "get_soil_carbon": ".soilgrids",
+    "get_soil_properties": ".soilgrids",
+    "get_soil_texture": ".soilgrids",
+    "get_current_weather": ".weather",
+    "get_weather_forecast": ".weather",
+}
 
 _DEFAULT_TOOL_TIMEOUT_SECONDS = float(os.environ.get("TOOL_DEFAULT_TIMEOUT", "30"))
 
 
+def _tool_signature(func: Callable[..., str]) -> inspect.Signature | None:
+    """Resolve a tool's signature once, or None if it cannot be introspected."""
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+
 def _extract_params(
-    func: Callable[..., str], args: tuple[Any, ...], kwargs: dict[str, Any]
+    signature: inspect.Signature | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    takes_tool_context: bool = False,
 ) -> dict[str, Any]:
     """Extract parameters for audit logging, excluding ToolContext."""
+    if signature is None:
+        return {"args": args, "kwargs": kwargs}
     try:
-        signature = inspect.signature(func)
-        bound = signature.bind_partial(*args, **kwargs)
-        params = dict(bound.arguments)
-    except (TypeError, ValueError):
-        params = {"args": args, "kwargs": kwargs}
+        # Each bind builds a fresh dict, so it is safe to return and edit
+        params = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return {"args": args, "kwargs": kwargs}
 
-    params.pop("tool_context", None)
+    if takes_tool_context:
+        params.pop("tool_context", None)
     return params
 
 
 def _wrap_with_audit(func: Callable[..., str]) -> Callable[..., str]:
     """Wrap a tool with audit logging."""
+    # Signature construction is far costlier than binding, so do it once here
+    signature = _tool_signature(func)
+    takes_tool_context = (
+        signature is not None and "tool_context" in signature.parameters
+    )
+    tool_name = getattr(func, "__name__", None) or str(func)
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> str:
-        start_time = time.perf_counter()
+        # Checked per call so audit logging can still be enabled at runtime;
+        # when it is off, skip timing, param binding and error classification
+        if not is_audit_enabled():
+            return func(*args, **kwargs)
+
+        start_ns = time.perf_counter_ns()
         success = True
         error_message: str | None = None
         result_text: str | None = None
@@ -126,10 +215,10 @@ def _wrap_with_audit(func: Callable[..., str]) -> Callable[..., str]:
             error_message = f"[category: {category}] {exc!s}"
             raise
         finally:
-            latency = time.perf_counter() - start_time
-            params = _extract_params(func, args, kwargs)
+            latency = (time.perf_counter_ns() - start_ns) / 1e9
+            params = _extract_params(signature, args, kwargs, takes_tool_context)
             log_tool_invocation(
-                tool_name=getattr(func, "__name__", str(func)),
+                tool_name=tool_name,
                 params=params,
                 result=result_text,
                 success=success,
@@ -255,116 +344,150 @@ __all__ = [
 
 
 # Reduced tool set (19 tools) - good for most models
-_REDUCED_TOOLS_RAW = (
+_REDUCED_TOOL_ORDER: Final[tuple[str, ...]] = (
     # Utility
-    run_tools_parallel,
+    "run_tools_parallel",
     # Weather
-    get_current_weather,
-    get_weather_forecast,
-    get_climate_data,
+    "get_current_weather",
+    "get_weather_forecast",
+    "get_climate_data",
     # Soil
-    get_soil_properties,
-    get_soil_carbon,
+    "get_soil_properties",
+    "get_soil_carbon",
     # Socio-economic
-    get_country_indicators,
-    get_world_bank_data,
+    "get_country_indicators",
+    "get_world_bank_data",
     # Knowledge Base - Core
-    search_indicators,
-    search_methods,
-    get_indicator_details,
-    list_knowledge_base_stats,
-    get_knowledge_version,
+    "search_indicators",
+    "search_methods",
+    "get_indicator_details",
+    "list_knowledge_base_stats",
+    "get_knowledge_version",
     # Indicator Selection
-    find_indicators_by_principle,
-    find_indicators_by_class,
-    find_feasible_methods,
-    list_available_classes,
-    compare_indicators,
-    export_indicator_selection,
+    "find_indicators_by_principle",
+    "find_indicators_by_class",
+    "find_feasible_methods",
+    "list_available_classes",
+    "compare_indicators",
+    "export_indicator_selection",
     # Use Cases
-    search_usecases,
+    "search_usecases",
 )
 
 
 # Full tool set (57 tools) - for models with large context
-_FULL_TOOLS_RAW = (
+_FULL_TOOL_ORDER: Final[tuple[str, ...]] = (
     # Utility
-    run_tools_parallel,
+    "run_tools_parallel",
     # Weather & Climate
-    get_current_weather,
-    get_weather_forecast,
-    get_climate_data,
-    get_historical_climate,
+    "get_current_weather",
+    "get_weather_forecast",
+    "get_climate_data",
+    "get_historical_climate",
     # Agricultural Climate (NASA POWER)
-    get_agricultural_climate,
-    get_solar_radiation,
-    get_evapotranspiration,
+    "get_agricultural_climate",
+    "get_solar_radiation",
+    "get_evapotranspiration",
     # Soil Properties (ISRIC SoilGrids)
-    get_soil_properties,
-    get_soil_carbon,
-    get_soil_texture,
-    search_species,  # GBIF
-    get_species_occurrences,
-    get_biodiversity_summary,
-    get_species_taxonomy,
+    "get_soil_properties",
+    "get_soil_carbon",
+    "get_soil_texture",
+    "search_species",  # GBIF
+    "get_species_occurrences",
+    "get_biodiversity_summary",
+    "get_species_taxonomy",
     # Labor Statistics (ILO)
-    get_labor_indicators,
-    get_employment_by_gender,
-    get_labor_time_series,
-    search_labor_indicators,
+    "get_labor_indicators",
+    "get_employment_by_gender",
+    "get_labor_time_series",
+    "search_labor_indicators",
     # Gender Statistics (World Bank)
-    get_gender_indicators,
-    compare_gender_gaps,
-    get_gender_time_series,
-    search_gender_indicators,
-    get_forest_statistics,  # FAO Agriculture & Forestry
-    get_crop_production,
-    get_land_use,
-    search_fao_indicators,
+    "get_gender_indicators",
+    "compare_gender_gaps",
+    "get_gender_time_series",
+    "search_gender_indicators",
+    "get_forest_statistics",  # FAO Agriculture & Forestry
+    "get_crop_production",
+    "get_land_use",
+    "search_fao_indicators",
     # Commodity Markets (USDA FAS)
-    get_commodity_production,
-    get_commodity_trade,
-    compare_commodity_producers,
-    list_fas_commodities,
-    search_commodity_data,
+    "get_commodity_production",
+    "get_commodity_trade",
+    "compare_commodity_producers",
+    "list_fas_commodities",
+    "search_commodity_data",
     # SDG Indicators (UN SDG API)
-    get_sdg_progress,
-    search_sdg_indicators,
-    get_sdg_series_data,
-    get_sdg_for_cba_principle,
+    "get_sdg_progress",
+    "search_sdg_indicators",
+    "get_sdg_series_data",
+    "get_sdg_for_cba_principle",
     # Forestry / Global Forest Watch
-    get_tree_cover_loss_trends,
-    get_tree_cover_loss_by_driver,
-    get_forest_carbon_stock,
-    get_forest_extent,
+    "get_tree_cover_loss_trends",
+    "get_tree_cover_loss_by_driver",
+    "get_forest_carbon_stock",
+    "get_forest_extent",
     # Socio-economic
-    get_country_indicators,
-    get_world_bank_data,
+    "get_country_indicators",
+    "get_world_bank_data",
     # Knowledge Base (CBA ME Indicators)
-    search_indicators,
-    search_methods,
-    get_indicator_details,
-    list_knowledge_base_stats,
-    get_knowledge_version,
+    "search_indicators",
+    "search_methods",
+    "get_indicator_details",
+    "list_knowledge_base_stats",
+    "get_knowledge_version",
     # Indicator Selection Tools
-    find_indicators_by_principle,
-    find_indicators_by_class,
-    find_indicators_by_measurement_approach,
-    find_feasible_methods,
-    list_indicators_by_component,
-    list_available_classes,
-    compare_indicators,
-    export_indicator_selection,
+    "find_indicators_by_principle",
+    "find_indicators_by_class",
+    "find_indicators_by_measurement_approach",
+    "find_feasible_methods",
+    "list_indicators_by_component",
+    "list_available_classes",
+    "compare_indicators",
+    "export_indicator_selection",
     # Use Cases
-    search_usecases,
-    get_usecase_details,
-    get_usecases_by_indicator,
+    "search_usecases",
+    "get_usecase_details",
+    "get_usecases_by_indicator",
 )
 
 
-REDUCED_TOOLS = _prepare_toolset(_REDUCED_TOOLS_RAW)
-FULL_TOOLS = _prepare_toolset(_FULL_TOOLS_RAW)
+_TOOLSETS: Final[dict[str, tuple[str, ...]]] = {
+    "REDUCED_TOOLS": _REDUCED_TOOL_ORDER,
+    "FULL_TOOLS": _FULL_TOOL_ORDER,
+}
+
+if TYPE_CHECKING:
+    REDUCED_TOOLS: tuple[Callable[..., str], ...]
+    FULL_TOOLS: tuple[Callable[..., str], ...]
+
+
+def _load_tool(name: str) -> Callable[..., str]:
+    """Import the submodule defining a tool and cache the tool on this module."""
+    module = importlib.import_module(_TOOL_MODULES[name], __name__)
+    tool: Callable[..., str] = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+@functools.cache
+def _get_toolset(name: str) -> tuple[Callable[..., str], ...]:
+    """Wrap a tool set on first use; callers usually only need one of the two."""
+    return _prepare_toolset(tuple(_load_tool(tool) for tool in _TOOLSETS[name]))
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: tools and tool sets are resolved when first accessed
+    if name in _TOOLSETS:
+        return _get_toolset(name)
+    if name in _TOOL_MODULES:
+        return _load_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 # Tool name constants for MCPClient tool_filters
-REDUCED_TOOL_NAMES: list[str] = [t.__name__ for t in _REDUCED_TOOLS_RAW]  # type: ignore[attr-defined]
-FULL_TOOL_NAMES: list[str] = [t.__name__ for t in _FULL_TOOLS_RAW]  # type: ignore[attr-defined]
+REDUCED_TOOL_NAMES: list[str] = list(_REDUCED_TOOL_ORDER)
+FULL_TOOL_NAMES: list[str] = list(_FULL_TOOL_ORDER)
@@ -10,18 +10,26 @@ Uses "polite pool" (faster rate limits) when CROSSREF_EMAIL is set.
 
 from __future__ import annotations
 
+import atexit
+import json
 import os
 import re
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import httpx
 
 from agentic_cba_indicators.config._secrets import get_api_key
 from agentic_cba_indicators.logging_config import get_logger
+from agentic_cba_indicators.paths import get_cache_dir
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
 logger = get_logger(__name__)
 
@@ -31,16 +39,70 @@ CROSSREF_TIMEOUT = float(os.environ.get("CROSSREF_TIMEOUT", "15.0"))
 
 # Rate limiting: CrossRef polite pool allows ~50 req/sec with mailto
 # Without mailto: ~1 req/sec (public pool)
-# We'll be conservative with batch operations
+# We'll be conservative with batch operations: this is the minimum interval
+# between request starts, shared by all batch workers
 CROSSREF_BATCH_DELAY = float(os.environ.get("CROSSREF_BATCH_DELAY", "0.1"))
 
+# Concurrent requests in fetch_crossref_batch, so request latency overlaps
+# with the rate-limit interval instead of adding to it
+CROSSREF_MAX_WORKERS = int(os.environ.get("CROSSREF_MAX_WORKERS", "8"))
+
+# DOIs per /works?filter=doi:...,doi:... request in fetch_crossref_batch,
+# kept small enough for the query string to stay well under URL limits
+CROSSREF_BULK_SIZE = int(os.environ.get("CROSSREF_BULK_SIZE", "20"))
+
+# On-disk cache of lookup results. DOI metadata is effectively immutable, so
+# re-running enrichment can skip the network for DOIs seen within the TTL.
+# Set CROSSREF_CACHE_TTL=0 to disable.
+CROSSREF_CACHE_TTL = float(os.environ.get("CROSSREF_CACHE_TTL", str(30 * 24 * 3600)))
+_CACHE_FILENAME = "crossref.sqlite"
+_CACHE_QUERY_CHUNK = 500  # Stay well below SQLite's bound-variable limit
+_cache_initialized: set[Path] = set()  # Cache files whose table exists
+
+# Date fields checked for the publication year, in order of preference
+_YEAR_FIELDS = ("published", "published-print", "published-online", "issued")
+
 # Pre-compiled regex for HTML tag removal (used in abstract cleanup)
 _HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 
+# Shared client so batch enrichment reuses pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per DOI
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared CrossRef client, creating it on first use."""
+    global _client
+
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=CROSSREF_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+        return _client
+
 
-@dataclass
+@atexit.register
+def close_crossref_client() -> None:
+    """Close the shared CrossRef client; runs automatically at exit."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@dataclass(slots=True)
 class CrossRefMetadata:
-    """Metadata fetched from CrossRef API for a DOI."""
+    """Metadata fetched from CrossRef API for a DOI.
+
+    Slotted, since batch enrichment holds one instance per DOI.
+    """
 
     doi: str
     title: str | None = None
@@ -100,37 +162,189 @@ class CrossRefMetadata:
         return " | ".join(parts) if parts else ""
 
 
-def fetch_crossref_metadata(doi: str) -> CrossRefMetadata | None:
+class _CacheEntry(NamedTuple):
+    """A cached lookup result, fresh or expired."""
+
+    fetched_at: float
+    metadata: CrossRefMetadata | None  # None records a "not found"
+    etag: str | None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.fetched_at < CROSSREF_CACHE_TTL
+
+
+def _cache_connect() -> sqlite3.Connection:
+    """Open the lookup cache, creating its table on first use per file."""
+    path = get_cache_dir() / _CACHE_FILENAME
+    conn = sqlite3.connect(path, timeout=30.0)
+    if path not in _cache_initialized:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS works ("
+            "doi TEXT PRIMARY KEY, fetched_at REAL NOT NULL, metadata TEXT, etag TEXT)"
+        )
+        _cache_initialized.add(path)
+    return conn
+
+
+def _cache_get(doi: str) -> _CacheEntry | None:
+    """Look up a cached result, including expired ones that can be revalidated.
+
+    Returns:
+        The cache entry, or None on a miss or when the cache is disabled
+    """
+    return _cache_get_many([doi]).get(doi)
+
+
+def _cache_get_many(dois: list[str]) -> dict[str, _CacheEntry]:
+    """Look up cached results for several DOIs over a single connection.
+
+    Rows that cannot be decoded (corrupt or from an older format) are
+    treated as misses.
+
+    Returns:
+        Mapping of the DOIs that were found to their cache entries
+    """
+    if CROSSREF_CACHE_TTL <= 0 or not dois:
+        return {}
+    rows: list[tuple[str, float, str | None, str | None]] = []
+    try:
+        with closing(_cache_connect()) as conn:
+            for start in range(0, len(dois), _CACHE_QUERY_CHUNK):
+                chunk = dois[start : start + _CACHE_QUERY_CHUNK]
+                rows.extend(
+                    conn.execute(
+                        "SELECT doi, fetched_at, metadata, etag FROM works "
+                        f"WHERE doi IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+    except sqlite3.Error as e:
+        logger.debug("CrossRef cache read failed: %s", e)
+        _cache_initialized.clear()  # Re-create the table if the file was removed
+        return {}
+
+    entries: dict[str, _CacheEntry] = {}
+    for doi, fetched_at, payload, etag in rows:
+        try:
+            metadata = CrossRefMetadata(**json.loads(payload)) if payload else None
+        except (TypeError, ValueError) as e:
+            # json.JSONDecodeError inherits from ValueError
+            logger.debug("Ignoring unreadable CrossRef cache entry %s: %s", doi, e)
+            continue
+        entries[doi] = _CacheEntry(fetched_at, metadata, etag)
+    return entries
+
+
+def _cache_put(
+    doi: str, metadata: CrossRefMetadata | None, etag: str | None = None
+) -> None:
+    """Store a lookup result (None records that the DOI is not in CrossRef)."""
+    _cache_put_many({doi: metadata}, {doi: etag})
+
+
+def _cache_put_many(
+    results: dict[str, CrossRefMetadata | None],
+    etags: dict[str, str | None] | None = None,
+) -> None:
+    """Store several lookup results in a single transaction."""
+    if CROSSREF_CACHE_TTL <= 0 or not results:
+        return
+    etags = etags or {}
+    fetched_at = time.time()
+    rows = [
+        (
+            doi,
+            fetched_at,
+            json.dumps(asdict(metadata)) if metadata is not None else None,
+            etags.get(doi),
+        )
+        for doi, metadata in results.items()
+    ]
+    try:
+        with closing(_cache_connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO works VALUES (?, ?, ?, ?)", rows)
+    except sqlite3.Error as e:
+        logger.debug("CrossRef cache write failed: %s", e)
+        _cache_initialized.clear()  # Re-create the table if the file was removed
+
+
+def _cache_touch(doi: str) -> None:
+    """Mark a revalidated entry as fresh again."""
+    try:
+        with closing(_cache_connect()) as conn, conn:
+            conn.execute(
+                "UPDATE works SET fetched_at = ? WHERE doi = ?", (time.time(), doi)
+            )
+    except sqlite3.Error as e:
+        logger.debug("CrossRef cache write failed: %s", e)
+        _cache_initialized.clear()  # Re-create the table if the file was removed
+
+
+def fetch_crossref_metadata(
+    doi: str, force_refresh: bool = False
+) -> CrossRefMetadata | None:
     """Fetch metadata from CrossRef API for a single DOI.
 
     Uses polite pool if CROSSREF_EMAIL is set (recommended for batch operations).
+    Found and not-found results are cached on disk for CROSSREF_CACHE_TTL
+    seconds; transient errors are not cached. Expired entries that carry an
+    ETag are revalidated with a conditional request.
 
     Args:
         doi: Normalized DOI (e.g., "10.1016/j.agee.2020.106989")
+        force_refresh: Skip the cache lookup and always query CrossRef
 
     Returns:
         CrossRefMetadata if found, None if DOI not in CrossRef or error
     """
+    cached = None if force_refresh else _cache_get(doi)
+    if cached is not None and cached.fresh:
+        return cached.metadata
+    return _request_crossref_metadata(doi, cached)
+
+
+def _request_crossref_metadata(
+    doi: str, stale: _CacheEntry | None = None
+) -> CrossRefMetadata | None:
+    """Query CrossRef for a DOI and cache the outcome.
+
+    Args:
+        doi: Normalized DOI
+        stale: Expired cache entry; if it has an ETag, the request is made
+            conditional and a 304 reuses the cached metadata without a body
+    """
     params: dict[str, str] = {}
     crossref_email = get_api_key("crossref")
     if crossref_email:
         params["mailto"] = crossref_email
 
+    headers: dict[str, str] = {}
+    if stale is not None and stale.etag:
+        headers["If-None-Match"] = stale.etag
+
     try:
-        with httpx.Client(timeout=CROSSREF_TIMEOUT) as client:
-            response = client.get(
-                f"{CROSSREF_BASE}/works/{doi}",
-                params=params,
-            )
+        response = _get_client().get(
+            f"{CROSSREF_BASE}/works/{doi}",
+            params=params,
+            headers=headers,
+        )
+
+        if response.status_code == 304 and stale is not None:
+            _cache_touch(doi)
+            return stale.metadata
 
-            if response.status_code == 404:
-                logger.debug("DOI not found in CrossRef: %s", doi)
-                return None
+        if response.status_code == 404:
+            logger.debug("DOI not found in CrossRef: %s", doi)
+            _cache_put(doi, None)
+            return None
 
-            response.raise_for_status()
-            data = response.json().get("message", {})
+        response.raise_for_status()
+        data = response.json().get("message", {})
 
-            return _parse_crossref_response(doi, data)
+        metadata = _parse_crossref_response(doi, data)
+        _cache_put(doi, metadata, response.headers.get("ETag"))
+        return metadata
 
     except httpx.TimeoutException:
         logger.warning("CrossRef timeout for DOI: %s", doi)
@@ -144,23 +358,88 @@ def fetch_crossref_metadata(doi: str) -> CrossRefMetadata | None:
         return None
 
 
+def _request_crossref_bulk(
+    dois: list[str],
+) -> dict[str, CrossRefMetadata | None] | None:
+    """Query CrossRef for several DOIs in one request and cache the outcomes.
+
+    Uses the /works filter endpoint with one ``doi:`` clause per DOI. DOIs
+    absent from the response are not in CrossRef, as with a 404 from the
+    single-work endpoint.
+
+    Args:
+        dois: Normalized DOIs, none containing a comma
+
+    Returns:
+        Dict mapping each DOI to its metadata (or None if not found), or None
+        if the request failed and the DOIs should be retried individually
+    """
+    params: dict[str, str] = {
+        "filter": ",".join(f"doi:{doi}" for doi in dois),
+        "rows": str(len(dois)),
+    }
+    crossref_email = get_api_key("crossref")
+    if crossref_email:
+        params["mailto"] = crossref_email
+
+    try:
+        response = _get_client().get(f"{CROSSREF_BASE}/works", params=params)
+        response.raise_for_status()
+        items = response.json().get("message", {}).get("items", [])
+    except httpx.TimeoutException:
+        logger.warning("CrossRef timeout for bulk lookup of %d DOIs", len(dois))
+        return None
+    except httpx.HTTPStatusError as e:
+        logger.warning(
+            "CrossRef HTTP error for bulk lookup of %d DOIs: %s",
+            len(dois),
+            e.response.status_code,
+        )
+        return None
+    except (ValueError, AttributeError):
+        # json.JSONDecodeError inherits from ValueError
+        logger.warning("CrossRef returned invalid JSON for bulk lookup")
+        return None
+
+    # DOIs are case-insensitive and CrossRef may return a different case
+    items_by_doi = {str(item.get("DOI", "")).lower(): item for item in items}
+    found: dict[str, CrossRefMetadata | None] = {}
+    cacheable: dict[str, CrossRefMetadata | None] = {}
+    for doi in dois:
+        item = items_by_doi.get(doi.lower())
+        if not item:
+            found[doi] = cacheable[doi] = None
+            continue
+        try:
+            found[doi] = cacheable[doi] = _parse_crossref_response(doi, item)
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+            # One malformed item must not sink the batch; not cached, so a
+            # later run retries it
+            logger.warning("CrossRef returned a malformed record for %s: %s", doi, e)
+            found[doi] = None
+    _cache_put_many(cacheable)
+    return found
+
+
 def _parse_crossref_response(doi: str, data: dict[str, Any]) -> CrossRefMetadata:
     """Parse CrossRef API response into CrossRefMetadata."""
     # Extract authors
     authors = []
-    for author in data.get("author", []):
-        given = author.get("given", "")
-        family = author.get("family", "")
-        name = f"{given} {family}".strip()
+    for author in data.get("author", ()):
+        given = author.get("given")
+        family = author.get("family")
+        # Only join when both parts are present, so nothing needs stripping
+        name = f"{given} {family}" if given and family else given or family
         if name:
             authors.append(name)
 
     # Extract year from various date fields
     year = None
-    for date_field in ["published", "published-print", "published-online", "issued"]:
-        if date_field in data:
-            date_parts = data[date_field].get("date-parts", [[]])
-            if date_parts and date_parts[0] and len(date_parts[0]) > 0:
+    for date_field in _YEAR_FIELDS:
+        date_value = data.get(date_field)
+        if date_value:
+            date_parts = date_value.get("date-parts")
+            if date_parts and date_parts[0]:
                 year = int(date_parts[0][0])
                 break
 
@@ -205,46 +484,122 @@ def _parse_crossref_response(doi: str, data: dict[str, Any]) -> CrossRefMetadata
 def fetch_crossref_batch(
     dois: list[str],
     progress_callback: Callable[..., None] | None = None,
+    force_refresh: bool = False,
 ) -> dict[str, CrossRefMetadata | None]:
     """Fetch metadata for multiple DOIs with rate limiting.
 
+    DOIs are looked up CROSSREF_BULK_SIZE at a time through the /works
+    filter endpoint. Requests run concurrently on up to CROSSREF_MAX_WORKERS
+    threads, with request starts spaced at least CROSSREF_BATCH_DELAY seconds
+    apart. DOIs answered from the on-disk cache do not consume a request slot.
+
     Args:
         dois: List of normalized DOIs
-        progress_callback: Optional callback for progress reporting.
+        progress_callback: Optional callback for progress reporting, called
+            from the calling thread once per distinct DOI as it completes.
             Can accept 2 args: (current, total)
             Or 4 args: (current, total, doi, found)
+        force_refresh: Skip the cache lookup and always query CrossRef
 
     Returns:
-        Dict mapping DOI -> CrossRefMetadata (or None if not found)
+        Dict mapping DOI -> CrossRefMetadata (or None if not found), in the
+        order of ``dois``
     """
     import inspect
-    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    results: dict[str, CrossRefMetadata | None] = {}
-    total = len(dois)
+    results: dict[str, CrossRefMetadata | None] = dict.fromkeys(dois)
+    total = len(results)
+    if not total:
+        return results
 
-    # Detect callback signature
-    use_extended_callback = False
+    # Resolve the callback shape once so the result loop calls it directly
+    report: Callable[[int, str, bool], None] | None = None
     if progress_callback:
+        use_extended_callback = False
         try:
             sig = inspect.signature(progress_callback)
             use_extended_callback = len(sig.parameters) >= 4
         except (ValueError, TypeError):
             pass
 
-    for i, doi in enumerate(dois):
-        metadata = fetch_crossref_metadata(doi)
-        results[doi] = metadata
-        found = metadata is not None
+        callback = progress_callback
 
-        if progress_callback:
-            if use_extended_callback:
-                progress_callback(i + 1, total, doi, found)
-            else:
-                progress_callback(i + 1, total)
+        def report_extended(current: int, doi: str, found: bool) -> None:
+            callback(current, total, doi, found)
 
-        # Rate limiting between requests
-        if i < total - 1 and CROSSREF_BATCH_DELAY > 0:
-            time.sleep(CROSSREF_BATCH_DELAY)
+        def report_basic(current: int, doi: str, found: bool) -> None:
+            callback(current, total)
+
+        report = report_extended if use_extended_callback else report_basic
+
+    completed = 0
+
+    def _complete(doi: str, metadata: CrossRefMetadata | None) -> None:
+        nonlocal completed
+        results[doi] = metadata
+        completed += 1
+        if report:
+            report(completed, doi, metadata is not None)
+
+    # Commas separate filter clauses, so DOIs containing one are looked up
+    # individually, as are expired entries that can be revalidated by ETag;
+    # the rest go in groups through the filter endpoint
+    singles: list[str] = []
+    bulk: list[str] = []
+    stale: dict[str, _CacheEntry] = {}
+    cache = {} if force_refresh else _cache_get_many(list(results))
+    for doi in results:
+        cached = cache.get(doi)
+        if cached is not None:
+            if cached.fresh:
+                _complete(doi, cached.metadata)
+                continue
+            stale[doi] = cached
+        if "," in doi or (cached is not None and cached.etag):
+            singles.append(doi)
+        else:
+            bulk.append(doi)
+
+    chunks = [[doi] for doi in singles] + [
+        bulk[i : i + CROSSREF_BULK_SIZE]
+        for i in range(0, len(bulk), CROSSREF_BULK_SIZE)
+    ]
+    if not chunks:
+        return results
+
+    # Each worker reserves the next start slot under the lock, then sleeps
+    # until that slot outside the lock
+    next_start = time.monotonic()
+    slot_lock = threading.Lock()
+
+    def _wait_for_slot() -> None:
+        nonlocal next_start
+        with slot_lock:
+            now = time.monotonic()
+            start = max(now, next_start)
+            next_start = start + CROSSREF_BATCH_DELAY
+        if start > now:
+            time.sleep(start - now)
+
+    def _fetch(chunk: list[str]) -> dict[str, CrossRefMetadata | None]:
+        if len(chunk) > 1:
+            _wait_for_slot()
+            found = _request_crossref_bulk(chunk)
+            if found is not None:
+                return found
+        # Single DOI, or the bulk request failed: fall back to per-DOI lookups
+        individual: dict[str, CrossRefMetadata | None] = {}
+        for doi in chunk:
+            _wait_for_slot()
+            individual[doi] = _request_crossref_metadata(doi, stale.get(doi))
+        return individual
+
+    max_workers = max(1, min(CROSSREF_MAX_WORKERS, len(chunks)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_fetch, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            for doi, metadata in future.result().items():
+                _complete(doi, metadata)
 
     return results
@@ -10,16 +10,35 @@ Supports both local Ollama and Ollama Cloud with TLS validation.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import os
+import sqlite3
+import struct
 import threading
 import time
 import warnings
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
 from agentic_cba_indicators.logging_config import get_logger
+from agentic_cba_indicators.paths import get_cache_dir
+
+# orjson parses large embedding payloads several times faster than the
+# stdlib decoder; it is optional and response.json() is used without it.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None  # type: ignore[assignment]
 
 # Module logger
 logger = get_logger(__name__)
@@ -42,6 +61,9 @@ EMBEDDING_DIMENSIONS: dict[str, int] = {
     "all-minilm:33m": 384,
 }
 
+# EMBEDDING_MODEL is fixed at import, so resolve its dimension once
+_EXPECTED_DIMENSIONS = EMBEDDING_DIMENSIONS.get(EMBEDDING_MODEL, 1024)
+
 
 def get_expected_dimensions() -> int:
     """
@@ -50,13 +72,13 @@ def get_expected_dimensions() -> int:
     Returns:
         Expected dimension count for EMBEDDING_MODEL, or 1024 as default
     """
-    return EMBEDDING_DIMENSIONS.get(EMBEDDING_MODEL, 1024)
+    return _EXPECTED_DIMENSIONS
 
 
 # Rate limiting for embedding calls (prevents flooding Ollama)
 # Default: max 10 calls/second (0.1s between calls)
 _MIN_EMBEDDING_INTERVAL = float(os.environ.get("OLLAMA_MIN_INTERVAL", "0.1"))
-_last_embedding_time: float = 0.0
+_next_embedding_time: float = 0.0  # Earliest start for the next call
 _rate_limit_lock = threading.Lock()  # Thread-safe rate limiting (CR-0015)
 
 # Retry settings for embedding calls
@@ -74,10 +96,61 @@ _BATCH_EMBEDDING_TIMEOUT = float(
     os.environ.get("OLLAMA_BATCH_EMBEDDING_TIMEOUT", "120.0")
 )
 
+# Concurrent single-text requests when a batch has to fall back
+_FALLBACK_CONCURRENCY = int(os.environ.get("OLLAMA_FALLBACK_CONCURRENCY", "8"))
+
+# Large batches are split into requests of at most this many estimated
+# tokens (~4 chars each), sent up to OLLAMA_BATCH_PARALLELISM at a time
+_BATCH_TOKEN_BUDGET = int(os.environ.get("OLLAMA_BATCH_TOKEN_BUDGET", "32768"))
+_BATCH_PARALLELISM = int(os.environ.get("OLLAMA_BATCH_PARALLELISM", "4"))
+
 # Minimum acceptable embedding dimension
 # Most models produce 768+ dimensions; 64 is a sanity check for valid embeddings
 _MIN_EMBEDDING_DIMENSION = 64
 
+# Embedding cache: identical (model, text) pairs are only embedded once.
+# Recent vectors are kept in memory; all of them are persisted to SQLite
+# (default: <cache dir>/embeddings.sqlite) as float16, which halves the
+# store at a cosine similarity of ~0.9999999 to the original vector.
+# Set OLLAMA_EMBED_CACHE_PATH to an empty string to disable the cache.
+_EMBED_CACHE_PATH = os.environ.get("OLLAMA_EMBED_CACHE_PATH")
+_EMBED_CACHE_MEMORY_SIZE = 1024
+_EMBED_CACHE_QUERY_CHUNK = 500  # Stay well below SQLite's bound-variable limit
+_embed_memory_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+_embed_cache_lock = threading.Lock()
+
+
+# Shared client so calls reuse pooled keep-alive connections to Ollama
+# instead of paying a TCP/TLS handshake per request
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared Ollama client, creating it on first use."""
+    global _client
+
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=_EMBEDDING_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+        return _client
+
+
+@atexit.register
+def close_embedding_client() -> None:
+    """Close the shared Ollama client; runs automatically at exit."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
 
 class EmbeddingError(Exception):
     """Raised when embedding generation fails."""
@@ -110,8 +183,24 @@ def _validate_ollama_tls() -> None:
         )
 
 
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)  # JSONDecodeError subclass
+    return response.json()
+
+
+@lru_cache(maxsize=1)
 def _get_ollama_headers() -> dict[str, str]:
-    """Get headers for Ollama API requests, including auth if API key is set."""
+    """Get headers for Ollama API requests, including auth if API key is set.
+
+    The settings are fixed at import, so this (and the TLS check) runs once.
+    The returned dict is shared and must not be modified.
+    """
     _validate_ollama_tls()  # Check TLS before returning headers with API key
     headers = {"Content-Type": "application/json"}
     if OLLAMA_API_KEY:
@@ -119,14 +208,136 @@ def _get_ollama_headers() -> dict[str, str]:
     return headers
 
 
+def _embedding_cache_key(text: str) -> bytes:
+    """Content address for a text embedded with the configured model."""
+    return hashlib.blake2b(
+        f"{EMBEDDING_MODEL}\0{text}".encode(), digest_size=16
+    ).digest()
+
+
+def _embed_cache_path() -> Path | None:
+    """Resolve the on-disk cache location, or None when caching is disabled."""
+    if _EMBED_CACHE_PATH is None:
+        return get_cache_dir() / "embeddings.sqlite"
+    return Path(_EMBED_CACHE_PATH) if _EMBED_CACHE_PATH else None
+
+
+def _encode_vector(vector: list[float]) -> bytes:
+    """Pack a vector as little-endian float16 (float32 if out of range)."""
+    try:
+        return struct.pack(f"<{len(vector)}e", *vector)
+    except OverflowError:
+        return array("f", vector).tobytes()
+
+
+def _decode_vector(blob: bytes, dim: int) -> list[float]:
+    """Unpack a stored vector; the blob size tells float16 from float32."""
+    if len(blob) == 2 * dim:
+        return list(struct.unpack(f"<{dim}e", blob))
+    return array("f", blob).tolist()
+
+
+def _embed_cache_connect(path: Path) -> sqlite3.Connection:
+    """Open the embedding cache, creating its table if needed."""
+    conn = sqlite3.connect(path, timeout=30.0)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings ("
+        "key BLOB PRIMARY KEY, model TEXT NOT NULL, dim INTEGER NOT NULL, "
+        "vec BLOB NOT NULL)"
+    )
+    return conn
+
+
+def _embed_cache_get(keys: list[bytes]) -> dict[bytes, list[float]]:
+    """Look up cached embeddings, checking memory before disk.
+
+    Returns:
+        Mapping of the keys that were found to their vectors
+    """
+    path = _embed_cache_path()
+    if path is None:
+        return {}
+
+    found: dict[bytes, list[float]] = {}
+    with _embed_cache_lock:
+        for key in keys:
+            vector = _embed_memory_cache.get(key)
+            if vector is not None:
+                _embed_memory_cache.move_to_end(key)
+                found[key] = vector
+
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+    if not missing:
+        return found
+
+    loaded: dict[bytes, list[float]] = {}
+    try:
+        with closing(_embed_cache_connect(path)) as conn:
+            for start in range(0, len(missing), _EMBED_CACHE_QUERY_CHUNK):
+                chunk = missing[start : start + _EMBED_CACHE_QUERY_CHUNK]
+                rows = conn.execute(
+                    "SELECT key, dim, vec FROM embeddings WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, dim, blob in rows:
+                    loaded[key] = _decode_vector(blob, dim)
+    except sqlite3.Error as e:
+        logger.debug("Embedding cache read failed: %s", e)
+
+    if loaded:
+        _embed_cache_remember(loaded)
+        found.update(loaded)
+    return found
+
+
+def _embed_cache_remember(vectors: dict[bytes, list[float]]) -> None:
+    """Add vectors to the in-memory LRU, evicting the oldest entries."""
+    with _embed_cache_lock:
+        _embed_memory_cache.update(vectors)
+        for key in vectors:
+            _embed_memory_cache.move_to_end(key)
+        while len(_embed_memory_cache) > _EMBED_CACHE_MEMORY_SIZE:
+            _embed_memory_cache.popitem(last=False)
+
+
+def _embed_cache_put(vectors: dict[bytes, list[float]]) -> None:
+    """Store freshly generated embeddings in memory and on disk."""
+    path = _embed_cache_path()
+    if path is None or not vectors:
+        return
+    _embed_cache_remember(vectors)
+    try:
+        with closing(_embed_cache_connect(path)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                [
+                    (key, EMBEDDING_MODEL, len(vector), _encode_vector(vector))
+                    for key, vector in vectors.items()
+                ],
+            )
+    except (sqlite3.Error, struct.error, TypeError, OverflowError) as e:
+        logger.debug("Embedding cache write failed: %s", e)
+
+
+def clear_embedding_cache() -> None:
+    """Clear the in-memory embedding cache (the on-disk store is kept)."""
+    with _embed_cache_lock:
+        _embed_memory_cache.clear()
+
+
 def get_embedding(text: str) -> list[float]:
     """Generate embedding for a single text using Ollama (local or cloud).
 
-    Includes rate limiting to prevent flooding the embedding service.
-    Rate limit is configurable via OLLAMA_MIN_INTERVAL env var (default: 0.1s).
+    Empty or whitespace-only text yields a zero vector, and previously
+    embedded texts are served from the embedding cache, both without
+    contacting Ollama. Otherwise includes rate limiting to prevent flooding
+    the embedding service. Rate limit is configurable via OLLAMA_MIN_INTERVAL
+    env var (default: 0.1s).
 
     Thread Safety:
-        Rate limiting is thread-safe via _rate_limit_lock.
+        Callers reserve their start slot under _rate_limit_lock and wait
+        for it outside the lock, so concurrent callers sleep in parallel.
 
     Args:
         text: Text to generate embedding for
@@ -137,56 +348,66 @@ def get_embedding(text: str) -> list[float]:
     Raises:
         EmbeddingError: If embedding generation fails after retries
     """
-    global _last_embedding_time
+    global _next_embedding_time
+
+    # Blank text carries no meaning; don't spend a model call on it
+    if not text.strip():
+        return [0.0] * get_expected_dimensions()
+
+    cache_key = _embedding_cache_key(text)
+    cached = _embed_cache_get([cache_key]).get(cache_key)
+    if cached is not None:
+        return cached
 
     # Thread-safe rate limiting (CR-0015 fix)
     with _rate_limit_lock:
         now = time.monotonic()
-        elapsed = now - _last_embedding_time
-        if elapsed < _MIN_EMBEDDING_INTERVAL:
-            time.sleep(_MIN_EMBEDDING_INTERVAL - elapsed)
-        _last_embedding_time = time.monotonic()
+        start = max(now, _next_embedding_time)
+        _next_embedding_time = start + _MIN_EMBEDDING_INTERVAL
+    if start > now:
+        time.sleep(start - now)
 
     last_error: Exception | None = None
 
     for attempt in range(_EMBEDDING_RETRIES + 1):
         try:
-            with httpx.Client(timeout=_EMBEDDING_TIMEOUT) as client:
-                response = client.post(
-                    f"{OLLAMA_HOST}/api/embed",
-                    json={"model": EMBEDDING_MODEL, "input": text},
-                    headers=_get_ollama_headers(),
-                )
-                response.raise_for_status()
+            response = _get_client().post(
+                f"{OLLAMA_HOST}/api/embed",
+                json={"model": EMBEDDING_MODEL, "input": text},
+                headers=_get_ollama_headers(),
+                timeout=_EMBEDDING_TIMEOUT,
+            )
+            response.raise_for_status()
 
-                # Parse and validate response
-                data = response.json()
+            # Parse and validate response
+            data = _decode_json(response)
 
-                if "embeddings" not in data:
-                    raise EmbeddingError(
-                        f"Ollama response missing 'embeddings' field. Got keys: {list(data.keys())}"
-                    )
+            if "embeddings" not in data:
+                raise EmbeddingError(
+                    f"Ollama response missing 'embeddings' field. Got keys: {list(data.keys())}"
+                )
 
-                embeddings = data["embeddings"]
-                if not embeddings or not isinstance(embeddings, list):
-                    raise EmbeddingError(
-                        f"Ollama returned empty or invalid embeddings: {type(embeddings)}"
-                    )
+            embeddings = data["embeddings"]
+            if not embeddings or not isinstance(embeddings, list):
+                raise EmbeddingError(
+                    f"Ollama returned empty or invalid embeddings: {type(embeddings)}"
+                )
 
-                embedding = embeddings[0]
-                if not embedding or not isinstance(embedding, list):
-                    raise EmbeddingError(
-                        f"Ollama embedding is empty or invalid: {type(embedding)}"
-                    )
+            embedding = embeddings[0]
+            if not embedding or not isinstance(embedding, list):
+                raise EmbeddingError(
+                    f"Ollama embedding is empty or invalid: {type(embedding)}"
+                )
 
-                # Validate embedding dimensions (bge-m3 is 1024-dimensional)
-                # Allow flexibility for other models (minimum 64 dimensions)
-                if len(embedding) < _MIN_EMBEDDING_DIMENSION:
-                    raise EmbeddingError(
-                        f"Embedding dimension too small: {len(embedding)} (expected >= {_MIN_EMBEDDING_DIMENSION})"
-                    )
+            # Validate embedding dimensions (bge-m3 is 1024-dimensional)
+            # Allow flexibility for other models (minimum 64 dimensions)
+            if len(embedding) < _MIN_EMBEDDING_DIMENSION:
+                raise EmbeddingError(
+                    f"Embedding dimension too small: {len(embedding)} (expected >= {_MIN_EMBEDDING_DIMENSION})"
+                )
 
-                return embedding
+            _embed_cache_put({cache_key: embedding})
+            return embedding
 
         except httpx.TimeoutException as e:
             last_error = e
@@ -229,18 +450,24 @@ def get_embedding(text: str) -> list[float]:
 
 
 def get_embeddings_batch(
-    texts: list[str], *, strict: bool = False
+    texts: list[str], *, strict: bool = False, use_cache: bool = True
 ) -> list[list[float] | None]:
     """Generate embeddings for a batch of texts using Ollama (local or cloud).
 
     Designed for bulk ingestion with:
     - Automatic text truncation for long documents
-    - Fallback to individual embedding if batch fails
+    - Cached embeddings reused, so only new texts are sent to Ollama
+    - Large batches split by estimated tokens (OLLAMA_BATCH_TOKEN_BUDGET)
+      and sent concurrently
+    - Zero vectors for empty or whitespace-only texts
+    - Fallback to individual embedding for texts the batch did not embed
     - Optional strict mode that raises on failures
 
     Args:
         texts: List of texts to generate embeddings for
         strict: If True, raise on any embedding failure; if False, return None for failures
+        use_cache: If False, skip the cache lookup and always call Ollama
+            (e.g. for connectivity checks); fresh results are still cached
 
     Returns:
         List of embeddings (or None for failed texts if not strict)
@@ -254,81 +481,171 @@ def get_embeddings_batch(
         for text in texts
     ]
 
+    keys = [_embedding_cache_key(text) for text in truncated_texts]
+    cached = _embed_cache_get(keys) if use_cache else {}
+    results: list[list[float] | None] = [cached.get(key) for key in keys]
+    missing: list[int] = []
+    for i, vector in enumerate(results):
+        if vector is not None:
+            continue
+        if truncated_texts[i].strip():
+            missing.append(i)
+        else:
+            results[i] = [0.0] * get_expected_dimensions()
+    if not missing:
+        return results
+
+    sub_batches = _split_by_token_budget(missing, truncated_texts)
+
+    def _embed_sub_batch(indices: list[int]) -> list[list[float] | None]:
+        return _request_embeddings_batch(
+            [truncated_texts[i] for i in indices], indices, strict=strict
+        )
+
+    if len(sub_batches) == 1:
+        embedded = [_embed_sub_batch(sub_batches[0])]
+    else:
+        max_workers = max(1, min(_BATCH_PARALLELISM, len(sub_batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            embedded = list(executor.map(_embed_sub_batch, sub_batches))
+
+    fresh: dict[bytes, list[float]] = {}
+    for indices, embeddings in zip(sub_batches, embedded, strict=True):
+        for i, embedding in zip(indices, embeddings, strict=True):
+            results[i] = embedding
+            if embedding is not None:
+                fresh[keys[i]] = embedding
+    _embed_cache_put(fresh)
+    return results
+
+
+def _split_by_token_budget(indices: list[int], texts: list[str]) -> list[list[int]]:
+    """Greedily group text indices into sub-batches within the token budget.
+
+    Tokens are estimated at ~4 characters each. Every sub-batch holds at
+    least one text, so a single oversized text is still sent on its own.
+    """
+    sub_batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for i in indices:
+        tokens = len(texts[i]) // 4 + 1
+        if current and current_tokens + tokens > _BATCH_TOKEN_BUDGET:
+            sub_batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        sub_batches.append(current)
+    return sub_batches
+
+
+def _request_embeddings_batch(
+    truncated_texts: list[str], doc_indices: list[int], *, strict: bool
+) -> list[list[float] | None]:
+    """POST a batch of (already truncated) texts to Ollama's embed endpoint.
+
+    ``doc_indices`` holds each text's position in the caller's input, so
+    per-document errors name the caller's index rather than the batch slot.
+    """
     headers = _get_ollama_headers()
+    client = _get_client()
+
+    def _embed_one(i: int, text: str) -> list[float] | None:
+        try:
+            single_resp = client.post(
+                f"{OLLAMA_HOST}/api/embed",
+                json={"model": EMBEDDING_MODEL, "input": text},
+                headers=headers,
+                timeout=_EMBEDDING_TIMEOUT,
+            )
+            single_resp.raise_for_status()
+            try:
+                payload = _decode_json(single_resp)
+            except json.JSONDecodeError as e:
+                raise RuntimeError("Embedding response invalid JSON") from e
+            return payload["embeddings"][0]
+        except (
+            httpx.HTTPError,
+            KeyError,
+            IndexError,
+            TypeError,
+            RuntimeError,
+        ) as e:
+            if strict:
+                raise RuntimeError(
+                    f"Embedding failed for doc {doc_indices[i]} (len={len(text)})"
+                ) from e
+            logger.debug(
+                "Individual embedding failed for doc %d (len=%d): %s",
+                doc_indices[i],
+                len(text),
+                e,
+            )
+            return None
 
     def _fallback_to_individual(
-        client: httpx.Client,
+        results: list[list[float] | None], indices: list[int]
     ) -> list[list[float] | None]:
         logger.debug(
-            "Falling back to individual embedding for %d texts",
+            "Falling back to individual embedding for %d of %d texts",
+            len(indices),
             len(truncated_texts),
         )
-        embeddings: list[list[float] | None] = []
-        for i, text in enumerate(truncated_texts):
-            try:
-                single_resp = client.post(
-                    f"{OLLAMA_HOST}/api/embed",
-                    json={"model": EMBEDDING_MODEL, "input": text},
-                    headers=headers,
-                )
-                single_resp.raise_for_status()
-                try:
-                    payload = single_resp.json()
-                except json.JSONDecodeError as e:
-                    raise RuntimeError("Embedding response invalid JSON") from e
-                embeddings.append(payload["embeddings"][0])
-            except (
-                httpx.HTTPError,
-                KeyError,
-                IndexError,
-                TypeError,
-                RuntimeError,
-            ) as e:
-                if strict:
-                    raise RuntimeError(
-                        f"Embedding failed for doc {i} (len={len(text)})"
-                    ) from e
-                logger.debug(
-                    "Individual embedding failed for doc %d (len=%d): %s",
-                    i,
-                    len(text),
-                    e,
-                )
-                embeddings.append(None)
-        return embeddings
-
-    with httpx.Client(timeout=_BATCH_EMBEDDING_TIMEOUT) as client:
-        response = client.post(
-            f"{OLLAMA_HOST}/api/embed",
-            json={"model": EMBEDDING_MODEL, "input": truncated_texts},
-            headers=headers,
-        )
-        if response.status_code != 200:
-            # Fall back to individual embedding if batch fails
-            logger.debug(
-                "Batch embedding failed (HTTP %d), falling back to individual embedding for %d texts",
-                response.status_code,
-                len(truncated_texts),
+        # Requests run concurrently on the shared client; map() keeps the
+        # input order and, in strict mode, raises the first failing doc's error
+        max_workers = max(1, min(_FALLBACK_CONCURRENCY, len(indices)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            embeddings = executor.map(
+                _embed_one, indices, [truncated_texts[i] for i in indices]
             )
-            return _fallback_to_individual(client)
+            for i, embedding in zip(indices, embeddings, strict=True):
+                results[i] = embedding
+        return results
+
+    count = len(truncated_texts)
+    response = client.post(
+        f"{OLLAMA_HOST}/api/embed",
+        json={"model": EMBEDDING_MODEL, "input": truncated_texts},
+        headers=headers,
+        timeout=_BATCH_EMBEDDING_TIMEOUT,
+    )
+    if response.status_code != 200:
+        # Fall back to individual embedding if batch fails
+        logger.debug(
+            "Batch embedding failed (HTTP %d), falling back to individual embedding for %d texts",
+            response.status_code,
+            count,
+        )
+        return _fallback_to_individual([None] * count, list(range(count)))
 
-        try:
-            payload = response.json()
-        except json.JSONDecodeError as e:
-            if strict:
-                raise RuntimeError("Embedding response invalid JSON") from e
-            logger.debug(
-                "Batch embedding returned invalid JSON, falling back to individual embedding"
-            )
-            return _fallback_to_individual(client)
+    try:
+        payload = _decode_json(response)
+    except json.JSONDecodeError as e:
+        if strict:
+            raise RuntimeError("Embedding response invalid JSON") from e
+        logger.debug(
+            "Batch embedding returned invalid JSON, falling back to individual embedding"
+        )
+        return _fallback_to_individual([None] * count, list(range(count)))
 
-        batch_embeddings = payload.get("embeddings")
-        if not isinstance(batch_embeddings, list) or len(batch_embeddings) != len(
-            truncated_texts
-        ):
-            message = "Embedding response invalid or incomplete"
-            if strict:
-                raise RuntimeError(message)
-            return [None] * len(truncated_texts)
+    batch_embeddings = payload.get("embeddings") if isinstance(payload, dict) else None
+    if not isinstance(batch_embeddings, list) or len(batch_embeddings) > count:
+        batch_embeddings = []
+
+    # Keep whatever the batch did embed and only retry the missing texts
+    results: list[list[float] | None] = [
+        embedding if isinstance(embedding, list) and embedding else None
+        for embedding in batch_embeddings
+    ]
+    results.extend([None] * (count - len(results)))
+    missing = [i for i, embedding in enumerate(results) if embedding is None]
+    if missing:
+        logger.debug(
+            "Embedding response invalid or incomplete (%d of %d missing)",
+            len(missing),
+            count,
+        )
+        return _fallback_to_individual(results, missing)
 
-        return batch_embeddings
+    return results
@@ -21,6 +21,7 @@ import streamlit as st
 from strands import Agent
 from strands.agent.conversation_manager import SlidingWindowConversationManager
 
+from agentic_cba_indicators import tools as cba_tools
 from agentic_cba_indicators.config import (
     AgentConfig,
     ProviderConfig,
@@ -36,7 +37,6 @@ from agentic_cba_indicators.memory import (
 )
 from agentic_cba_indicators.prompts import get_system_prompt
 from agentic_cba_indicators.security import sanitize_pdf_context, sanitize_user_input
-from agentic_cba_indicators.tools import FULL_TOOLS, REDUCED_TOOLS
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Sequence
@@ -392,7 +392,7 @@ def create_agent_for_ui(
 
     model = create_model(provider_config)
 
-    tools = FULL_TOOLS if tool_set == "full" else REDUCED_TOOLS
+    tools = cba_tools.FULL_TOOLS if tool_set == "full" else cba_tools.REDUCED_TOOLS
     system_prompt = get_system_prompt(agent_config.prompt_name)
 
     # CR-0009: Calculate system_prompt_budget to match CLI behavior
@@ -595,9 +595,9 @@ def render_sidebar() -> tuple[str, str]:
         options=["reduced", "full"],
         index=0,
         format_func=lambda x: (
-            f"Reduced ({len(REDUCED_TOOLS)} tools)"
+            f"Reduced ({len(cba_tools.REDUCED_TOOL_NAMES)} tools)"
             if x == "reduced"
-            else f"Full ({len(FULL_TOOLS)} tools)"
+            else f"Full ({len(cba_tools.FULL_TOOL_NAMES)} tools)"
         ),
         help="Reduced set is faster; Full set includes all data tools",
     )
@@ -865,7 +865,11 @@ def main() -> None:
     # --- Provider Info Bar ---
     if st.session_state.provider_config:
         pc = st.session_state.provider_config
-        tool_count = len(FULL_TOOLS) if tool_set == "full" else len(REDUCED_TOOLS)
+        tool_count = (
+            len(cba_tools.FULL_TOOL_NAMES)
+            if tool_set == "full"
+            else len(cba_tools.REDUCED_TOOL_NAMES)
+        )
         st.caption(
             f"**Provider:** {pc.name} • **Model:** {pc.model_id} • **Tools:** {tool_count}"
         )
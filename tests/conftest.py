@@ -64,6 +64,32 @@ def temp_config_dir(tmp_path: Path) -> Generator[Path, None, None]:
     clear_path_cache()
 
 
+@pytest.fixture
+def temp_cache_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """
+    Provide a temporary cache directory for tests.
+
+    Sets AGENTIC_CBA_CACHE_DIR environment variable and clears path cache.
+    """
+    from agentic_cba_indicators.paths import clear_path_cache
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    old_value = os.environ.get("AGENTIC_CBA_CACHE_DIR")
+    os.environ["AGENTIC_CBA_CACHE_DIR"] = str(cache_dir)
+    clear_path_cache()
+
+    yield cache_dir
+
+    # Restore
+    if old_value is not None:
+        os.environ["AGENTIC_CBA_CACHE_DIR"] = old_value
+    else:
+        os.environ.pop("AGENTIC_CBA_CACHE_DIR", None)
+    clear_path_cache()
+
+
 @pytest.fixture
 def sample_config(temp_config_dir: Path) -> Path:
     """Create a sample providers.yaml for testing."""
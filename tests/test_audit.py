@@ -15,6 +15,7 @@ from agentic_cba_indicators.audit import (
     AuditEntry,
     AuditLogger,
     get_audit_logger,
+    is_audit_enabled,
     log_tool_invocation,
     reset_audit_logger,
     sanitize_value,
@@ -326,6 +327,7 @@ class TestGlobalAuditLogger:
                 logger = get_audit_logger()
                 assert logger is not None
                 assert logger.log_path == log_path
+                assert is_audit_enabled() is True
             finally:
                 if old_value:
                     os.environ[AUDIT_LOG_ENV_VAR] = old_value
@@ -339,6 +341,7 @@ class TestGlobalAuditLogger:
 
         old_value = os.environ.pop(AUDIT_LOG_ENV_VAR, None)
         try:
+            assert is_audit_enabled() is False
             # This should not raise even when logging is disabled
             log_tool_invocation(
                 tool_name="test",
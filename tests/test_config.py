@@ -86,6 +86,96 @@ providers:
         finally:
             os.environ.pop("MALICIOUS_SECRET", None)
 
+    def test_warns_once_per_string_for_blocked_vars(
+        self, temp_config_dir: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Should report every blocked variable in a string in one warning."""
+        from agentic_cba_indicators.config import load_config
+
+        config_content = """
+active_provider: ollama
+providers:
+  ollama:
+    host: "${SECRET_ONE}:${SECRET_TWO}"
+    model_id: llama3.1
+"""
+        config_file = temp_config_dir / "providers.yaml"
+        config_file.write_text(config_content)
+
+        with caplog.at_level("WARNING"):
+            config = load_config(config_file)
+
+        assert config["providers"]["ollama"]["host"] == ":"
+        warnings = [r for r in caplog.records if "non-whitelisted" in r.message]
+        assert len(warnings) == 1
+        assert "'SECRET_ONE', 'SECRET_TWO'" in warnings[0].message
+
+    def test_expands_multiple_vars_without_reexpanding_values(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Should expand every reference once, leaving expanded text untouched."""
+        from unittest.mock import patch
+
+        from agentic_cba_indicators.config import load_config
+
+        config_content = """
+active_provider: ollama
+providers:
+  ollama:
+    host: "${OLLAMA_HOST}/${OLLAMA_API_KEY}/${OLLAMA_HOST}"
+    model_id: llama3.1
+"""
+        config_file = temp_config_dir / "providers.yaml"
+        config_file.write_text(config_content)
+
+        env = {"OLLAMA_HOST": "http://h", "OLLAMA_API_KEY": "${OLLAMA_HOST}"}
+        with patch.dict("os.environ", env):
+            config = load_config(config_file)
+
+        assert (
+            config["providers"]["ollama"]["host"] == "http://h/${OLLAMA_HOST}/http://h"
+        )
+
+    def test_does_not_expand_provider_options(self, temp_config_dir: Path) -> None:
+        """Should pass provider options through verbatim."""
+        from unittest.mock import patch
+
+        from agentic_cba_indicators.config import load_config
+
+        config_content = """
+active_provider: ollama
+providers:
+  ollama:
+    host: ${OLLAMA_HOST}
+    model_id: llama3.1
+    options:
+      num_ctx: 8192
+      stop: ["${OLLAMA_HOST}"]
+"""
+        config_file = temp_config_dir / "providers.yaml"
+        config_file.write_text(config_content)
+
+        with patch.dict("os.environ", {"OLLAMA_HOST": "http://h"}):
+            config = load_config(config_file)
+
+        ollama = config["providers"]["ollama"]
+        assert ollama["host"] == "http://h"
+        assert ollama["options"] == {"num_ctx": 8192, "stop": ["${OLLAMA_HOST}"]}
+
+    def test_skips_expansion_without_env_refs(self, sample_config: Path) -> None:
+        """Should not walk the config tree when the YAML contains no '$'."""
+        from unittest.mock import patch
+
+        from agentic_cba_indicators.config import load_config
+
+        with patch(
+            "agentic_cba_indicators.config.provider_factory._expand_env_vars"
+        ) as expand:
+            config = load_config(sample_config)
+
+        expand.assert_not_called()
+        assert config["active_provider"] == "ollama"
+
     def test_loads_bundled_config_when_no_user_config(
         self, temp_config_dir: Path
     ) -> None:
@@ -98,6 +188,20 @@ providers:
         assert "active_provider" in config
         assert "providers" in config
 
+    def test_bundled_config_parsed_once(self, temp_config_dir: Path) -> None:
+        """Should reuse the parsed bundled config without leaking mutations."""
+        from unittest.mock import patch
+
+        from agentic_cba_indicators.config import load_config
+
+        first = load_config()
+        first["active_provider"] = "mutated"
+        with patch("agentic_cba_indicators.config.provider_factory.yaml.load") as load:
+            second = load_config()
+
+        load.assert_not_called()
+        assert second["active_provider"] != "mutated"
+
     def test_raises_on_invalid_structure(self, temp_config_dir: Path) -> None:
         """Should raise ValueError for invalid config structure."""
         from agentic_cba_indicators.config import load_config
@@ -113,6 +217,83 @@ providers: []
             load_config(config_file)
 
 
+class TestConfigCache:
+    """Tests for the JSON sidecar cache used by load_config."""
+
+    def test_writes_cache_after_first_load(self, sample_config: Path) -> None:
+        """Should write a JSON sidecar next to the YAML file."""
+        from agentic_cba_indicators.config import load_config
+
+        load_config(sample_config)
+
+        cache_file = sample_config.with_name("providers.yaml.cache.json")
+        assert cache_file.exists()
+
+    def test_loads_from_cache_when_yaml_unchanged(self, sample_config: Path) -> None:
+        """Should return cached config without re-parsing the YAML."""
+        from unittest.mock import patch
+
+        from agentic_cba_indicators.config import load_config
+
+        first = load_config(sample_config)
+        with patch("agentic_cba_indicators.config.provider_factory.yaml.load") as load:
+            second = load_config(sample_config)
+
+        load.assert_not_called()
+        assert second == first
+
+    def test_ignores_stale_cache(self, sample_config: Path) -> None:
+        """Should re-parse the YAML when it changed after the cache was written."""
+        import os
+
+        from agentic_cba_indicators.config import load_config
+
+        load_config(sample_config)
+        content = sample_config.read_text().replace(
+            "temperature: 0.1", "temperature: 0.7"
+        )
+        sample_config.write_text(content)
+        stat = sample_config.stat()
+        os.utime(sample_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config = load_config(sample_config)
+
+        assert config["providers"]["ollama"]["temperature"] == 0.7
+
+    def test_cache_stores_unexpanded_values(self, temp_config_dir: Path) -> None:
+        """Should never persist values resolved from environment variables."""
+        import os
+
+        from agentic_cba_indicators.config import load_config
+
+        config_file = temp_config_dir / "providers.yaml"
+        config_file.write_text(
+            """
+active_provider: anthropic
+providers:
+  anthropic:
+    api_key: ${ANTHROPIC_API_KEY}
+    model_id: claude-3-haiku
+"""
+        )
+
+        original = os.environ.get("ANTHROPIC_API_KEY")
+        os.environ["ANTHROPIC_API_KEY"] = "sk-test-secret"
+        try:
+            config = load_config(config_file)
+            cached = load_config(config_file)
+        finally:
+            if original is not None:
+                os.environ["ANTHROPIC_API_KEY"] = original
+            else:
+                os.environ.pop("ANTHROPIC_API_KEY", None)
+
+        cache_text = config_file.with_name("providers.yaml.cache.json").read_text()
+        assert "sk-test-secret" not in cache_text
+        assert config["providers"]["anthropic"]["api_key"] == "sk-test-secret"
+        assert cached == config
+
+
 class TestGetProviderConfig:
     """Tests for get_provider_config function."""
 
@@ -0,0 +1,322 @@
+"""Tests for CrossRef API integration."""
+
+from __future__ import annotations
+
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from agentic_cba_indicators.tools import _crossref
+from agentic_cba_indicators.tools._crossref import (
+    _parse_crossref_response,
+    close_crossref_client,
+    fetch_crossref_batch,
+    fetch_crossref_metadata,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_crossref_message() -> dict:
+    """Mock CrossRef 'message' payload for a journal article."""
+    return {
+        "title": ["Soil carbon under agroforestry"],
+        "author": [
+            {"given": "Ada", "family": "Lovelace"},
+            {"family": "Curie"},
+            {"given": "Marie", "family": None},
+            {"given": "", "family": ""},
+        ],
+        "container-title": ["Agriculture, Ecosystems & Environment"],
+        "published-print": {"date-parts": [[2020, 5]]},
+        "abstract": "<jats:p>Carbon <jats:italic>stocks</jats:italic> rise.</jats:p>",
+        "ISSN": ["0167-8809"],
+        "URL": "https://doi.org/10.1016/j.agee.2020.106989",
+        "type": "journal-article",
+        "publisher": "Elsevier",
+    }
+
+
+@pytest.fixture
+def crossref_requests(
+    monkeypatch: pytest.MonkeyPatch, mock_crossref_message: dict, temp_cache_dir: Path
+) -> Iterator[list[httpx.Request]]:
+    """Route the shared client through a mock transport and record requests."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/works":
+            # Bulk filter lookup: echo back every requested DOI except misses
+            dois = [
+                c.removeprefix("doi:") for c in request.url.params["filter"].split(",")
+            ]
+            items = [
+                {**mock_crossref_message, "DOI": doi.upper()}
+                for doi in dois
+                if not doi.endswith("/missing")
+            ]
+            return httpx.Response(200, json={"message": {"items": items}})
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"message": mock_crossref_message}, headers={"ETag": '"v1"'}
+        )
+
+    monkeypatch.setattr(_crossref, "get_api_key", lambda _name: None)
+    close_crossref_client()
+    monkeypatch.setattr(
+        _crossref, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    yield requests
+    close_crossref_client()
+
+
+# =============================================================================
+# Test _parse_crossref_response()
+# =============================================================================
+
+
+def test_parse_crossref_response(mock_crossref_message: dict) -> None:
+    """Test parsing of a full CrossRef message."""
+    metadata = _parse_crossref_response("10.1/x", mock_crossref_message)
+
+    assert metadata.title == "Soil carbon under agroforestry"
+    assert metadata.authors == ["Ada Lovelace", "Curie", "Marie"]
+    assert metadata.journal == "Agriculture, Ecosystems & Environment"
+    assert metadata.year == 2020
+    assert metadata.abstract == "Carbon stocks rise."
+    assert metadata.issn == "0167-8809"
+
+
+def test_parse_crossref_response_empty() -> None:
+    """Test parsing of a message with no optional fields."""
+    metadata = _parse_crossref_response("10.1/x", {})
+
+    assert metadata.title is None
+    assert metadata.authors == []
+    assert metadata.year is None
+    assert metadata.to_display_string() == "DOI: 10.1/x"
+
+
+def test_parse_crossref_response_year_fallback() -> None:
+    """Test that the year falls back to later date fields."""
+    data = {"published": {"date-parts": [[]]}, "issued": {"date-parts": [[2019]]}}
+
+    assert _parse_crossref_response("10.1/x", data).year == 2019
+
+
+# =============================================================================
+# Test fetch_crossref_metadata()
+# =============================================================================
+
+
+def test_fetch_crossref_metadata_reuses_client(
+    crossref_requests: list[httpx.Request],
+) -> None:
+    """Test that successive fetches share one pooled client."""
+    client = _crossref._client
+
+    assert fetch_crossref_metadata("10.1/a") is not None
+    assert fetch_crossref_metadata("10.1/b") is not None
+
+    assert _crossref._client is client
+    assert [r.url.path for r in crossref_requests] == ["/works/10.1/a", "/works/10.1/b"]
+
+
+def test_fetch_crossref_metadata_not_found(
+    crossref_requests: list[httpx.Request],
+) -> None:
+    """Test that a 404 yields None."""
+    assert fetch_crossref_metadata("10.1/missing") is None
+
+
+def test_fetch_crossref_metadata_uses_disk_cache(
+    crossref_requests: list[httpx.Request],
+) -> None:
+    """Test that found and not-found results are served from the cache."""
+    first = fetch_crossref_metadata("10.1/a")
+    assert fetch_crossref_metadata("10.1/missing") is None
+
+    assert fetch_crossref_metadata("10.1/a") == first
+    assert fetch_crossref_metadata("10.1/missing") is None
+    assert len(crossref_requests) == 2
+
+    assert fetch_crossref_metadata("10.1/a", force_refresh=True) == first
+    assert len(crossref_requests) == 3
+
+
+def test_fetch_crossref_metadata_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test that an expired entry is revalidated and a 304 reuses it."""
+    first = fetch_crossref_metadata("10.1/a")
+    monkeypatch.setattr(_crossref, "CROSSREF_CACHE_TTL", 1e-9)
+
+    assert fetch_crossref_metadata("10.1/a") == first
+    assert crossref_requests[-1].headers["If-None-Match"] == '"v1"'
+    assert len(crossref_requests) == 2
+
+
+def test_fetch_crossref_metadata_cache_disabled(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test that a zero TTL disables the cache."""
+    monkeypatch.setattr(_crossref, "CROSSREF_CACHE_TTL", 0.0)
+
+    fetch_crossref_metadata("10.1/a")
+    fetch_crossref_metadata("10.1/a")
+
+    assert len(crossref_requests) == 2
+
+
+def test_unreadable_cache_entry_is_a_miss(
+    crossref_requests: list[httpx.Request],
+) -> None:
+    """Test that a corrupt or old-format cache row is refetched."""
+    first = fetch_crossref_metadata("10.1/a")
+    with closing(_crossref._cache_connect()) as conn, conn:
+        conn.execute("UPDATE works SET metadata = ?", ('{"unknown_field": 1}',))
+
+    assert fetch_crossref_metadata("10.1/a") == first
+    assert len(crossref_requests) == 2
+
+
+# =============================================================================
+# Test fetch_crossref_batch()
+# =============================================================================
+
+
+def test_fetch_crossref_batch(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test concurrent batch fetch keeps input order and reports progress."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    dois = ["10.1/a", "10.1/missing", "10.1/b"]
+    progress: list[tuple[int, int, str, bool]] = []
+
+    def on_progress(current: int, total: int, doi: str, found: bool) -> None:
+        progress.append((current, total, doi, found))
+
+    results = fetch_crossref_batch(dois, progress_callback=on_progress)
+
+    assert list(results) == dois
+    assert results["10.1/missing"] is None
+    assert results["10.1/a"] is not None
+    assert [r.url.path for r in crossref_requests] == ["/works"]
+    assert [p[0] for p in progress] == [1, 2, 3]
+
+    # A second run is answered from the cache
+    assert fetch_crossref_batch(dois) == results
+    assert len(crossref_requests) == 1
+    assert {(p[2], p[3]) for p in progress} == {
+        ("10.1/a", True),
+        ("10.1/missing", False),
+        ("10.1/b", True),
+    }
+
+
+def test_fetch_crossref_batch_reads_cache_once(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test that the cache pre-scan uses one connection for the whole batch."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    dois = [f"10.1/{i}" for i in range(30)]
+    fetch_crossref_batch(dois)
+
+    connects = 0
+    real_connect = _crossref._cache_connect
+
+    def counting_connect():
+        nonlocal connects
+        connects += 1
+        return real_connect()
+
+    monkeypatch.setattr(_crossref, "_cache_connect", counting_connect)
+
+    assert all(fetch_crossref_batch(dois).values())
+    assert connects == 1
+
+
+def test_fetch_crossref_batch_two_arg_callback(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test that a (current, total) callback is still supported."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    progress: list[tuple[int, int]] = []
+
+    fetch_crossref_batch(
+        ["10.1/a", "10.1/b"],
+        progress_callback=lambda current, total: progress.append((current, total)),
+    )
+
+    assert progress == [(1, 2), (2, 2)]
+
+
+def test_fetch_crossref_batch_chunks_and_comma_dois(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test bulk chunking, and per-DOI lookup for DOIs containing commas."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    monkeypatch.setattr(_crossref, "CROSSREF_BULK_SIZE", 2)
+    dois = ["10.1/a", "10.1/b", "10.1/c", "10.1/d,e"]
+
+    results = fetch_crossref_batch(dois)
+
+    assert all(results[doi] is not None for doi in dois)
+    paths = sorted(r.url.path for r in crossref_requests)
+    assert paths == ["/works", "/works/10.1/c", "/works/10.1/d,e"]
+
+
+def test_fetch_crossref_batch_falls_back_when_bulk_fails(
+    monkeypatch: pytest.MonkeyPatch, crossref_requests: list[httpx.Request]
+) -> None:
+    """Test that a failed bulk request is retried per DOI."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    monkeypatch.setattr(_crossref, "_request_crossref_bulk", lambda _dois: None)
+
+    results = fetch_crossref_batch(["10.1/a", "10.1/missing"])
+
+    assert results["10.1/a"] is not None
+    assert results["10.1/missing"] is None
+    assert len(crossref_requests) == 2
+
+
+def test_fetch_crossref_batch_empty() -> None:
+    """Test that an empty batch makes no requests."""
+    assert fetch_crossref_batch([]) == {}
+
+
+def test_fetch_crossref_batch_skips_malformed_items(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_crossref_message: dict,
+    crossref_requests: list[httpx.Request],
+) -> None:
+    """Test that one unparseable bulk item maps to None and is not cached."""
+    monkeypatch.setattr(_crossref, "CROSSREF_BATCH_DELAY", 0.0)
+    real_parse = _crossref._parse_crossref_response
+
+    def parse(doi: str, data: dict) -> _crossref.CrossRefMetadata:
+        if doi == "10.1/bad":
+            return real_parse(doi, {**data, "author": "not a list"})
+        return real_parse(doi, data)
+
+    monkeypatch.setattr(_crossref, "_parse_crossref_response", parse)
+
+    results = fetch_crossref_batch(["10.1/a", "10.1/bad", "10.1/b"])
+
+    assert results["10.1/bad"] is None
+    assert results["10.1/a"] is not None
+    assert results["10.1/b"] is not None
+    assert set(_crossref._cache_get_many(list(results))) == {"10.1/a", "10.1/b"}
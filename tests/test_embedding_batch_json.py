@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class FakeResponse:
@@ -11,6 +15,10 @@ class FakeResponse:
         self._payload = payload
         self._json_error = json_error
 
+    @property
+    def content(self) -> bytes:
+        return b"not json" if self._json_error else json.dumps(self._payload).encode()
+
     def json(self):
         if self._json_error:
             raise json.JSONDecodeError("Expecting value", "", 0)
@@ -38,10 +46,14 @@ class FakeClient:
         return FakeResponse(200, payload={"embeddings": [[0.1, 0.2]]})
 
 
-def test_get_embeddings_batch_handles_invalid_json(monkeypatch) -> None:
+def test_get_embeddings_batch_handles_invalid_json(
+    monkeypatch, temp_cache_dir: Path
+) -> None:
     from agentic_cba_indicators.tools import _embedding
 
-    monkeypatch.setattr(_embedding.httpx, "Client", FakeClient)
+    _embedding.clear_embedding_cache()
+
+    monkeypatch.setattr(_embedding, "_client", FakeClient())
 
     result = _embedding.get_embeddings_batch(["one", "two"], strict=False)
 
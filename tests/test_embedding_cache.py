@@ -0,0 +1,289 @@
+"""Tests for the content-addressed embedding cache."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from agentic_cba_indicators.tools import _embedding
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def ollama_requests(
+    monkeypatch: pytest.MonkeyPatch, temp_cache_dir: Path
+) -> Iterator[list[list[str]]]:
+    """Route Ollama calls to a mock transport and record each request's inputs."""
+    requests: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        inputs = payload["input"]
+        inputs = inputs if isinstance(inputs, list) else [inputs]
+        requests.append(inputs)
+        return httpx.Response(
+            200,
+            json={"embeddings": [[float(len(text))] * 64 for text in inputs]},
+        )
+
+    _embedding.close_embedding_client()
+    monkeypatch.setattr(
+        _embedding, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(_embedding, "_MIN_EMBEDDING_INTERVAL", 0.0)
+    _embedding.clear_embedding_cache()
+    yield requests
+    _embedding.clear_embedding_cache()
+    _embedding.close_embedding_client()
+
+
+def test_get_embedding_reuses_cached_vector(ollama_requests) -> None:
+    first = _embedding.get_embedding("soil carbon")
+    second = _embedding.get_embedding("soil carbon")
+
+    assert first == second == [11.0] * 64
+    assert ollama_requests == [["soil carbon"]]
+
+
+def test_cache_persists_across_memory_clears(ollama_requests) -> None:
+    _embedding.get_embedding("soil carbon")
+    _embedding.clear_embedding_cache()
+
+    assert _embedding.get_embedding("soil carbon") == [11.0] * 64
+    assert len(ollama_requests) == 1
+
+
+def test_batch_only_requests_uncached_texts(ollama_requests) -> None:
+    _embedding.get_embedding("bb")
+
+    result = _embedding.get_embeddings_batch(["a", "bb", "ccc"])
+
+    assert result == [[1.0] * 64, [2.0] * 64, [3.0] * 64]
+    assert ollama_requests == [["bb"], ["a", "ccc"]]
+
+
+def test_fully_cached_batch_skips_request(ollama_requests) -> None:
+    _embedding.get_embeddings_batch(["a", "bb"])
+    _embedding.clear_embedding_cache()
+
+    assert _embedding.get_embeddings_batch(["bb", "a"]) == [[2.0] * 64, [1.0] * 64]
+    assert len(ollama_requests) == 1
+
+
+def test_cache_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch, ollama_requests
+) -> None:
+    monkeypatch.setattr(_embedding, "_EMBED_CACHE_PATH", "")
+
+    _embedding.get_embedding("soil carbon")
+    _embedding.get_embedding("soil carbon")
+
+    assert len(ollama_requests) == 2
+
+
+def test_cache_key_includes_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = _embedding._embedding_cache_key("soil carbon")
+    monkeypatch.setattr(_embedding, "EMBEDDING_MODEL", "nomic-embed-text")
+
+    assert _embedding._embedding_cache_key("soil carbon") != key
+
+
+def test_requests_share_one_client(ollama_requests) -> None:
+    client = _embedding._get_client()
+
+    _embedding.get_embedding("soil carbon")
+    _embedding.get_embeddings_batch(["a", "bb"])
+
+    assert _embedding._get_client() is client
+    assert len(ollama_requests) == 2
+
+
+@pytest.fixture
+def failing_batch_client(
+    monkeypatch: pytest.MonkeyPatch, temp_cache_dir: Path
+) -> Iterator[None]:
+    """Reject batch requests so texts are embedded individually; "bad*" fails."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        text = json.loads(request.content)["input"]
+        if isinstance(text, list) or text.startswith("bad"):
+            return httpx.Response(503)
+        return httpx.Response(200, json={"embeddings": [[float(len(text))] * 64]})
+
+    monkeypatch.setattr(
+        _embedding, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    _embedding.clear_embedding_cache()
+    yield
+    _embedding.clear_embedding_cache()
+
+
+def test_fallback_keeps_order_and_marks_failures(failing_batch_client) -> None:
+    texts = ["a", "bad", "ccc", "dddd", "bad2", "ff"]
+
+    result = _embedding.get_embeddings_batch(texts)
+
+    assert result == [
+        [1.0] * 64,
+        None,
+        [3.0] * 64,
+        [4.0] * 64,
+        None,
+        [2.0] * 64,
+    ]
+
+
+def test_strict_fallback_reports_first_failure(failing_batch_client) -> None:
+    with pytest.raises(RuntimeError, match="doc 1 "):
+        _embedding.get_embeddings_batch(["a", "bad", "bad2"], strict=True)
+
+
+def test_strict_failure_reports_caller_index(failing_batch_client) -> None:
+    _embedding.get_embeddings_batch(["ok"])
+    # "ok" is cached and the blanks are zero-filled, so only "bad" is sent
+    with pytest.raises(RuntimeError, match="doc 3 "):
+        _embedding.get_embeddings_batch(["", "ok", "", "bad"], strict=True)
+
+
+def test_rate_limit_waits_outside_lock(
+    monkeypatch: pytest.MonkeyPatch, ollama_requests
+) -> None:
+    sleeps: list[tuple[float, bool]] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append((seconds, _embedding._rate_limit_lock.locked()))
+
+    monkeypatch.setattr(_embedding, "_MIN_EMBEDDING_INTERVAL", 10.0)
+    monkeypatch.setattr(_embedding, "_next_embedding_time", 0.0)
+    monkeypatch.setattr(_embedding.time, "sleep", fake_sleep)
+
+    _embedding.get_embedding("a")
+    _embedding.get_embedding("bb")
+    _embedding.get_embedding("ccc")
+
+    assert [locked for _, locked in sleeps] == [False, False]
+    assert sleeps[0][0] == pytest.approx(10.0, abs=0.5)
+    assert sleeps[1][0] == pytest.approx(20.0, abs=0.5)
+
+
+def test_blank_text_skips_request(ollama_requests) -> None:
+    dims = _embedding.get_expected_dimensions()
+
+    assert _embedding.get_embedding("  \n") == [0.0] * dims
+    assert _embedding.get_embeddings_batch(["", "a", " "]) == [
+        [0.0] * dims,
+        [1.0] * 64,
+        [0.0] * dims,
+    ]
+    assert ollama_requests == [["a"]]
+
+
+def test_ollama_headers_checked_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_embedding, "OLLAMA_API_KEY", "secret")
+    monkeypatch.setattr(_embedding, "OLLAMA_HOST", "http://ollama.example.com")
+    _embedding._get_ollama_headers.cache_clear()
+
+    try:
+        with pytest.warns(UserWarning, match="HTTPS") as record:
+            first = _embedding._get_ollama_headers()
+            second = _embedding._get_ollama_headers()
+    finally:
+        _embedding._get_ollama_headers.cache_clear()
+
+    assert first is second
+    assert first["Authorization"] == "Bearer secret"
+    assert len(record) == 1
+
+
+def test_disk_cache_stores_half_precision(ollama_requests) -> None:
+    vector = [0.1 * (i - 32) for i in range(64)]
+    key = _embedding._embedding_cache_key("x")
+    _embedding._embed_cache_put({key: vector})
+    _embedding.clear_embedding_cache()
+
+    assert len(_embedding._encode_vector(vector)) == 2 * len(vector)
+    assert _embedding._embed_cache_get([key])[key] == pytest.approx(vector, abs=2e-3)
+
+
+def test_out_of_range_vectors_fall_back_to_float32() -> None:
+    vector = [1e6] * 64
+
+    blob = _embedding._encode_vector(vector)
+
+    assert len(blob) == 4 * len(vector)
+    assert _embedding._decode_vector(blob, len(vector)) == vector
+
+
+def test_partial_batch_only_retries_missing(
+    monkeypatch: pytest.MonkeyPatch, temp_cache_dir: Path
+) -> None:
+    singles: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        text = json.loads(request.content)["input"]
+        if isinstance(text, list):
+            # Second entry missing and the last one dropped entirely
+            return httpx.Response(200, json={"embeddings": [[1.0] * 64, None]})
+        singles.append(text)
+        return httpx.Response(200, json={"embeddings": [[float(len(text))] * 64]})
+
+    monkeypatch.setattr(
+        _embedding, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    _embedding.clear_embedding_cache()
+
+    result = _embedding.get_embeddings_batch(["a", "bb", "ccc"], strict=True)
+
+    assert result == [[1.0] * 64, [2.0] * 64, [3.0] * 64]
+    assert sorted(singles) == ["bb", "ccc"]
+    _embedding.clear_embedding_cache()
+
+
+def test_large_batch_is_split_by_token_budget(
+    monkeypatch: pytest.MonkeyPatch, ollama_requests
+) -> None:
+    # Each 8-char text is estimated at 3 tokens, so two fit a budget of 6
+    monkeypatch.setattr(_embedding, "_BATCH_TOKEN_BUDGET", 6)
+    texts = [f"text{i:04d}" for i in range(5)]
+
+    result = _embedding.get_embeddings_batch(texts)
+
+    assert result == [[8.0] * 64] * 5
+    assert sorted(ollama_requests) == [
+        ["text0000", "text0001"],
+        ["text0002", "text0003"],
+        ["text0004"],
+    ]
+
+
+def test_split_keeps_oversized_text_on_its_own(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_embedding, "_BATCH_TOKEN_BUDGET", 6)
+    texts = ["a", "x" * 100, "b"]
+
+    assert _embedding._split_by_token_budget([0, 1, 2], texts) == [[0], [1], [2]]
+
+
+def test_connectivity_probe_bypasses_cache(
+    monkeypatch: pytest.MonkeyPatch, ollama_requests
+) -> None:
+    _embedding.get_embeddings_batch(["test"])
+
+    def unreachable(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    monkeypatch.setattr(
+        _embedding,
+        "_client",
+        httpx.Client(transport=httpx.MockTransport(unreachable)),
+    )
+
+    # The ingest scripts probe Ollama this way before touching the KB
+    with pytest.raises(httpx.ConnectError):
+        _embedding.get_embeddings_batch(["test"], strict=True, use_cache=False)
+    assert _embedding.get_embeddings_batch(["test"]) == [[4.0] * 64]
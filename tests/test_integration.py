@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+
 # Note: Uses temp_data_dir fixture from conftest.py for ChromaDB tests
 
 
@@ -306,3 +308,10 @@ class TestPromptLoading:
 
         assert prompt is not None
         assert isinstance(prompt, str)
+
+    def test_load_unknown_prompt_raises(self):
+        """Unknown prompt names raise FileNotFoundError."""
+        from agentic_cba_indicators.prompts import load_prompt
+
+        with pytest.raises(FileNotFoundError, match=r"no_such_prompt\.md"):
+            load_prompt("no_such_prompt")
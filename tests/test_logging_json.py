@@ -99,6 +99,26 @@ class TestJSONFormatter:
         parsed = datetime.fromisoformat(timestamp)
         assert parsed.tzinfo is not None  # Has timezone info
 
+    def test_timestamp_matches_record_time_to_millisecond(
+        self, json_formatter, log_record
+    ):
+        """Cached per-second prefix should still yield the record's own time."""
+        from datetime import UTC
+
+        log_record.created = 1_768_739_696.25
+        log_record.msecs = 250.0
+        first = json.loads(json_formatter.format(log_record))["timestamp"]
+
+        log_record.created = 1_768_739_696.789
+        log_record.msecs = 789.0
+        second = json.loads(json_formatter.format(log_record))["timestamp"]
+
+        expected = datetime.fromtimestamp(1_768_739_696, tz=UTC).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        assert first == f"{expected}.250+00:00"
+        assert second == f"{expected}.789+00:00"
+
     def test_level_is_levelname(self, json_formatter, log_record):
         """Level should be the human-readable name."""
         output = json_formatter.format(log_record)
@@ -130,9 +150,16 @@ class TestJSONFormatter:
 
         assert data["message"] == "Value is 42 and hello"
 
-    def test_source_location_included(self, json_formatter, log_record):
-        """Source location should be included for DEBUG level and above."""
-        output = json_formatter.format(log_record)
+    def test_source_location_omitted_by_default(self, json_formatter, log_record):
+        """Source location should not be built unless requested."""
+        data = json.loads(json_formatter.format(log_record))
+
+        assert "source" not in data
+
+    def test_source_location_included(self, log_record):
+        """Source location should be included when include_source is set."""
+        formatter = JSONFormatter(include_source=True)
+        output = formatter.format(log_record)
         data = json.loads(output)
 
         assert "source" in data
@@ -165,6 +192,34 @@ class TestJSONFormatter:
         assert "ValueError: Test error" in data["exc_info"]
         assert "Traceback" in data["exc_info"]
 
+    def test_exception_text_cached_on_record(self, json_formatter):
+        """Formatted traceback should be reused across repeated formatting."""
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            import sys
+
+            exc_info = sys.exc_info()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.ERROR,
+            pathname="test.py",
+            lineno=1,
+            msg="Error occurred",
+            args=(),
+            exc_info=exc_info,
+        )
+
+        first = json_formatter.format(record)
+        with mock.patch(
+            "agentic_cba_indicators.logging_config.traceback.format_exception"
+        ) as format_exception:
+            second = json_formatter.format(record)
+
+        format_exception.assert_not_called()
+        assert json.loads(second)["exc_info"] == json.loads(first)["exc_info"]
+
     def test_extra_fields_captured(self, json_formatter, log_record):
         """Extra fields passed to logger should be captured."""
         # Add extra fields to the record (simulates logger.info(..., extra={...}))
@@ -179,6 +234,26 @@ class TestJSONFormatter:
         assert data["extra"]["user_id"] == 123
         assert data["extra"]["action"] == "search"
 
+    def test_no_extra_key_without_extras(self, json_formatter, log_record):
+        """Records without user-provided context should omit 'extra'."""
+        log_record.correlation_id = "corr-1"
+        log_record.asctime = "2026-01-18 12:34:56,789"
+
+        data = json.loads(json_formatter.format(log_record))
+
+        assert "extra" not in data
+        assert data["correlation_id"] == "corr-1"
+
+    def test_unencodable_extras_still_serialize(self, json_formatter, log_record):
+        """Values the fast encoder rejects should fall back to the stdlib."""
+        log_record.big_number = 2**70
+        log_record.path = mock.sentinel.path
+
+        data = json.loads(json_formatter.format(log_record))
+
+        assert data["extra"]["big_number"] == 2**70
+        assert data["extra"]["path"] == str(mock.sentinel.path)
+
     def test_correlation_id_in_json_output(self, clean_logging):
         """Correlation ID should appear in JSON logs when set."""
         stream = io.StringIO()
@@ -283,6 +358,19 @@ class TestSetupLogging:
 
         assert data["level"] == "INFO"
         assert data["message"] == "Test JSON message"
+        assert "source" not in data
+
+    def test_setup_json_includes_source_only_at_debug(self, clean_logging):
+        """Source location should be emitted only when configured for DEBUG."""
+        stream = io.StringIO()
+        setup_logging(level="DEBUG", stream=stream, log_format="json")
+
+        get_test_logger("test_json_debug").info("With source")
+
+        data = json.loads(stream.getvalue().strip())
+        assert data["source"]["function"] == (
+            "test_setup_json_includes_source_only_at_debug"
+        )
 
     def test_setup_with_text_format_default(self, clean_logging):
         """setup_logging should default to text format."""
@@ -8,30 +8,48 @@ from agentic_cba_indicators import mcp_server
 class TestMcpServerModule:
     """Test MCP server module structure and configuration."""
 
-    def test_all_tools_list_not_empty(self) -> None:
-        """Verify _ALL_TOOLS contains tools."""
-        assert len(mcp_server._ALL_TOOLS) > 0, "_ALL_TOOLS should not be empty"
+    def test_tool_specs_not_empty(self) -> None:
+        """Verify _TOOL_SPECS contains tools."""
+        assert len(mcp_server._TOOL_SPECS) > 0, "_TOOL_SPECS should not be empty"
 
-    def test_all_tools_count(self) -> None:
+    def test_tool_specs_count(self) -> None:
         """Verify expected tool count (58 tools after removing 4 help tools)."""
-        assert len(mcp_server._ALL_TOOLS) == 58, (
-            f"Expected 58 tools, got {len(mcp_server._ALL_TOOLS)}"
+        assert len(mcp_server._TOOL_SPECS) == 58, (
+            f"Expected 58 tools, got {len(mcp_server._TOOL_SPECS)}"
         )
 
-    def test_all_tools_are_callable(self) -> None:
-        """Verify all tools in _ALL_TOOLS are callable."""
-        for tool in mcp_server._ALL_TOOLS:
-            assert callable(tool), f"Tool {tool} is not callable"
-
-    def test_all_tools_have_names(self) -> None:
-        """Verify all tools have __name__ attribute."""
-        for tool in mcp_server._ALL_TOOLS:
-            assert hasattr(tool, "__name__"), f"Tool {tool} missing __name__"
-            assert tool.__name__, f"Tool {tool} has empty __name__"
+    def test_tool_specs_resolve_to_named_tools(self) -> None:
+        """Verify each spec names the attribute it resolves to."""
+        tools = mcp_server._load_tools()
+        for spec, tool in zip(mcp_server._TOOL_SPECS, tools, strict=True):
+            assert callable(tool), f"Tool {spec} is not callable"
+            assert tool.__name__ == spec.split(":")[1]
+
+    def test_loaded_tools_are_wrapped(self) -> None:
+        """Verify loaded tools carry timeout/audit/metrics wrapping."""
+        for tool in mcp_server._load_tools():
+            assert getattr(tool, "__agentic_tool_wrapped__", False) is True
+
+    def test_importing_module_does_not_import_tools(self) -> None:
+        """Verify tool modules are only imported when tools are loaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; import agentic_cba_indicators.mcp_server; "
+            "print('agentic_cba_indicators.tools' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
 
     def test_no_help_tools_in_all_tools(self) -> None:
         """Verify help tools are not included (MCP provides native discovery)."""
-        tool_names = {t.__name__ for t in mcp_server._ALL_TOOLS}
+        tool_names = {spec.split(":")[1] for spec in mcp_server._TOOL_SPECS}
         help_tool_names = {
             "list_tools",
             "describe_tool",
@@ -58,10 +76,10 @@ class TestMcpToolConsistency:
     """Test tool consistency between MCP server and tools module."""
 
     def test_tools_match_full_tools_constant(self) -> None:
-        """Verify _ALL_TOOLS matches FULL_TOOL_NAMES count."""
+        """Verify _TOOL_SPECS matches FULL_TOOL_NAMES count."""
         from agentic_cba_indicators.tools import FULL_TOOL_NAMES
 
-        mcp_tool_names = {t.__name__ for t in mcp_server._ALL_TOOLS}
+        mcp_tool_names = {t.__name__ for t in mcp_server._load_tools()}
         # Both should have 58 tools
         assert len(mcp_tool_names) == len(FULL_TOOL_NAMES), (
             f"MCP has {len(mcp_tool_names)} tools, "
@@ -72,7 +90,7 @@ class TestMcpToolConsistency:
         """Verify tool names match between MCP server and FULL_TOOL_NAMES."""
         from agentic_cba_indicators.tools import FULL_TOOL_NAMES
 
-        mcp_tool_names = {t.__name__ for t in mcp_server._ALL_TOOLS}
+        mcp_tool_names = {t.__name__ for t in mcp_server._load_tools()}
         full_tool_names_set = set(FULL_TOOL_NAMES)
         missing_in_mcp = full_tool_names_set - mcp_tool_names
         extra_in_mcp = mcp_tool_names - full_tool_names_set
@@ -98,6 +116,46 @@ class TestMcpRegistration:
         finally:
             mcp_server.mcp = original_mcp
 
+    def test_register_tools_registers_every_tool(self) -> None:
+        """Verify every tool in _TOOL_SPECS is listed by the server."""
+        import asyncio
+
+        from mcp.server.fastmcp import FastMCP
+
+        test_mcp = FastMCP("Test Server")
+
+        original_mcp = mcp_server.mcp
+        mcp_server.mcp = test_mcp
+
+        try:
+            mcp_server._register_tools()
+        finally:
+            mcp_server.mcp = original_mcp
+
+        listed = {tool.name for tool in asyncio.run(test_mcp.list_tools())}
+        assert listed == {spec.split(":")[1] for spec in mcp_server._TOOL_SPECS}
+
+    def test_wrap_sync_runs_tool_in_worker_thread(self) -> None:
+        """Sync tools should run off the event loop thread with their signature."""
+        import asyncio
+        import inspect
+        import threading
+
+        def lookup(city: str, days: int = 7) -> str:
+            """Look up a city."""
+            return f"{city}:{days}:{threading.current_thread().name}"
+
+        wrapped = mcp_server._wrap_sync(lookup)
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "lookup"
+        assert wrapped.__doc__ == "Look up a city."
+        assert inspect.signature(wrapped) == inspect.signature(lookup)
+
+        result = asyncio.run(wrapped("Lima", days=3))
+        assert result.startswith("Lima:3:")
+        assert not result.endswith(threading.current_thread().name)
+
 
 class TestMcpServerEntryPoint:
     """Test MCP server entry point configuration."""
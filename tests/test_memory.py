@@ -12,6 +12,8 @@ from agentic_cba_indicators.memory import (
     DEFAULT_MAX_TOKENS,
     MIN_MESSAGES_TO_PRESERVE,
     TokenBudgetConversationManager,
+    _cached_heuristic,
+    _classify_message,
     _message_to_text,
     estimate_message_tokens,
     estimate_messages_tokens,
@@ -48,6 +50,16 @@ class TestEstimateTokensHeuristic:
         # 44 chars -> 11 tokens
         assert estimate_tokens_heuristic(text) == 11
 
+    def test_only_short_strings_are_cached(self) -> None:
+        _cached_heuristic.cache_clear()
+
+        assert estimate_tokens_heuristic("assistant") == 2
+        assert estimate_tokens_heuristic("assistant") == 2
+        assert estimate_tokens_heuristic("x" * 400) == 100
+
+        info = _cached_heuristic.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
+
 
 class TestMessageToText:
     """Tests for message-to-text conversion."""
@@ -103,6 +115,14 @@ class TestMessageToText:
         text = _message_to_text(msg)
         assert "Plain text content" in text
 
+    def test_tool_input_with_non_string_keys(self) -> None:
+        msg: dict[str, Any] = {
+            "role": "assistant",
+            "content": [{"toolUse": {"name": "lookup", "input": {1: "one"}}}],
+        }
+        text = _message_to_text(msg)
+        assert "one" in text
+
 
 class TestEstimateMessageTokens:
     """Tests for message token estimation."""
@@ -121,6 +141,32 @@ class TestEstimateMessageTokens:
         # "user test" = 9 chars
         assert tokens == 9
 
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            {"role": "user", "content": [{"text": "Hello world, how are you?"}]},
+            {"role": "", "content": []},
+            {"role": "assistant", "content": "plain string content here"},
+            {
+                "role": "assistant",
+                "content": [
+                    {"text": "Calling"},
+                    {"toolUse": {"name": "weather", "input": {"city": "Tokyo"}}},
+                ],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"toolResult": {"content": [{"text": "X" * 37}, "tail"]}},
+                ],
+            },
+        ],
+    )
+    def test_default_estimator_matches_joined_text(self, msg: dict[str, Any]) -> None:
+        """The length-only fast path should agree with estimating the text."""
+        expected = estimate_tokens_heuristic(_message_to_text(msg))
+        assert estimate_message_tokens(msg) == expected
+
 
 class TestEstimateMessagesTokens:
     """Tests for batch message token estimation."""
@@ -275,6 +321,35 @@ class TestTokenBudgetApplyManagement:
 
         assert len(agent.messages) == 2
 
+    def test_trim_keeps_newest_messages_that_fit_exactly(self) -> None:
+        manager = TokenBudgetConversationManager()
+        # "user " + 95 chars = 100 chars -> 25 tokens per message
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": str(i) * 95}]} for i in range(5)
+        ]
+
+        manager._trim_to_budget(messages, target_tokens=75)
+
+        assert [m["content"][0]["text"][0] for m in messages] == ["2", "3", "4"]
+
+    def test_unchanged_history_skips_estimation(self) -> None:
+        manager = TokenBudgetConversationManager(max_tokens=10000)
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": "Hello"}]},
+        ]
+        agent = self._make_agent(messages)
+
+        with patch.object(
+            manager, "_estimate_total_tokens", wraps=manager._estimate_total_tokens
+        ) as estimate:
+            manager.apply_management(agent)
+            manager.apply_management(agent)
+            assert estimate.call_count == 1
+
+            messages.append({"role": "assistant", "content": [{"text": "Hi!"}]})
+            manager.apply_management(agent)
+            assert estimate.call_count == 2
+
     def test_over_budget_trims_oldest(self) -> None:
         # Very small budget to force trimming
         manager = TokenBudgetConversationManager(max_tokens=30)
@@ -416,6 +491,78 @@ class TestTokenBudgetReduceContext:
         tool_result_content = agent.messages[2]["content"][0]["toolResult"]["content"]
         assert "truncated" in tool_result_content[0]["text"].lower()
 
+    def test_truncation_stops_once_under_budget(self) -> None:
+        # Each result is ~500 tokens; truncating the oldest one is enough
+        manager = TokenBudgetConversationManager(max_tokens=800)
+
+        def _result(text: str) -> dict[str, Any]:
+            return {
+                "role": "user",
+                "content": [
+                    {
+                        "toolResult": {
+                            "toolUseId": "1",
+                            "content": [{"text": text}],
+                            "status": "success",
+                        }
+                    }
+                ],
+            }
+
+        messages = [_result("X" * 2000), _result("Y" * 2000)]
+
+        assert manager._try_truncate_tool_results(messages) is True
+
+        oldest = messages[0]["content"][0]["toolResult"]["content"][0]["text"]
+        newest = messages[1]["content"][0]["toolResult"]["content"][0]["text"]
+        assert "truncated" in oldest
+        assert newest == "Y" * 2000
+
+    @staticmethod
+    def _tool_result(text: str) -> dict[str, Any]:
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "toolResult": {
+                        "toolUseId": "1",
+                        "content": [{"text": text}],
+                        "status": "success",
+                    }
+                }
+            ],
+        }
+
+    def test_truncates_on_overflow_even_when_estimate_fits(self) -> None:
+        # ~5000 estimated tokens fits 8000, but the model still overflowed
+        manager = TokenBudgetConversationManager(max_tokens=8000)
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": "question"}]},
+            self._tool_result("X" * 20000),
+            {"role": "assistant", "content": [{"text": "answer"}]},
+            {"role": "user", "content": [{"text": "follow-up"}]},
+        ]
+
+        manager.reduce_context(self._make_agent(messages))
+
+        text = messages[1]["content"][0]["toolResult"]["content"][0]["text"]
+        assert "truncated" in text
+        assert len(messages) == 4
+
+    def test_truncation_skips_preserved_tail(self) -> None:
+        manager = TokenBudgetConversationManager(max_tokens=100)
+        messages = [
+            self._tool_result("X" * 2000),
+            self._tool_result("Y" * 2000),
+            self._tool_result("Z" * 2000),
+        ]
+
+        assert manager._try_truncate_tool_results(messages) is True
+
+        texts = [m["content"][0]["toolResult"]["content"][0]["text"] for m in messages]
+        assert "truncated" in texts[0]
+        assert texts[1:] == ["Y" * 2000, "Z" * 2000]
+
     def test_raises_when_cannot_reduce_further(self) -> None:
         manager = TokenBudgetConversationManager(max_tokens=1)
         messages: list[dict[str, Any]] = [
@@ -573,3 +720,83 @@ class TestRemovedMessageTracking:
 
         expected_removed = original_count - remaining_count
         assert manager.removed_message_count == expected_removed
+
+
+class TestTokenEstimateCache:
+    """Tests for per-message token estimate caching."""
+
+    def _make_agent(self, messages: list[dict[str, Any]]) -> MagicMock:
+        agent = MagicMock()
+        agent.messages = messages
+        return agent
+
+    def test_each_message_estimated_once(self) -> None:
+        estimator = MagicMock(side_effect=lambda text: len(text) // 4)
+        manager = TokenBudgetConversationManager(
+            max_tokens=10000, token_estimator=estimator
+        )
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": "Hello"}]},
+            {"role": "assistant", "content": [{"text": "Hi!"}]},
+        ]
+        agent = self._make_agent(messages)
+
+        manager.apply_management(agent)
+        manager.apply_management(agent)
+
+        assert estimator.call_count == 2
+
+    def test_trim_evicts_removed_messages(self) -> None:
+        manager = TokenBudgetConversationManager(max_tokens=50)
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": "A" * 100}]},
+            {"role": "assistant", "content": [{"text": "B" * 100}]},
+            {"role": "user", "content": [{"text": "C" * 100}]},
+            {"role": "assistant", "content": [{"text": "D" * 100}]},
+        ]
+        agent = self._make_agent(messages)
+
+        manager.apply_management(agent)
+
+        assert set(manager._token_cache) <= {id(m) for m in agent.messages}
+
+    def test_truncation_invalidates_estimate(self) -> None:
+        manager = TokenBudgetConversationManager(max_tokens=100)
+        tool_result_msg: dict[str, Any] = {
+            "role": "user",
+            "content": [
+                {
+                    "toolResult": {
+                        "toolUseId": "1",
+                        "content": [{"text": "X" * 2000}],
+                        "status": "success",
+                    }
+                }
+            ],
+        }
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"text": "Query"}]},
+            tool_result_msg,
+        ]
+        before = manager._estimate_total_tokens(messages)
+
+        manager.reduce_context(self._make_agent(messages))
+
+        assert manager._estimate_total_tokens(messages) < before
+
+
+class TestClassifyMessage:
+    """Tests for tool boundary classification."""
+
+    def test_plain_text_has_no_flags(self) -> None:
+        assert _classify_message({"role": "user", "content": [{"text": "Hi"}]}) == 0
+        assert _classify_message({"role": "user", "content": "Hi"}) == 0
+
+    def test_tool_use_and_result_flags(self) -> None:
+        use = {"role": "assistant", "content": [{"toolUse": {"name": "t"}}]}
+        result = {"role": "user", "content": [{"toolResult": {"content": []}}]}
+        both = {"role": "user", "content": use["content"] + result["content"]}
+
+        assert _classify_message(use) == 1
+        assert _classify_message(result) == 2
+        assert _classify_message(both) == 3
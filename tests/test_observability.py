@@ -5,6 +5,7 @@ Validates metrics collection, instrumentation, and thread safety.
 
 from __future__ import annotations
 
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 
@@ -53,6 +54,21 @@ class TestToolMetrics:
         # p95 should be around 0.95s = 950ms
         assert 940 < metrics.p95_latency_ms < 960
 
+    def test_compute_percentiles_matches_properties(self) -> None:
+        """compute_percentiles should agree with the individual properties."""
+        metrics = ToolMetrics(latencies=[0.4, 0.1, 0.3, 0.2])
+
+        pct = metrics.compute_percentiles()
+
+        assert pct[50] * 1000 == pytest.approx(metrics.p50_latency_ms)
+        assert pct[95] * 1000 == pytest.approx(metrics.p95_latency_ms)
+        assert pct[99] * 1000 == pytest.approx(metrics.p99_latency_ms)
+        assert pct[50] == pytest.approx(0.25)
+
+    def test_compute_percentiles_empty(self) -> None:
+        """Percentiles of no samples are reported as zero."""
+        assert ToolMetrics().compute_percentiles((50, 95)) == {50: 0.0, 95: 0.0}
+
     def test_success_rate(self) -> None:
         """Success rate should be calculated correctly."""
         metrics = ToolMetrics(call_count=10, success_count=8, failure_count=2)
@@ -79,6 +95,15 @@ class TestMetricsCollector:
         assert len(metrics.latencies) == 1
         assert metrics.latencies[0] == 0.1
 
+    def test_record_call_ns(self) -> None:
+        """Integer nanosecond latencies are reported in seconds."""
+        collector = MetricsCollector()
+        collector.record_call_ns("test_tool", 250_000_000, success=True)
+
+        metrics = collector.get_tool_metrics("test_tool")
+        assert metrics.call_count == 1
+        assert metrics.latencies == [0.25]
+
     def test_record_failed_call(self) -> None:
         """Record a failed call."""
         collector = MetricsCollector()
@@ -166,6 +191,48 @@ class TestMetricsCollector:
         metrics = collector.get_tool_metrics("test_tool")
         assert len(metrics.latencies) <= MetricsCollector.MAX_LATENCY_SAMPLES
 
+    def test_latency_samples_keep_newest_in_order(self) -> None:
+        """Once the buffer is full, the oldest samples are overwritten."""
+        collector = MetricsCollector(num_shards=1)
+        collector.MAX_LATENCY_SAMPLES = 3
+
+        for latency in (0.1, 0.2, 0.3, 0.4, 0.5):
+            collector.record_call("test_tool", latency=latency, success=True)
+
+        metrics = collector.get_tool_metrics("test_tool")
+        assert metrics.call_count == 5
+        assert metrics.latencies == [0.3, 0.4, 0.5]
+
+    def test_single_thread_keeps_full_sample_budget(self) -> None:
+        """Sharding must not shrink the samples kept by a single thread."""
+        collector = MetricsCollector(num_shards=8)
+        collector.MAX_LATENCY_SAMPLES = 50
+
+        for calls in (30, 80):
+            collector.reset()
+            for _ in range(calls):
+                collector.record_call("test_tool", latency=0.001, success=True)
+            metrics = collector.get_tool_metrics("test_tool")
+            assert len(metrics.latencies) == min(calls, 50)
+
+    def test_shards_merge_in_call_order(self) -> None:
+        """Samples from different threads come back oldest-first, trimmed."""
+        collector = MetricsCollector(num_shards=4)
+        collector.MAX_LATENCY_SAMPLES = 6
+        latencies = [i / 1000 for i in range(1, 9)]
+
+        for latency in latencies:
+            # A fresh thread per call spreads the calls over the shards
+            thread = threading.Thread(
+                target=collector.record_call, args=("test_tool", latency)
+            )
+            thread.start()
+            thread.join()
+
+        metrics = collector.get_tool_metrics("test_tool")
+        assert metrics.call_count == 8
+        assert metrics.latencies == pytest.approx(latencies[-6:])
+
 
 class TestMetricsCollectorThreadSafety:
     """Test thread safety of MetricsCollector."""
@@ -197,6 +264,40 @@ class TestMetricsCollectorThreadSafety:
             assert metrics.call_count > 0
             assert metrics.call_count == metrics.success_count + metrics.failure_count
 
+    def test_sharded_writes_merge_on_read(self) -> None:
+        """Shards written by different threads are merged within the sample limit."""
+        collector = MetricsCollector(num_shards=4)
+        collector.MAX_LATENCY_SAMPLES = 40
+
+        def record_calls(_thread_id: int) -> None:
+            for _ in range(50):
+                collector.record_call("tool", latency=0.001, success=True)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record_calls, range(8)))
+
+        metrics = collector.get_tool_metrics("tool")
+        assert metrics.call_count == metrics.success_count == 400
+        assert len(metrics.latencies) == 40
+
+    def test_samples_stay_bounded_per_tool_across_shards(self) -> None:
+        """Storage per tool stays at the sample limit, however many shards."""
+        collector = MetricsCollector(num_shards=8)
+        collector.MAX_LATENCY_SAMPLES = 100
+
+        def record_calls(_thread_id: int) -> None:
+            for _ in range(100):
+                collector.record_call("tool", latency=0.001, success=True)
+
+        # Fresh threads get new native ids, filling every shard over time
+        for batch in range(4):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(record_calls, range(batch * 8, batch * 8 + 8)))
+
+        ring = collector._metrics["tool"][0]._ring
+        assert len(ring._samples) <= 100
+        assert len(collector.get_tool_metrics("tool").latencies) == 100
+
 
 class TestInstrumentToolDecorator:
     """Test instrument_tool decorator."""
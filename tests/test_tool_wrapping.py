@@ -16,6 +16,22 @@ def test_tools_are_wrapped() -> None:
         assert getattr(tool, "__agentic_tool_wrapped__", False) is True
 
 
+def test_toolsets_are_wrapped_once() -> None:
+    from agentic_cba_indicators import tools
+
+    assert tools.FULL_TOOLS is tools.FULL_TOOLS
+    assert len(tools.FULL_TOOLS) == len(tools.FULL_TOOL_NAMES)
+    with pytest.raises(AttributeError):
+        _ = tools.NO_SUCH_TOOLS
+
+
+def test_toolsets_share_wrapped_tools() -> None:
+    from agentic_cba_indicators import tools
+
+    full_ids = {id(tool) for tool in tools.FULL_TOOLS}
+    assert all(id(tool) in full_ids for tool in tools.REDUCED_TOOLS)
+
+
 def test_wrapped_tool_records_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
     from agentic_cba_indicators import tools
 
@@ -43,6 +59,7 @@ def test_wrapped_tool_logs_audit(monkeypatch: pytest.MonkeyPatch) -> None:
         calls.append(kwargs)
 
     monkeypatch.setattr(tools, "log_tool_invocation", fake_log_tool_invocation)
+    monkeypatch.setattr(tools, "is_audit_enabled", lambda: True)
 
     def sample_tool(x: int, *, tool_context: str | None = None) -> str:
         return f"ok:{x}"
@@ -66,6 +83,7 @@ def test_wrapped_tool_logs_failure(monkeypatch: pytest.MonkeyPatch) -> None:
         calls.append(kwargs)
 
     monkeypatch.setattr(tools, "log_tool_invocation", fake_log_tool_invocation)
+    monkeypatch.setattr(tools, "is_audit_enabled", lambda: True)
 
     def failing_tool() -> str:
         raise ValueError("bad")
@@ -77,3 +95,78 @@ def test_wrapped_tool_logs_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(calls) == 1
     assert calls[0]["success"] is False
     assert "validation" in (calls[0]["error"] or "")
+
+
+def test_wrapped_tool_resolves_signature_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import inspect
+
+    from agentic_cba_indicators import tools
+
+    monkeypatch.setattr(tools, "log_tool_invocation", lambda **kwargs: None)
+    monkeypatch.setattr(tools, "is_audit_enabled", lambda: True)
+    calls: list[Any] = []
+    real_signature = inspect.signature
+
+    def counting_signature(func: Any) -> inspect.Signature:
+        calls.append(func)
+        return real_signature(func)
+
+    def sample_tool(x: int) -> str:
+        return str(x)
+
+    wrapped = tools._wrap_tool(sample_tool)
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+    for i in range(3):
+        wrapped(i)
+
+    assert calls == []
+
+
+def test_wrapped_tool_skips_audit_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from agentic_cba_indicators import tools
+
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(tools, "log_tool_invocation", lambda **kw: calls.append(kw))
+    monkeypatch.setattr(tools, "is_audit_enabled", lambda: False)
+
+    def sample_tool(x: int) -> str:
+        return str(x)
+
+    wrapped = tools._wrap_tool(sample_tool)
+    assert wrapped(3) == "3"
+    assert calls == []
+
+
+def test_importing_tools_does_not_import_tool_modules() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import agentic_cba_indicators.tools as t; "
+        "print('agentic_cba_indicators.tools.knowledge_base' in sys.modules); "
+        "t.get_current_weather; "
+        "print('agentic_cba_indicators.tools.weather' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_importing_cli_does_not_import_tool_modules() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import agentic_cba_indicators.cli; "
+        "print(any(m.startswith('agentic_cba_indicators.tools.') "
+        "and not m.rpartition('.')[2].startswith('_') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False"]